@@ -9,15 +9,14 @@ import json
 import uuid
 import time
 import threading
-import asyncio
 import glob as globmod
 from datetime import datetime, timedelta
 
 from flask import Flask, render_template, request, jsonify, Response, send_file
 
 from retailers import get_scraper_registry
-from main import run_all_scrapers
 from exporter import export_combined_csv
+from scrape_runtime import ScrapeRuntime
 
 app = Flask(__name__)
 
@@ -26,10 +25,25 @@ app = Flask(__name__)
 TEMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
 os.makedirs(TEMP_DIR, exist_ok=True)
 
+# Per-retailer state that outlives individual jobs (e.g. learned concurrency)
+STATE_DIR = os.path.join(TEMP_DIR, "state")
+
 jobs = {}
 jobs_lock = threading.Lock()
 
 JOB_EXPIRY_HOURS = 2
+# Controls only a running job reads; not saved with its meta
+RUNTIME_ONLY_KEYS = ("skip_retailers",)
+MAX_PARALLEL_RETAILERS = 8
+
+# ─── Scrape Runtime ──────────────────────────────────────────────────────────
+
+# One event loop + warm Chromium shared by every job in this process.
+# Under the Flask reloader only the child process (which serves requests)
+# starts it; gunicorn workers start it on import.
+runtime = ScrapeRuntime(headless=True)
+if __name__ != "__main__" or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+    runtime.start()
 
 
 def _job_meta_path(job_id):
@@ -38,7 +52,7 @@ def _job_meta_path(job_id):
 
 def _save_job_meta(job_id, meta):
     path = _job_meta_path(job_id)
-    safe = {k: v for k, v in meta.items() if k != "created_at"}
+    safe = {k: v for k, v in meta.items() if k != "created_at" and k not in RUNTIME_ONLY_KEYS}
     safe["created_at"] = meta.get("created_at", datetime.now()).isoformat()
     with open(path, "w") as f:
         json.dump(safe, f)
@@ -96,6 +110,12 @@ def index():
     return render_template("index.html")
 
 
+@app.route("/api/health")
+def health():
+    status = runtime.health()
+    return jsonify(status), (200 if status["ok"] else 503)
+
+
 @app.route("/api/retailers")
 def get_retailers():
     return jsonify({"retailers": sorted(get_scraper_registry().keys())})
@@ -109,14 +129,30 @@ def start_product_scrape():
     if not data:
         return jsonify({"error": "No data provided"}), 400
 
-    keyword = data.get("keyword", "").strip()
+    # "keywords" list, or a comma-separated "keyword" string
+    keywords = data.get("keywords")
+    if keywords is None:
+        keyword = data.get("keyword") or ""
+        if not isinstance(keyword, str):
+            return jsonify({"error": "keyword must be a string"}), 400
+        keywords = keyword.split(",")
+    if not isinstance(keywords, list):
+        return jsonify({"error": "keywords must be a list"}), 400
+    keywords = list(dict.fromkeys(str(k).strip() for k in keywords if str(k).strip()))
     retailers = data.get("retailers", [])
 
-    if not keyword:
+    if not keywords:
         return jsonify({"error": "Keyword is required"}), 400
     if not retailers:
         return jsonify({"error": "Select at least one retailer"}), 400
 
+    try:
+        max_parallel = int(data.get("max_parallel_retailers", 1))
+    except (TypeError, ValueError):
+        return jsonify({"error": "max_parallel_retailers must be an integer"}), 400
+    max_parallel = max(1, min(max_parallel, MAX_PARALLEL_RETAILERS))
+    fast = bool(data.get("fast", False))
+
     job_id = str(uuid.uuid4())[:8]
     job = {
         "id": job_id,
@@ -129,7 +165,7 @@ def start_product_scrape():
         "error": None,
         "created_at": datetime.now(),
         # Skip / Stop controls
-        "skip_retailer": False,   # set True to skip current retailer
+        "skip_retailers": set(),  # names of running retailers to skip
         "stop_requested": False,  # set True to stop entire scrape
         "stopped_early": False,   # set after stop completes
     }
@@ -139,7 +175,7 @@ def start_product_scrape():
 
     thread = threading.Thread(
         target=_run_product_scrape_job,
-        args=(job_id, keyword, retailers),
+        args=(job_id, keywords, retailers, max_parallel, fast),
         daemon=True,
     )
     thread.start()
@@ -147,7 +183,7 @@ def start_product_scrape():
     return jsonify({"job_id": job_id})
 
 
-def _run_product_scrape_job(job_id, keyword, retailers):
+def _run_product_scrape_job(job_id, keywords, retailers, max_parallel=1, fast=False):
     def progress_callback(message, percent=None):
         with jobs_lock:
             if job_id in jobs:
@@ -160,38 +196,37 @@ def _run_product_scrape_job(job_id, keyword, retailers):
             job = jobs.get(job_id)
             return job.get("stop_requested", False) if job else False
 
-    def should_skip():
-        """Check & consume the skip flag (returns True once, then resets)."""
+    def should_skip(name):
+        """Check & consume a skip request for ``name`` (True once, then resets)."""
         with jobs_lock:
             job = jobs.get(job_id)
-            if not job:
+            if not job or name not in job["skip_retailers"]:
                 return False
-            if job.get("skip_retailer"):
-                job["skip_retailer"] = False  # consume the flag
-                return True
-            return False
+            job["skip_retailers"].discard(name)  # consume the request
+            return True
 
     try:
         output_dir = os.path.join(TEMP_DIR, job_id)
         os.makedirs(output_dir, exist_ok=True)
 
-        products = asyncio.run(
-            run_all_scrapers(
-                retailers=retailers,
-                headless=True,
-                resume=False,
-                output_dir=output_dir,
-                keyword=keyword,
-                progress_callback=progress_callback,
-                should_stop=should_stop,
-                should_skip=should_skip,
-            )
-        )
+        products = runtime.run_scrape(
+            retailers=retailers,
+            headless=True,
+            resume=False,
+            output_dir=output_dir,
+            keywords=keywords,
+            progress_callback=progress_callback,
+            should_stop=should_stop,
+            should_skip=should_skip,
+            max_parallel_retailers=max_parallel,
+            state_dir=STATE_DIR,
+            fast=fast,
+        ).result()
 
         was_stopped = should_stop()
 
         if products:
-            csv_filename = f"{keyword.replace(' ', '_')}_products.csv"
+            csv_filename = f"{'_'.join(k.replace(' ', '_') for k in keywords)}_products.csv"
             csv_path = os.path.join(TEMP_DIR, f"{job_id}_{csv_filename}")
             export_combined_csv(products, csv_path)
 
@@ -288,12 +323,16 @@ def stream_progress(job_id):
 
 @app.route("/api/skip/<job_id>", methods=["POST"])
 def skip_retailer(job_id):
-    """Signal the scraper to skip the current retailer."""
+    """Signal the scraper to skip one running retailer, named in the body."""
+    data = request.get_json(silent=True) or {}
+    retailer = data.get("retailer") if isinstance(data, dict) else None
+    if not isinstance(retailer, str) or not retailer:
+        return jsonify({"error": "Name the retailer to skip"}), 400
     with jobs_lock:
         job = jobs.get(job_id)
         if not job or job.get("status") != "running":
             return jsonify({"error": "Job not active"}), 404
-        job["skip_retailer"] = True
+        job["skip_retailers"].add(retailer)
     return jsonify({"ok": True})
 
 
@@ -0,0 +1,5 @@
+from .base import CatalogBackend
+from .shopify import ShopifyBackend
+from .magento import MagentoBackend
+from .woocommerce import WooCommerceBackend
+from .odoo import OdooBackend
@@ -0,0 +1,52 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import List
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_engine import HttpEngine
+from models import StrollerProduct
+
+
+def keyword_words(keyword: str) -> List[str]:
+    """Lowercased words of a search, singular ("strollers" -> "stroller")."""
+    words = re.findall(r"[a-z0-9]+", keyword.lower())
+    return [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w for w in words]
+
+
+def matches_keyword(keyword: str, *texts: str) -> bool:
+    """Whether every word of ``keyword`` appears as a whole word in ``texts``.
+
+    A word matches itself or its plural, so "car" finds "car seats" but
+    not "card" or "scarf".
+    """
+    haystack = " ".join(re.findall(r"[a-z0-9]+", " ".join(t for t in texts if t).lower()))
+    return all(re.search(rf"\b{re.escape(word)}(?:s|es)?\b", haystack)
+               for word in keyword_words(keyword))
+
+
+class CatalogBackend(ABC):
+    """A platform's public product API, queried instead of rendering pages.
+
+    A retailer names one in BACKEND (with BACKEND_OPTIONS as extra keyword
+    arguments); the scraper calls ``search`` once per keyword with the page
+    it would otherwise have listed, and falls back to the browser if it
+    raises or finds nothing. Products come back with ``link`` and whatever
+    the API has filled in; only those missing one of the scraper's
+    REQUIRED_FIELDS get a detail page. Fields in ``unavailable`` (the API
+    never has them) are left out of that check for backend products.
+    """
+    NAME: str = ""
+    UNAVAILABLE: tuple = ()
+
+    def __init__(self, http: HttpEngine, base_url: str):
+        self.http = http
+        self.base_url = base_url.rstrip("/")
+        self.unavailable = self.UNAVAILABLE
+        self.logger = logging.getLogger(f"backend.{self.NAME}")
+
+    @abstractmethod
+    async def search(self, keyword: str, listing_url: str) -> List[StrollerProduct]:
+        ...
@@ -0,0 +1,151 @@
+import asyncio
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends.base import CatalogBackend
+from http_engine import HttpEngine, html_text
+from models import StrollerProduct
+
+# Only fields every Magento 2.3+ schema has — an unknown field fails the whole query
+_QUERY = """
+query ($search: String, $filter: ProductAttributeFilterInput, $pageSize: Int!, $currentPage: Int!) {
+  products(search: $search, filter: $filter, pageSize: $pageSize, currentPage: $currentPage) {
+    page_info { total_pages }
+    items {
+      name
+      sku
+      url_key
+      url_suffix
+      canonical_url
+      %(brand)s
+      description { html }
+      short_description { html }
+      image { url }
+      price_range { minimum_price { final_price { value currency } } }
+      ... on PhysicalProductInterface { weight }
+    }
+  }
+}
+"""
+
+_CATEGORY_QUERY = """
+query ($path: String!) {
+  categoryList(filters: {url_path: {eq: $path}}) { uid }
+}
+"""
+
+
+class MagentoBackend(CatalogBackend):
+    """Magento / Adobe Commerce GraphQL: ``products(search:, pageSize:, currentPage:)``.
+
+    A category listing (the default run) is read through its
+    ``category_uid``, looked up by URL path; a search page, or a category
+    the lookup can't find, is searched by keyword. Page 1 gives the page
+    count; the rest are requested at once and paced by the engine's
+    per-host limits. Options: ``endpoint`` (default
+    <origin>/graphql), ``store`` (sent as the Store header), ``url_prefix``
+    product URLs hang off (default the base URL), ``brand_field`` (a
+    store-specific text attribute holding the brand) and ``weight_unit``.
+    """
+    NAME = "Magento GraphQL"
+    # No brand attribute is common to every store, so without brand_field a
+    # product isn't sent to its detail page just for the brand. The trade-off:
+    # complete products then ship without the page's brand (the exporter
+    # infers it from the name where KNOWN_BRANDS matches) and specs.
+    UNAVAILABLE = ("brand",)
+    PAGE_SIZE = 100
+    MAX_PAGES = 20
+
+    def __init__(self, http: HttpEngine, base_url: str, endpoint: str = "", store: str = "",
+                 url_prefix: str = "", brand_field: str = "", weight_unit: str = "kg"):
+        super().__init__(http, base_url)
+        origin = urlparse(self.base_url)
+        self.endpoint = endpoint or f"{origin.scheme}://{origin.netloc}/graphql"
+        self.headers = {"Store": store} if store else {}
+        self.url_prefix = (url_prefix or self.base_url).rstrip("/")
+        self.brand_field = brand_field
+        if brand_field:
+            self.unavailable = ()
+        self.weight_unit = weight_unit
+        self.query = _QUERY % {"brand": brand_field}
+
+    async def search(self, keyword: str, listing_url: str) -> List[StrollerProduct]:
+        uid = await self._category_uid(listing_url)
+        where = {"filter": {"category_uid": {"eq": uid}}} if uid else {"search": keyword}
+        first = await self._page(where, 1)
+        total = min(self.MAX_PAGES, first["page_info"]["total_pages"] or 1)
+        rest = await asyncio.gather(*(self._page(where, n) for n in range(2, total + 1)))
+        items = [item for page in [first, *rest] for item in page["items"] or []]
+        return [p for p in (self._product(item) for item in items if item) if p]
+
+    async def _category_uid(self, listing_url: str) -> Optional[str]:
+        """The uid of the category ``listing_url`` shows, or None for a search page."""
+        url = urlparse(listing_url)
+        prefix = urlparse(self.url_prefix).path.rstrip("/")
+        if url.query or "catalogsearch" in url.path or not url.path.startswith(f"{prefix}/"):
+            return None
+        path = url.path[len(prefix) + 1:].strip("/")
+        path = path[:-5] if path.endswith(".html") else path
+        if not path:
+            return None
+        try:
+            data = await self._post({"query": _CATEGORY_QUERY, "variables": {"path": path}})
+        except Exception:
+            return None  # categoryList.uid needs Magento 2.4.2+
+        categories = (data.get("data") or {}).get("categoryList") or []
+        return categories[0].get("uid") if categories and categories[0] else None
+
+    async def _page(self, where: dict, number: int) -> dict:
+        payload = {
+            "query": self.query,
+            "variables": {**where, "pageSize": self.PAGE_SIZE, "currentPage": number},
+        }
+        data = await self._post(payload)
+        products = (data.get("data") or {}).get("products")
+        if products is None:
+            raise RuntimeError(f"GraphQL errors: {data.get('errors')}")
+        return products
+
+    async def _post(self, payload: dict) -> dict:
+        return await self.http.post_json(self.endpoint, payload, headers=self.headers)
+
+    def _url(self, item: dict) -> str:
+        path = item.get("canonical_url") or ""
+        if not path and item.get("url_key"):
+            path = f"{item['url_key']}{item.get('url_suffix') or ''}"
+        if path.startswith("http"):
+            return path
+        return f"{self.url_prefix}/{path.lstrip('/')}" if path else ""
+
+    def _product(self, item: dict) -> Optional[StrollerProduct]:
+        link = self._url(item)
+        if not link or not item.get("name"):
+            return None
+        product = StrollerProduct(product=item["name"].strip(), link=link)
+
+        brand = item.get(self.brand_field) if self.brand_field else None
+        if isinstance(brand, str):  # select attributes come back as option ids
+            product.brand = brand.strip()
+
+        price = ((item.get("price_range") or {}).get("minimum_price") or {}).get("final_price") or {}
+        if price.get("value"):
+            product.price = f"{price.get('currency') or 'AED'} {price['value']}"
+
+        image = (item.get("image") or {}).get("url") or ""
+        if image and "placeholder" not in image:
+            product.image_url = image
+
+        for field in ("description", "short_description"):
+            text, items = html_text((item.get(field) or {}).get("html") or "")
+            if text:
+                product.description = text
+                if items:
+                    product.features = " ; ".join(items[:15])
+                break
+
+        if isinstance(item.get("weight"), (int, float)) and item["weight"] > 0:
+            product.weight = f"{item['weight']:g} {self.weight_unit}"
+        return product
@@ -0,0 +1,111 @@
+import re
+from typing import List, Optional
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends.base import CatalogBackend, keyword_words
+from config import TRAVEL_KEYWORDS
+from http_engine import HttpEngine, html_text
+from listing_harvester import parse_price
+from models import StrollerProduct
+
+# website (Odoo 15+) and website_sale (Odoo 13/14) product search routes
+AUTOCOMPLETE_ROUTES = ("/website/snippet/autocomplete", "/shop/products/autocomplete")
+
+
+class OdooBackend(CatalogBackend):
+    """Odoo's website product search, called over JSON-RPC.
+
+    One call returns up to LIMIT products with name, URL, image, price and
+    sale description. A /shop/category/<slug>-<id> listing is read through
+    the search's category option first; otherwise, or if that finds
+    nothing, the keyword is searched. Descriptions cut at MAX_CHARS are
+    dropped so the detail page supplies the whole text.
+    """
+    NAME = "Odoo JSON-RPC"
+    LIMIT = 1000
+    MAX_CHARS = 1000
+
+    def __init__(self, http: HttpEngine, base_url: str):
+        super().__init__(http, base_url)
+        self.route: Optional[str] = None  # whichever autocomplete route answered
+        self.calls = 0
+
+    async def search(self, keyword: str, listing_url: str) -> List[StrollerProduct]:
+        attempts = []
+        category = re.search(r"/shop/category/[^/?#]*-(\d+)", listing_url)
+        if category:
+            attempts.append(("", category.group(1)))
+        attempts.append((" ".join(keyword_words(keyword)), None))
+
+        for term, category_id in attempts:
+            results = await self._autocomplete(term, category_id)
+            products = [p for p in map(self._product, results) if p]
+            if products:
+                return products
+        return []
+
+    async def _autocomplete(self, term: str, category_id: Optional[str]) -> List[dict]:
+        error = None
+        for route in ([self.route] if self.route else AUTOCOMPLETE_ROUTES):
+            try:
+                result = await self._call(route, self._params(route, term, category_id))
+            except Exception as e:
+                error = e  # route missing on this Odoo version
+                continue
+            self.route = route
+            return result.get("results") or result.get("products") or []
+        raise RuntimeError(f"no product search route answered ({error!r})")
+
+    def _params(self, route: str, term: str, category_id: Optional[str]) -> dict:
+        if route == "/website/snippet/autocomplete":
+            options = {"displayImage": True, "displayDescription": True, "displayDetail": True,
+                       "displayExtraLink": True, "allowFuzzy": True}
+            if category_id:
+                options["category"] = category_id
+            return {"search_type": "products", "term": term, "order": "name asc",
+                    "limit": self.LIMIT, "max_nb_chars": self.MAX_CHARS, "options": options}
+        options = {"display_image": True, "display_description": True, "display_price": True,
+                   "max_nb_chars": self.MAX_CHARS}
+        if category_id:
+            options["category"] = category_id
+        return {"term": term, "limit": self.LIMIT, "options": options}
+
+    async def _call(self, route: str, params: dict) -> dict:
+        self.calls += 1
+        payload = {"jsonrpc": "2.0", "method": "call", "params": params, "id": self.calls}
+        data = await self.http.post_json(f"{self.base_url}{route}", payload)
+        if data.get("error"):
+            error = data["error"]
+            raise RuntimeError((error.get("data") or {}).get("message") or error.get("message"))
+        return data.get("result") or {}
+
+    def _product(self, item: dict) -> Optional[StrollerProduct]:
+        url = item.get("website_url") or ""
+        if not url or not item.get("name"):
+            return None
+        link = url.split("?")[0]
+        product = StrollerProduct(
+            product=item["name"].strip(),
+            link=link if link.startswith("http") else f"{self.base_url}{link}",
+        )
+
+        price, _ = html_text(str(item.get("detail") or item.get("list_price") or ""))
+        product.price = parse_price(price)
+
+        image = item.get("image_url") or ""
+        if not image and item.get("id"):
+            image = f"/web/image/product.template/{item['id']}/image_1024"
+        if image:
+            image = re.sub(r"image_\d+$", "image_1024", image.split("?")[0])
+            product.image_url = image if image.startswith("http") else f"{self.base_url}{image}"
+
+        description, _ = html_text(str(item.get("description") or item.get("description_sale") or ""))
+        if description and len(description) < self.MAX_CHARS - 3:
+            product.description = description
+
+        categories, _ = html_text(str(item.get("extra_link") or ""))
+        if any(kw in categories.lower() for kw in TRAVEL_KEYWORDS):
+            product.travel_friendly = "Yes"
+        return product
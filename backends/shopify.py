@@ -0,0 +1,79 @@
+import re
+from typing import List
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends.base import CatalogBackend, matches_keyword
+from http_engine import html_text
+from listing_harvester import parse_price
+from models import StrollerProduct
+
+
+class ShopifyBackend(CatalogBackend):
+    """Shopify's storefront JSON: /products.json and /collections/<handle>/products.json.
+
+    Both page through up to 250 products a request with title, vendor,
+    variants, images, options and body HTML. A collection listing reads its
+    own products.json; a keyword search reads the whole catalogue and keeps
+    products whose title, type, tags, vendor or handle match, since
+    /search/suggest.json stops at 10 results.
+    """
+    NAME = "Shopify products.json"
+    PAGE_SIZE = 250
+    MAX_PAGES = 40
+
+    async def search(self, keyword: str, listing_url: str) -> List[StrollerProduct]:
+        collection = re.search(r"/collections/([^/?#]+)", listing_url)
+        if collection:
+            url = f"{self.base_url}/collections/{collection.group(1)}/products.json"
+            return [self._product(p) for p in await self._pages(url)]
+
+        found = []
+        for data in await self._pages(f"{self.base_url}/products.json"):
+            tags = data.get("tags") or []
+            if isinstance(tags, list):
+                tags = " ".join(tags)
+            if matches_keyword(keyword, data.get("title", ""), data.get("product_type", ""),
+                               tags, data.get("vendor", ""), data.get("handle", "")):
+                found.append(self._product(data))
+        return found
+
+    async def _pages(self, url: str) -> List[dict]:
+        products = []
+        for page in range(1, self.MAX_PAGES + 1):
+            data = await self.http.get_json(url, params={"limit": self.PAGE_SIZE, "page": page})
+            batch = data.get("products") or []
+            products.extend(p for p in batch if p.get("handle") and p.get("title"))
+            if len(batch) < self.PAGE_SIZE:
+                break
+        return products
+
+    def _product(self, data: dict) -> StrollerProduct:
+        product = StrollerProduct(
+            product=data["title"].strip(),
+            brand=(data.get("vendor") or "").strip(),
+            link=f"{self.base_url}/products/{data['handle']}",
+        )
+
+        variants = [v for v in data.get("variants") or [] if parse_price(v.get("price"))]
+        in_stock = [v for v in variants if v.get("available", True)] or variants
+        if in_stock:
+            cheapest = min(in_stock, key=lambda v: float(str(v["price"]).replace(",", "")))
+            product.price = parse_price(cheapest["price"])
+            if cheapest.get("grams"):
+                product.weight = f"{cheapest['grams'] / 1000:g} kg"
+
+        images = data.get("images") or []
+        if images and isinstance(images[0], dict):
+            product.image_url = images[0].get("src", "")
+
+        description, items = html_text(data.get("body_html") or "")
+        product.description = description
+        if items:
+            product.features = " ; ".join(items[:15])
+
+        for option in data.get("options") or []:
+            if isinstance(option, dict) and option.get("name", "").lower() in ("color", "colour"):
+                product.color = ", ".join(str(v) for v in option.get("values") or [])
+        return product
@@ -0,0 +1,94 @@
+import asyncio
+import html
+from typing import List, Optional, Tuple
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends.base import CatalogBackend
+from config import TRAVEL_KEYWORDS
+from http_engine import html_text
+from models import StrollerProduct
+
+# Product attribute (name or pa_ taxonomy) -> StrollerProduct field
+ATTRIBUTE_FIELDS = {
+    "brand": "brand", "brands": "brand",
+    "color": "color", "colour": "color",
+    "frame color": "frame_color", "frame colour": "frame_color",
+    "weight": "weight",
+    "age": "suitable_for", "suitable for": "suitable_for",
+}
+
+
+class WooCommerceBackend(CatalogBackend):
+    """WooCommerce's public Store API: /wp-json/wc/store/v1/products?search=.
+
+    Page 1's X-WP-TotalPages header gives the page count; the rest are
+    requested at once and paced by the engine's per-host limits. Products
+    come with their permalink, so no URL has to be guessed from a slug.
+    """
+    NAME = "WooCommerce Store API"
+    PAGE_SIZE = 100
+    MAX_PAGES = 20
+
+    async def search(self, keyword: str, listing_url: str) -> List[StrollerProduct]:
+        url = f"{self.base_url}/wp-json/wc/store/v1/products"
+        items, total = await self._page(url, keyword, 1)
+        rest = await asyncio.gather(*(self._page(url, keyword, n)
+                                      for n in range(2, min(total, self.MAX_PAGES) + 1)))
+        for more, _ in rest:
+            items.extend(more)
+        return [p for p in map(self._product, items) if p]
+
+    async def _page(self, url: str, keyword: str, number: int) -> Tuple[List[dict], int]:
+        response = await self.http.request(
+            "GET", url, headers={"Accept": "application/json"},
+            params={"search": keyword, "per_page": self.PAGE_SIZE, "page": number},
+        )
+        items = response.json()
+        if not isinstance(items, list):
+            raise RuntimeError(f"Unexpected Store API response: {str(items)[:200]}")
+        try:
+            total = int(response.headers.get("x-wp-totalpages", 1))
+        except ValueError:
+            total = 1
+        return items, total
+
+    def _product(self, data: dict) -> Optional[StrollerProduct]:
+        if not data.get("permalink") or not data.get("name"):
+            return None
+        product = StrollerProduct(product=html.unescape(data["name"]).strip(), link=data["permalink"])
+
+        prices = data.get("prices") or {}
+        if prices.get("price"):
+            minor = int(prices.get("currency_minor_unit", 2))
+            value = int(prices["price"]) / 10 ** minor
+            product.price = f"{prices.get('currency_code') or 'AED'} {value:.{minor}f}"
+
+        images = data.get("images") or []
+        if images:
+            product.image_url = images[0].get("src", "")
+
+        for field in ("description", "short_description"):
+            text, items = html_text(data.get(field) or "")
+            if text:
+                product.description = text
+                if items:
+                    product.features = " ; ".join(items[:15])
+                break
+
+        for brand in data.get("brands") or []:  # WooCommerce Brands, 9.6+
+            product.brand = html.unescape(brand.get("name", ""))
+            break
+        for attribute in data.get("attributes") or []:
+            name = (attribute.get("taxonomy") or attribute.get("name") or "").lower()
+            name = name[3:] if name.startswith("pa_") else name
+            field = ATTRIBUTE_FIELDS.get(name.replace("-", " ").replace("_", " "))
+            terms = [html.unescape(t.get("name", "")) for t in attribute.get("terms") or []]
+            if field and terms and not getattr(product, field):
+                setattr(product, field, ", ".join(t for t in terms if t))
+
+        categories = " ".join(c.get("name", "") for c in data.get("categories") or []).lower()
+        if any(kw in categories for kw in TRAVEL_KEYWORDS):
+            product.travel_friendly = "Yes"
+        return product
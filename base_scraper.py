@@ -1,16 +1,183 @@
 import asyncio
 import logging
-import json
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from playwright.async_api import async_playwright, Page, BrowserContext
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from playwright.async_api import Page, BrowserContext
 
-from models import StrollerProduct
-from anti_bot import get_random_user_agent, random_delay, setup_stealth
+from models import DATA_FIELDS, StrollerProduct
+from anti_bot import get_random_user_agent, setup_stealth
+from browser_pool import BrowserPool
+from concurrency import AdaptiveConcurrency, ConcurrencyStore
+from http_engine import HtmlDocument, HttpEngine, http_available
+from listing_harvester import ListingHarvester, fill_missing, parse_price
+from profiles import ProfileStore
 from progress import ProgressTracker
+from rate_limiter import HostRateLimiter, RateLimitedError, parse_retry_after
+from resource_blocker import ResourceBlocker
 from config import RETAILERS, DEFAULT_KEYWORD
 
 
+_READY_JS = """
+(spec) => {
+    const check = (cond) => {
+        if (cond === '@json-ld') {
+            const isProduct = (d) => d && (d['@type'] === 'Product' ||
+                (Array.isArray(d['@type']) && d['@type'].includes('Product')));
+            for (const s of document.querySelectorAll('script[type="application/ld+json"]')) {
+                try {
+                    const data = JSON.parse(s.textContent);
+                    const items = Array.isArray(data) ? data : (data['@graph'] || [data]);
+                    if (items.some(isProduct)) return true;
+                } catch {}
+            }
+            return false;
+        }
+        if (cond === '@next-data') {
+            const el = document.getElementById('__NEXT_DATA__');
+            if (!el) return false;
+            try { JSON.parse(el.textContent); return true; } catch { return false; }
+        }
+        if (typeof cond === 'object') {
+            try { return document.querySelectorAll(cond.selector).length > cond.more_than; }
+            catch { return false; }
+        }
+        try { return document.querySelector(cond) !== null; } catch { return false; }
+    };
+    return spec.some((all) => all.every(check));
+}
+"""
+
+_FIELDS_JS = """
+([within, spec]) => {
+    const read = (el, attr) => ((attr ? el.getAttribute(attr) : el.innerText) || '').trim();
+    const extract = (root) => {
+        const out = {};
+        for (const [name, f] of Object.entries(spec)) {
+            out[name] = f.many ? [] : '';
+            for (const sel of f.selectors) {
+                let els;
+                try {
+                    els = f.many ? Array.from(root.querySelectorAll(sel))
+                                 : [root.matches?.(sel) ? root : root.querySelector(sel)].filter(Boolean);
+                } catch { continue; }  // invalid selector — try the next one
+                const values = els.map((el) => read(el, f.attr)).filter(Boolean);
+                if (values.length) {
+                    out[name] = f.many ? values : values[0];
+                    break;
+                }
+            }
+        }
+        return out;
+    };
+    // One result for the page, or one per element matching ``within``
+    return within ? Array.from(document.querySelectorAll(within), extract) : extract(document);
+}
+"""
+
+
+_SPEC_PAIRS_JS = """
+([selector, pairs]) => {
+    let roots;
+    try {
+        roots = selector ? Array.from(document.querySelectorAll(selector)) : [document.documentElement];
+    } catch { return [{}, {}]; }
+    const under = (css) => {
+        const found = new Set();  // roots may nest — count each element once
+        for (const root of roots) {
+            if (root.matches(css)) found.add(root);
+            root.querySelectorAll(css).forEach((el) => found.add(el));
+        }
+        return Array.from(found);
+    };
+    const first = (el, css) => { try { return el.querySelector(css); } catch { return null; } };
+    const text = (el) => (el ? (el.innerText || '').trim() : '');
+    const specs = {};
+    const seen = {};
+    const add = (label, value) => {
+        const key = label.toLowerCase().trim().replace(/:+$/, '');
+        if (!key || !value) return;
+        (seen[key] = seen[key] || []).push(value);
+        specs[key] = value;
+    };
+
+    for (const row of under('tr')) {
+        const label = text(first(row, 'th, td:first-child, .label, dt'));
+        const value = text(first(row, 'td:last-child, .value, dd'));
+        if (label !== value) add(label, value);
+    }
+    for (const dt of under('dt')) {
+        const dd = dt.nextElementSibling;
+        if (dd && dd.tagName === 'DD') add(text(dt), text(dd));
+    }
+    if (pairs) {
+        const [item, labelCss, valueCss] = pairs;
+        for (const el of under(item)) {
+            const values = Array.from(el.querySelectorAll(valueCss)).map(text).filter(Boolean);
+            add(text(first(el, labelCss)), values[0] || '');
+        }
+    }
+
+    const duplicates = {};
+    for (const [key, values] of Object.entries(seen)) {
+        if (new Set(values).size > 1) duplicates[key] = values;
+    }
+    return [specs, duplicates];
+}
+"""
+
+
+_SCROLL_JS = """
+([selector, timeout, settle]) => new Promise((resolve) => {
+    const count = () => document.querySelectorAll(selector).length;
+    const before = count();
+    let quiet = null;
+    const observer = new MutationObserver(() => {
+        // New items arrive in bursts — wait for a short lull after growth
+        if (count() > before) {
+            clearTimeout(quiet);
+            quiet = setTimeout(done, settle);
+        }
+    });
+    const cap = setTimeout(() => done(), timeout);
+    function done() {
+        observer.disconnect();
+        clearTimeout(cap);
+        clearTimeout(quiet);
+        resolve([before, count()]);
+    }
+    observer.observe(document.body, {childList: true, subtree: true});
+    window.scrollTo(0, document.body.scrollHeight);
+})
+"""
+
+def _field_spec(fields: Dict[str, "Field"]) -> dict:
+    return {
+        name: {
+            "selectors": [f.selectors] if isinstance(f.selectors, str) else list(f.selectors),
+            "attr": f.attr,
+            "many": f.many,
+        }
+        for name, f in fields.items()
+    }
+
+
+@dataclass(frozen=True)
+class Field:
+    """A value to read from a product page in ``_extract_fields``.
+
+    ``selectors`` are tried in order until one yields a non-empty value; a
+    comma-separated selector within one entry matches in document order,
+    like ``_safe_text``. Reads trimmed text, or ``attr`` if given; ``many``
+    returns every non-empty match of the first selector that has any.
+    """
+    selectors: Union[str, Tuple[str, ...]]
+    attr: str = ""
+    many: bool = False
+
+
 class BaseStrollerScraper(ABC):
     RETAILER_NAME: str = ""
     BASE_URL: str = ""
@@ -19,18 +186,80 @@ class BaseStrollerScraper(ABC):
     RETRY_DELAY: float = 3.0
     PAGE_LOAD_TIMEOUT: int = 20000
     PER_PRODUCT_TIMEOUT: int = 45  # seconds — hard cap per product including retries
+    DETAIL_WORKERS: int = 3  # browser tabs scraping product pages in parallel (starting point)
+    MAX_DETAIL_WORKERS: int = 6  # ceiling for the adaptive controller
+    REQUESTS_PER_SECOND: float = 1.0  # politeness limit for this retailer's host
+    REQUEST_BURST: int = 3
+    PERSISTENT_PROFILE: bool = True  # reuse an on-disk profile when the run enables them
+    BLOCK_RESOURCES: bool = True  # abort images, media, fonts and tracker hosts
+    ALLOW_RESOURCE_TYPES: tuple = ()  # resource types this site can't work without
+    ALLOW_HOSTS: tuple = ()  # blocked-by-default hosts this site needs
+    # What "loaded" means after navigating, checked instead of sleeping a fixed
+    # time. Each entry is an alternative: a CSS selector, "@json-ld" (a
+    # JSON-LD Product is present), "@next-data" (__NEXT_DATA__ parses),
+    # {"selector": ..., "more_than": n} (more than n matches, e.g. after a
+    # load-more click) or a tuple of those that must all hold. Empty means
+    # just wait out the cap.
+    PRODUCT_READY: tuple = ("@json-ld", ("h1", "[class*='price']"))
+    LISTING_READY: tuple = ("a[href*='/products/']",)
+    URL_QUEUE_SIZE: int = 20  # streamed URLs waiting for a detail tab before listing pauses
+    HARVEST_LISTING: bool = False  # keep card data from the listing's JSON (needs _api_product_url)
+    # Fast mode: products whose listing data has all REQUIRED_FIELDS skip the
+    # detail page. LISTING_CARD selects one product card; CARD_FIELDS are read
+    # inside it (a "link" field is required) when the retailer calls _read_cards.
+    REQUIRED_FIELDS: tuple = ("product", "brand", "price", "image_url")
+    LISTING_CARD: str = ""
+    CARD_FIELDS: Dict[str, Field] = {}
+    # Plain HTTP instead of the browser (needs httpx), per phase. Listing
+    # pages through <start>?HTTP_PAGE_PARAM=N for hrefs that pass
+    # _is_listing_link; detail maps the HTML with _parse_product_html. Either
+    # falls back to the browser when it fails or comes back short.
+    HTTP_LISTING: bool = False
+    HTTP_DETAIL: bool = False
+    HTTP_LINK: str = "/products/"
+    HTTP_PAGE_PARAM: str = "page"
+    # A backends.* catalog API (needs httpx) tried before the browser; it
+    # returns whole products, so when it works there is no detail phase
+    BACKEND: Optional[type] = None
+    BACKEND_OPTIONS: dict = {}  # keyword arguments for BACKEND, e.g. a store code
+    # DOM values read in one round trip by _extract_fields(page): name -> Field
+    PRODUCT_FIELDS: Dict[str, Field] = {}
 
     def __init__(self, progress: ProgressTracker, headless: bool = True, keyword: str = "",
-                 on_status=None, should_stop=None, should_skip=None):
+                 on_status=None, should_stop=None, should_skip=None,
+                 browser_pool: Optional[BrowserPool] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 concurrency_store: Optional[ConcurrencyStore] = None,
+                 keywords: Optional[List[str]] = None,
+                 profile_store: Optional[ProfileStore] = None,
+                 fast: bool = False):
         self.progress = progress
         self.headless = headless
+        self.browser_pool = browser_pool  # shared browser owned by the caller, if any
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.rate_limiter.configure(self.BASE_URL, self.REQUESTS_PER_SECOND, self.REQUEST_BURST)
         self.keyword = keyword or DEFAULT_KEYWORD
+        # Several keywords share one listing pass each and one detail pass
+        self.keywords = list(dict.fromkeys(k for k in (keywords or []) if k)) or [self.keyword]
+        self.keyword = self.keywords[0]
+        self.url_keywords: Dict[str, List[str]] = {}  # product URL -> keywords that found it
         self.logger = logging.getLogger(f"scraper.{self.RETAILER_NAME}")
         self.products: List[StrollerProduct] = []
         self._on_status = on_status  # callback(message) for live UI updates
         self._should_stop = should_stop  # callable() -> bool: stop entire scrape
-        self._should_skip = should_skip  # callable() -> bool: skip this retailer
+        self._should_skip = should_skip  # callable(retailer name) -> bool: skip this retailer
         self._was_skipped = False  # set True if skip was triggered during run()
+        self._halted = False  # set once stop/skip is seen so every worker winds down
+        self.concurrency_store = concurrency_store  # learned tab counts from earlier runs
+        self.profile_store = profile_store  # persistent browser profiles, if enabled
+        self._concurrency: Optional[AdaptiveConcurrency] = None
+        self.timings: dict = {}  # listing/detail durations for RunHistory
+        self.ready_stats = {"waits": 0, "seconds": 0.0, "capped": 0, "cap_seconds": 0.0}
+        self.harvester: Optional[ListingHarvester] = None  # partial products seen while listing
+        self.fast = fast  # skip detail pages the listing already covers
+        self.from_backend = False  # listing came from BACKEND, so complete products need no page
+        self.required_fields = self.REQUIRED_FIELDS  # less what BACKEND can't supply, once it has listed
+        self.http: Optional[HttpEngine] = None  # open during a session if the retailer opts in
 
     def _get_start_url(self) -> str:
         """Return search URL when keyword differs from default, otherwise listing URL."""
@@ -46,94 +275,606 @@ class BaseStrollerScraper(ABC):
         if self._on_status:
             self._on_status(msg)
 
-    async def run(self) -> List[StrollerProduct]:
+    def _context_options(self) -> dict:
+        return {
+            "user_agent": get_random_user_agent(),
+            "viewport": {"width": 1920, "height": 1080},
+            "locale": "en-AE",
+            "timezone_id": "Asia/Dubai",
+        }
+
+    @asynccontextmanager
+    async def _session(self):
+        """Yield (context, page) for this retailer, closing the context after."""
+        if self.browser_pool is not None:
+            self._emit(f"  Opening browser context for {self.RETAILER_NAME}...")
+            async with self._context_in(self.browser_pool) as session:
+                yield session
+            return
+
+        # Standalone use — launch a private browser just for this retailer
         self._emit(f"  Launching browser for {self.RETAILER_NAME}...")
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                user_agent=get_random_user_agent(),
-                viewport={"width": 1920, "height": 1080},
-                locale="en-AE",
-                timezone_id="Asia/Dubai",
-            )
-            page = await context.new_page()
-            await setup_stealth(page)
+        async with BrowserPool(headless=self.headless) as pool:
+            async with self._context_in(pool) as session:
+                yield session
+
+    @asynccontextmanager
+    async def _context_in(self, pool: BrowserPool):
+        options = self._context_options()
+        profile = None
+        if self.profile_store is not None and self.PERSISTENT_PROFILE:
+            profile = self.profile_store.acquire(self.RETAILER_NAME)
+            if profile is None:
+                self.logger.info(f"Profile for {self.RETAILER_NAME} is in use — using a fresh context")
 
+        blocker = None
+        try:
+            if profile is not None:
+                # Request interception turns Chromium's HTTP cache off, which
+                # is the point of a profile, so only images are switched off
+                # (by a launch flag) and everything else comes from the cache
+                options["user_agent"] = self.profile_store.user_agent(
+                    self.RETAILER_NAME, options["user_agent"])
+                args = []
+                if self.BLOCK_RESOURCES and "image" not in self.ALLOW_RESOURCE_TYPES:
+                    args.append("--blink-settings=imagesEnabled=false")
+                context = await pool.persistent_context(profile, args=args, **options)
+                page = context.pages[0] if context.pages else await context.new_page()
+            else:
+                context = await pool.new_context(**options)
+                if self.BLOCK_RESOURCES:
+                    blocker = ResourceBlocker(self.ALLOW_RESOURCE_TYPES, self.ALLOW_HOSTS)
+                    await blocker.install(context)
+                page = await context.new_page()
+        except BaseException:
+            if profile is not None:
+                self.profile_store.release(self.RETAILER_NAME)
+            raise
+
+        try:
+            await setup_stealth(page)
+            async with self._http_session(options["user_agent"]):
+                yield context, page
+        finally:
+            if blocker is not None:
+                self.logger.info(f"{self.RETAILER_NAME}: {blocker.summary()}")
+                self._emit(f"  [{self.RETAILER_NAME}] Network: {blocker.summary()}")
+            stats = self.ready_stats
+            if stats["waits"]:
+                self.logger.info(
+                    f"{self.RETAILER_NAME}: {stats['waits']} readiness waits took "
+                    f"{stats['seconds']:.1f}s (fixed sleeps: {stats['cap_seconds']:.1f}s, "
+                    f"{stats['capped']} hit the cap)"
+                )
             try:
-                # Check stop/skip before even starting URL collection
-                if self._should_stop and self._should_stop():
-                    self._emit(f"  [{self.RETAILER_NAME}] Stopping before URL collection...")
+                await context.close()
+            except Exception:
+                pass  # browser may have crashed; the pool relaunches it
+            if profile is not None:
+                self.profile_store.release(self.RETAILER_NAME)
+
+    @asynccontextmanager
+    async def _http_session(self, user_agent: str = ""):
+        """Keep self.http open meanwhile if this retailer uses plain HTTP.
+
+        A no-op when it is already open, so run() can open it before the
+        browser session for BACKEND and the session then reuses it.
+        """
+        if self.http is not None or not (self.HTTP_LISTING or self.HTTP_DETAIL or self.BACKEND):
+            yield
+            return
+        if not http_available():
+            self.logger.info(f"httpx is not installed — {self.RETAILER_NAME} uses the browser only")
+            yield
+            return
+        self.http = HttpEngine(self.rate_limiter, user_agent)
+        try:
+            yield
+        finally:
+            self.logger.info(f"{self.RETAILER_NAME}: {self.http.requests} plain HTTP requests")
+            await self.http.close()
+            self.http = None
+
+    async def run(self) -> List[StrollerProduct]:
+        started = time.monotonic()
+        try:
+            return await self._run()
+        finally:
+            self.timings["seconds"] = time.monotonic() - started  # wall time, for RunHistory
+
+    async def _run(self) -> List[StrollerProduct]:
+        async with self._http_session():
+            if self.BACKEND is not None and self.http is not None:
+                if self._halt_requested():
                     return self.products
-                if self._should_skip and self._should_skip():
-                    self._was_skipped = True
-                    self._emit(f"  [{self.RETAILER_NAME}] Skipping (user requested)...")
+                product_urls = await self._run_backend()
+                if product_urls is not None:
+                    if all(self._is_complete(self.harvester.get(url)) for url in product_urls):
+                        await self._scrape_products(None, None, product_urls)  # no page to load
+                    else:
+                        async with self._session() as (context, page):
+                            await self._scrape_products(context, page, product_urls)
                     return self.products
+            return await self._run_browser()
 
-                await self._dismiss_cookies(page)
-                self._emit(f"  Collecting product URLs from {self.RETAILER_NAME}...")
-                product_urls = await self._get_all_product_urls(page)
-                total_urls = len(product_urls)
-                self.logger.info(f"Found {total_urls} product URLs for {self.RETAILER_NAME}")
-                self._emit(f"  Found {total_urls} product URLs on {self.RETAILER_NAME}")
-
-                if total_urls == 0:
-                    self._emit(f"  No products found on {self.RETAILER_NAME}")
-
-                scraped_count = 0
-                skipped = 0
-                for i, url in enumerate(product_urls):
-                    # Check if user wants to stop the entire scrape
-                    if self._should_stop and self._should_stop():
-                        self._emit(f"  [{self.RETAILER_NAME}] Stopping (user requested)...")
-                        break
+    async def _run_browser(self) -> List[StrollerProduct]:
+        async with self._session() as (context, page):
+            # Check stop/skip before even starting URL collection
+            if self._should_stop and self._should_stop():
+                self._emit(f"  [{self.RETAILER_NAME}] Stopping before URL collection...")
+                return self.products
+            if self._should_skip and self._should_skip(self.RETAILER_NAME):
+                self._was_skipped = True
+                self._emit(f"  [{self.RETAILER_NAME}] Skipping (user requested)...")
+                return self.products
+
+            if self._streams_urls():
+                # Detail tabs start on the first URLs while the listing tab keeps going
+                await self._scrape_products(context, None, self._stream_urls(page))
+            else:
+                product_urls = await self._collect_urls(page)
+                await self._scrape_products(context, page, product_urls)
+
+        return self.products
+
+    async def _run_backend(self) -> Optional[List[str]]:
+        """List products through BACKEND's JSON API.
+
+        Returns their URLs with the products kept in the harvester, so only
+        those missing one of REQUIRED_FIELDS go on to a detail page; None
+        falls back to the browser listing.
+        """
+        backend = self.BACKEND(self.http, self.BASE_URL, **self.BACKEND_OPTIONS)
+        started = time.monotonic()
+        self._emit(f"  Querying {self.RETAILER_NAME}'s {backend.NAME}...")
+        found: Dict[str, StrollerProduct] = {}
+        self.url_keywords = {}
+        try:
+            for n, keyword in enumerate(self.keywords):
+                if n and self._halt_requested():
+                    break
+                self.keyword = keyword
+                for product in await backend.search(keyword, self._get_start_url()):
+                    found.setdefault(product.link, product)
+                    keywords = self.url_keywords.setdefault(product.link, [])
+                    if keyword not in keywords:
+                        keywords.append(keyword)
+        except Exception as e:
+            self.logger.warning(f"{backend.NAME} failed for {self.RETAILER_NAME} ({e!r}) — using the browser")
+            self._emit(f"  [{self.RETAILER_NAME}] {backend.NAME} unavailable — using the browser")
+            return None
+        finally:
+            self.keyword = self.keywords[0]
+        if not found:
+            self.logger.info(f"{backend.NAME} found nothing for {self.RETAILER_NAME} — using the browser")
+            return None
+
+        self.harvester = ListingHarvester(self._api_product_url, self.RETAILER_NAME)
+        for product in found.values():
+            self.harvester.add(product, "api")
+        self.from_backend = True
+        self.required_fields = tuple(f for f in self.REQUIRED_FIELDS if f not in backend.unavailable)
+        seconds = time.monotonic() - started
+        self.timings["listing_seconds"] = seconds
+        self.timings["url_count"] = len(found)
+        incomplete = sum(not self._is_complete(p) for p in found.values())
+        self._emit(f"  [{self.RETAILER_NAME}] {backend.NAME}: {len(found)} products in "
+                   f"{self.http.requests} requests ({seconds:.1f}s), {incomplete} need a detail page")
+        return list(found)
+
+    async def collect_product_urls(self) -> List[str]:
+        """Run only the listing phase (used by distributed workers)."""
+        async with self._session() as (context, page):
+            return await self._collect_urls(page)
+
+    async def scrape_product_urls(self, product_urls: List[str],
+                                  url_keywords: Optional[Dict[str, List[str]]] = None,
+                                  listing_products: Optional[List[StrollerProduct]] = None,
+                                  listing_sources: Optional[Dict[str, Dict[str, str]]] = None
+                                  ) -> List[StrollerProduct]:
+        """Run only the detail phase for already-collected URLs.
+
+        ``listing_products`` and ``listing_sources`` are the partial products
+        the listing phase kept (``harvester.products`` / ``.sources``), if it
+        ran elsewhere.
+        """
+        self.url_keywords = url_keywords or {}
+        if listing_products:
+            self.harvester = ListingHarvester(self._api_product_url, self.RETAILER_NAME)
+            for product in listing_products:
+                self.harvester.add(product, "listing")
+            self.harvester.sources.update(listing_sources or {})
+        async with self._session() as (context, page):
+            await self._scrape_products(context, page, product_urls)
+        return self.products
 
-                    # Check if user wants to skip this retailer
-                    if self._should_skip and self._should_skip():
-                        self._was_skipped = True
-                        self._emit(f"  [{self.RETAILER_NAME}] Skipping (user requested)...")
+    async def _iter_product_urls(self, page: Page) -> AsyncIterator[str]:
+        """Yield product URLs as the listing reveals them.
+
+        Retailers that can hand out URLs while still scrolling or paging
+        override this; by default it wraps _get_all_product_urls.
+        """
+        for url in await self._get_all_product_urls(page):
+            yield url
+
+    def _streams_urls(self) -> bool:
+        return type(self)._iter_product_urls is not BaseStrollerScraper._iter_product_urls
+
+    async def _listing_urls(self, page: Page) -> AsyncIterator[str]:
+        """Product URLs for the current keyword, over plain HTTP when opted in."""
+        if self.http is not None and self.HTTP_LISTING:
+            urls = await self._http_product_urls()
+            if urls:
+                for url in urls:
+                    yield url
+                return
+        async for url in self._iter_product_urls(page):
+            yield url
+
+    async def _http_product_urls(self) -> List[str]:
+        """Page through the listing without the browser; [] falls back to it."""
+        start = self._get_start_url()
+        separator = "&" if "?" in start else "?"
+        urls: List[str] = []
+        for n in range(1, 21):
+            url = start if n == 1 else f"{start}{separator}{self.HTTP_PAGE_PARAM}={n}"
+            try:
+                doc = await self.http.get_html(url)
+            except Exception as e:
+                if n == 1:
+                    self.logger.info(f"HTTP listing of {url} failed ({e}) — using the browser")
+                break
+            before = len(urls)
+            for href in doc.links_containing(self.HTTP_LINK):
+                full = self._make_absolute(href)
+                if self._is_listing_link(href) and full not in urls:
+                    urls.append(full)
+            if len(urls) == before:
+                break
+        if urls:
+            self._emit(f"  [{self.RETAILER_NAME}] Listing over HTTP: {len(urls)} product URLs")
+        return urls
+
+    def _is_listing_link(self, href: str) -> bool:
+        """Whether an HTTP_LINK href on a listing page is a product to scrape."""
+        return True
+
+    async def _stream_urls(self, page: Page) -> AsyncIterator[str]:
+        """Yield each new product URL once, across all keywords."""
+        started = time.monotonic()
+        if self.HARVEST_LISTING or self.fast:
+            self.harvester = ListingHarvester(self._api_product_url, self.RETAILER_NAME)
+        if self.HARVEST_LISTING:
+            self.harvester.attach(page)
+        await self._dismiss_cookies(page)
+        self._emit(f"  Collecting product URLs from {self.RETAILER_NAME}...")
+        self.url_keywords = {}
+        try:
+            for n, keyword in enumerate(self.keywords):
+                if self._halted or (n and self._halt_requested()):
+                    break
+                self.keyword = keyword
+                if len(self.keywords) > 1:
+                    self._emit(f"  [{self.RETAILER_NAME}] Searching \"{keyword}\"...")
+                async for url in self._listing_urls(page):
+                    if self._halted:
                         break
+                    seen = url in self.url_keywords
+                    self.url_keywords.setdefault(url, [])
+                    if keyword not in self.url_keywords[url]:
+                        self.url_keywords[url].append(keyword)
+                    if not seen:
+                        yield url
+        finally:
+            if self.HARVEST_LISTING:
+                self.harvester.detach(page)  # the listing tab may go on to scrape details
+        self.keyword = self.keywords[0]
+
+        total_urls = len(self.url_keywords)
+        self.timings["listing_seconds"] = time.monotonic() - started
+        self.timings["url_count"] = total_urls
+        self.logger.info(f"Found {total_urls} product URLs for {self.RETAILER_NAME}")
+        self._emit(f"  Found {total_urls} product URLs on {self.RETAILER_NAME}")
+        if total_urls == 0:
+            self._emit(f"  No products found on {self.RETAILER_NAME}")
+        if self.harvester and self.harvester.products:
+            self._emit(f"  [{self.RETAILER_NAME}] Listing data: {len(self.harvester.products)} products "
+                       f"from {self.harvester.responses} responses")
+
+    async def _collect_urls(self, page: Page) -> List[str]:
+        return [url async for url in self._stream_urls(page)]  # union in discovery order
+
+    def _halt_requested(self) -> bool:
+        """Check stop/skip once for all detail workers.
+
+        should_skip consumes the request for this retailer, so the first
+        worker to see it records the halt here and the others pick it up
+        from self._halted.
+        """
+        if self._halted:
+            return True
+        # Check if user wants to stop the entire scrape
+        if self._should_stop and self._should_stop():
+            self._emit(f"  [{self.RETAILER_NAME}] Stopping (user requested)...")
+            self._halted = True
+        # Check if user wants to skip this retailer
+        elif self._should_skip and self._should_skip(self.RETAILER_NAME):
+            self._was_skipped = True
+            self._emit(f"  [{self.RETAILER_NAME}] Skipping (user requested)...")
+            self._halted = True
+        return self._halted
+
+    async def _scrape_products(self, context: BrowserContext, page: Optional[Page],
+                               product_urls: Union[List[str], AsyncIterator[str]]):
+        """Scrape product pages with several tabs pulling from one queue.
+
+        How many tabs are busy at once is decided by an AIMD controller that
+        starts at DETAIL_WORKERS (or the value learned on the last run) and
+        moves between 1 and MAX_DETAIL_WORKERS as the retailer copes.
+
+        ``product_urls`` may also be an async iterator still discovering
+        URLs; the queue is then bounded by URL_QUEUE_SIZE so the listing
+        tab never runs far ahead of the detail tabs.
+        """
+        streaming = not isinstance(product_urls, list)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.URL_QUEUE_SIZE if streaming else 0)
+
+        results = {}  # url index -> product, so output keeps listing order
+        counters = {"done": 0, "scraped": 0, "cached": 0, "from_listing": 0, "http": 0,
+                    "found": 0 if streaming else len(product_urls)}
+        started = time.monotonic()
+
+        initial = self.DETAIL_WORKERS
+        if self.concurrency_store:
+            initial = self.concurrency_store.get(self.RETAILER_NAME, initial)
+        self._concurrency = AdaptiveConcurrency(
+            initial, maximum=max(self.MAX_DETAIL_WORKERS, self.DETAIL_WORKERS),
+        )
+
+        if streaming:
+            workers = self._concurrency.maximum
+        else:
+            workers = max(1, min(self._concurrency.maximum, len(product_urls)))
+
+        async def feed():
+            try:
+                if streaming:
+                    async for url in product_urls:
+                        await queue.put((counters["found"], url))
+                        counters["found"] += 1
+                else:
+                    for i, url in enumerate(product_urls):
+                        queue.put_nowait((i, url))
+            finally:
+                for _ in range(workers):
+                    await queue.put(None)  # one "no more URLs" per worker
+
+        feeder = asyncio.create_task(feed())
+        try:
+            # Worker 0 reuses the listing tab (unless it's still streaming
+            # URLs); the others open theirs on first use
+            await asyncio.gather(*(
+                self._detail_worker(context, page if n == 0 else None, queue,
+                                    results, counters)
+                for n in range(workers)
+            ))
+        finally:
+            # Workers that stopped early leave the listing blocked on a full queue
+            if not feeder.done():
+                feeder.cancel()
+            try:
+                await feeder
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                # Keep what was scraped unless the listing never got going
+                if not counters["found"]:
+                    raise
+                self.logger.exception(f"Listing for {self.RETAILER_NAME} stopped early")
+            finally:
+                if streaming:
+                    await product_urls.aclose()
+                for i in sorted(results):
+                    product = results[i]
+                    product.keywords = "; ".join(self.url_keywords.get(product.link, [self.keyword]))
+                    self.products.append(product)
+                self.timings["detail_seconds"] = time.monotonic() - started
+                self.timings["detail_pages"] = counters["done"] - counters["cached"] - counters["from_listing"]
+                if self.fast and counters["done"]:
+                    self._emit(f"  [{self.RETAILER_NAME}] Fast mode: {counters['from_listing']} of "
+                               f"{counters['done']} products taken from the listing")
+                self.timings["http_pages"] = counters["http"]
+                if counters["http"]:
+                    self._emit(f"  [{self.RETAILER_NAME}] HTTP: {counters['http']} of "
+                               f"{counters['done']} product pages fetched without the browser")
+                if self.concurrency_store and counters["found"]:
+                    self.concurrency_store.save(self.RETAILER_NAME, self._concurrency.limit)
+
+    async def _detail_worker(self, context: BrowserContext, page: Optional[Page],
+                             queue: asyncio.Queue, results: dict, counters: dict):
+        own_page = page is None
+        controller = self._concurrency
+        try:
+            while not self._halt_requested():
+                await controller.acquire()
+                try:
+                    if self._halt_requested():
+                        return
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    i, url = item
 
                     if self.progress.is_already_scraped(self.RETAILER_NAME, url):
-                        skipped += 1
+                        counters["done"] += 1
+                        counters["cached"] += 1
                         continue
 
-                    # Hard timeout per product — skip if it takes too long
-                    try:
-                        product = await asyncio.wait_for(
-                            self._scrape_with_retry(page, url),
-                            timeout=self.PER_PRODUCT_TIMEOUT,
-                        )
-                    except asyncio.TimeoutError:
-                        self.logger.warning(f"Timed out after {self.PER_PRODUCT_TIMEOUT}s on {url}")
-                        self._emit(f"  [{self.RETAILER_NAME}] Skipped product {i + 1}/{total_urls} (timed out)")
+                    partial = self.harvester.get(url) if self.harvester else None
+                    if (self.fast or self.from_backend) and self._is_complete(partial):
+                        # The listing already showed everything asked for
+                        product = self._with_sources(partial, None)
+                        counters["from_listing"] += 1
+                    else:
                         product = None
+                        if self.http is not None and self.HTTP_DETAIL:
+                            product = await self._scrape_http(url, partial)
+                            if product:
+                                counters["http"] += 1
+                        if product is None:
+                            if page is None:
+                                page = await context.new_page()
+                                await setup_stealth(page)
+
+                            # Hard timeout per product — skip if it takes too long
+                            try:
+                                product = await asyncio.wait_for(
+                                    self._scrape_with_retry(page, url),
+                                    timeout=self.PER_PRODUCT_TIMEOUT,
+                                )
+                            except asyncio.TimeoutError:
+                                self.logger.warning(f"Timed out after {self.PER_PRODUCT_TIMEOUT}s on {url}")
+                                self._emit(f"  [{self.RETAILER_NAME}] Skipped product {i + 1}/{counters['found']} (timed out)")
+                                self._record_outcome(self.PER_PRODUCT_TIMEOUT, ok=False, timed_out=True)
+                                product = None
+                        if partial or product:
+                            product = self._with_sources(partial, product)
 
                     if product:
                         product.retailer = self.RETAILER_NAME
                         product.link = url
-                        self.products.append(product)
+                        results[i] = product
                         self.progress.mark_scraped(self.RETAILER_NAME, url)
-                        scraped_count += 1
+                        counters["scraped"] += 1
+
+                    counters["done"] += 1
+                    done, total_urls = counters["done"], counters["found"]
 
                     # Emit progress every product
-                    self._emit(f"  [{self.RETAILER_NAME}] Product {i + 1}/{total_urls} — {scraped_count} scraped")
+                    self._emit(
+                        f"  [{self.RETAILER_NAME}] Product {done}/{total_urls} — "
+                        f"{counters['scraped']} scraped (concurrency {controller.limit})"
+                    )
 
-                    await random_delay(0.8, 2.0)
+                    if done % 5 == 0 or done == total_urls:
+                        self.progress.update(self.RETAILER_NAME, done, total_urls)
+                finally:
+                    await controller.release()
+        finally:
+            if own_page and page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
-                    if (i + 1) % 5 == 0 or i + 1 == len(product_urls):
-                        self.progress.update(self.RETAILER_NAME, i + 1, len(product_urls))
+    def _is_complete(self, product: Optional[StrollerProduct]) -> bool:
+        return product is not None and all(getattr(product, f) for f in self.required_fields)
 
-            finally:
-                await browser.close()
+    def _with_sources(self, partial: Optional[StrollerProduct],
+                      detail: Optional[StrollerProduct]) -> StrollerProduct:
+        """Combine listing and detail data, noting where each field came from.
 
-        return self.products
+        Listing data wins; the detail page fills the gaps, or stands in for
+        a detail page that failed.
+        """
+        groups: Dict[str, List[str]] = {}  # source -> fields, in DATA_FIELDS order
+        if partial is None:
+            product = detail
+            filled = [f for f in DATA_FIELDS if getattr(detail, f)]
+        else:
+            product = partial
+            known = self.harvester.sources.get(partial.link, {}) if self.harvester else {}
+            for f in DATA_FIELDS:
+                if getattr(partial, f):
+                    groups.setdefault(known.get(f, "listing"), []).append(f)
+            filled = fill_missing(partial, detail) if detail else []
+        if filled:
+            groups["detail"] = filled
+        product.field_sources = "; ".join(f"{source}: {', '.join(names)}" for source, names in groups.items())
+        return product
+
+    async def _scrape_http(self, url: str, partial: Optional[StrollerProduct] = None
+                           ) -> Optional[StrollerProduct]:
+        """Fetch and map a product page without the browser.
+
+        None means use the browser instead: the fetch failed, or the page
+        lacked one of REQUIRED_FIELDS that ``partial`` (the listing's data)
+        doesn't have either, so it probably needs rendering.
+        """
+        started = time.monotonic()
+        try:
+            doc = await asyncio.wait_for(self.http.get_html(url), timeout=self.PER_PRODUCT_TIMEOUT)
+        except Exception as e:
+            self._record_outcome(time.monotonic() - started, ok=False)
+            self.logger.info(f"HTTP fetch of {url} failed ({e!r}) — using the browser")
+            return None
+        self._record_outcome(time.monotonic() - started, ok=True)
+        product = self._parse_product_html(doc, url)
+        missing = [f for f in self.required_fields
+                   if not (product and getattr(product, f)) and not (partial and getattr(partial, f))]
+        if missing:
+            self.logger.debug(f"{url} over HTTP lacks {', '.join(missing)} — using the browser")
+            return None
+        return product
+
+    def _parse_product_html(self, doc: HtmlDocument, url: str) -> Optional[StrollerProduct]:
+        """Map a product page fetched over HTTP: JSON-LD first, then meta tags.
+
+        Retailers with HTTP_DETAIL override this to add what their pages
+        carry beyond that, e.g. ``doc.specs``.
+        """
+        product = StrollerProduct()
+
+        ld = doc.json_ld_product()
+        if ld:
+            product.product = ld.get("name", "")
+            product.description = ld.get("description", "")
+            image = ld.get("image", "")
+            if isinstance(image, list):
+                image = image[0] if image else ""
+            if isinstance(image, dict):
+                image = image.get("url", "")
+            product.image_url = image
+            offers = ld.get("offers", {})
+            if isinstance(offers, list):
+                offers = offers[0] if offers else {}
+            if isinstance(offers, dict):
+                product.price = parse_price(offers.get("price") or offers.get("lowPrice"))
+            brand_info = ld.get("brand", {})
+            if isinstance(brand_info, dict):
+                product.brand = brand_info.get("name", "")
+            elif isinstance(brand_info, str):
+                product.brand = brand_info
+
+        meta = doc.meta
+        product.product = product.product or meta.get("og:title", "") or doc.h1
+        product.brand = product.brand or meta.get("product:brand", "")
+        product.price = product.price or parse_price(
+            meta.get("product:price:amount") or meta.get("og:price:amount"))
+        product.description = product.description or meta.get("og:description", "")
+        product.image_url = product.image_url or meta.get("og:image", "")
+        if product.image_url:
+            product.image_url = self._make_absolute(product.image_url)
+        return product
+
+    def _record_outcome(self, latency: float, ok: bool, timed_out: bool = False):
+        """Feed one page result to the concurrency controller."""
+        controller = self._concurrency
+        if controller is None:
+            return
+        before = controller.limit
+        if controller.record(latency, ok, timed_out):
+            self._emit(f"  [{self.RETAILER_NAME}] Concurrency {before} → {controller.limit}")
 
     async def _scrape_with_retry(self, page: Page, url: str) -> Optional[StrollerProduct]:
         for attempt in range(self.MAX_RETRIES):
+            started = time.monotonic()
             try:
                 product = await self._scrape_product_page(page, url)
+                self._record_outcome(time.monotonic() - started, ok=True)
                 return product
             except Exception as e:
+                self._record_outcome(time.monotonic() - started, ok=False)
                 self.logger.warning(
                     f"Attempt {attempt + 1}/{self.MAX_RETRIES} failed for {url}: {e}"
                 )
@@ -141,6 +882,53 @@ class BaseStrollerScraper(ABC):
                     await asyncio.sleep(self.RETRY_DELAY * (attempt + 1))
         return None
 
+    async def _goto(self, page: Page, url: str, wait_until: str = "domcontentloaded",
+                    timeout: Optional[int] = None):
+        """Navigate once the host's rate limiter allows it.
+
+        A 429 (or a 503 carrying Retry-After) slows the host down and raises
+        RateLimitedError, so _scrape_with_retry tries again after the pause.
+        """
+        await self.rate_limiter.acquire(url)
+        response = await page.goto(url, wait_until=wait_until,
+                                   timeout=timeout or self.PAGE_LOAD_TIMEOUT)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if response.status == 429 or (response.status == 503 and retry_after is not None):
+                self.rate_limiter.penalize(url, retry_after)
+                self.logger.warning(
+                    f"{response.status} from {url} — slowing {self.RETAILER_NAME} to "
+                    f"{self.rate_limiter.current_rate(url):.2f} req/s"
+                )
+                raise RateLimitedError(f"HTTP {response.status} for {url}")
+        return response
+
+    async def _wait_ready(self, page: Page, ready: tuple, cap: float) -> float:
+        """Wait until ``ready`` holds on the page, for at most ``cap`` seconds.
+
+        Returns how long it waited. Never raises: a page that doesn't get
+        there just costs the cap, like the fixed sleep this replaces.
+        """
+        started = time.monotonic()
+        spec = [list(alt) if isinstance(alt, tuple) else [alt] for alt in ready]
+        capped = False
+        if spec:
+            try:
+                await page.wait_for_function(_READY_JS, arg=spec, polling=100, timeout=cap * 1000)
+            except Exception:
+                capped = True
+        else:
+            await asyncio.sleep(cap)
+            capped = True
+        waited = time.monotonic() - started
+
+        stats = self.ready_stats
+        stats["waits"] += 1
+        stats["seconds"] += waited
+        stats["cap_seconds"] += cap
+        stats["capped"] += capped
+        return waited
+
     @abstractmethod
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         ...
@@ -184,30 +972,78 @@ class BaseStrollerScraper(ABC):
         except Exception:
             return []
 
-    async def _extract_spec_table(self, page: Page, selector: str) -> dict:
-        specs = {}
+    async def _extract_fields(self, page: Page, fields: Optional[Dict[str, Field]] = None) -> dict:
+        """Read every field of a spec with a single page.evaluate.
+
+        Defaults to PRODUCT_FIELDS. Missing fields come back as "" (or [] for
+        ``many``), so callers can use the result like ``_safe_text``'s.
+        """
+        fields = self.PRODUCT_FIELDS if fields is None else fields
+        empty = {name: [] if f.many else "" for name, f in fields.items()}
+        if not fields:
+            return empty
         try:
-            rows = await page.query_selector_all(f"{selector} tr")
-            for row in rows:
-                label = await self._safe_text(row, "th, td:first-child, .label, dt")
-                value = await self._safe_text(row, "td:last-child, .value, dd")
-                if label and value and label != value:
-                    specs[label.lower().strip().rstrip(":")] = value
+            values = await page.evaluate(_FIELDS_JS, [None, _field_spec(fields)])
         except Exception:
-            pass
+            return empty
+        return {**empty, **(values or {})}
 
-        # Also try dl/dt/dd pattern
+    async def _extract_cards(self, page: Page, card: str, fields: Dict[str, Field]) -> List[dict]:
+        """Like _extract_fields, once per element matching ``card``, in one call."""
+        empty = {name: [] if f.many else "" for name, f in fields.items()}
         try:
-            dts = await page.query_selector_all(f"{selector} dt")
-            dds = await page.query_selector_all(f"{selector} dd")
-            for dt, dd in zip(dts, dds):
-                label = (await dt.inner_text()).strip().lower().rstrip(":")
-                value = (await dd.inner_text()).strip()
-                if label and value:
-                    specs[label] = value
+            cards = await page.evaluate(_FIELDS_JS, [card, _field_spec(fields)])
         except Exception:
-            pass
+            return []
+        return [{**empty, **values} for values in cards or []]
+
+    async def _read_cards(self, page: Page) -> int:
+        """In fast mode, keep what the listing's product cards show.
+
+        Retailers with LISTING_CARD / CARD_FIELDS call this from
+        _get_all_product_urls once the cards are on the page. Cards are
+        keyed by their "link" field, made absolute the way listing URLs are.
+        """
+        if not (self.fast and self.LISTING_CARD and self.harvester):
+            return 0
+        kept = 0
+        for values in await self._extract_cards(page, self.LISTING_CARD, self.CARD_FIELDS):
+            link = values.get("link", "")
+            if not link or not values.get("product"):
+                continue
+            image = values.get("image_url", "")
+            self.harvester.add(StrollerProduct(
+                product=values["product"],
+                brand=values.get("brand", ""),
+                price=parse_price(values.get("price", "")),
+                image_url=self._make_absolute(image) if image else "",
+                link=self._make_absolute(link.split("?")[0]),
+            ), "card")
+            kept += 1
+        return kept
+
+    async def _extract_spec_pairs(self, page: Page, selector: Optional[str] = None,
+                                  pairs: Optional[Tuple[str, str, str]] = None
+                                  ) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Read every spec under ``selector`` (whole page if None) in one pass.
 
+        Collects table rows, dt/dd pairs and, if ``pairs`` is given as
+        (item, label, value) selectors, label/value blocks such as attribute
+        lists. Keys are lowercased with trailing colons stripped; when a key
+        turns up with different values the last one wins and all of them are
+        returned in ``duplicates``.
+        """
+        try:
+            result = await page.evaluate(_SPEC_PAIRS_JS, [selector, list(pairs) if pairs else None])
+            specs, duplicates = result if result else ({}, {})
+        except Exception:
+            return {}, {}
+        if duplicates:
+            self.logger.debug(f"{self.RETAILER_NAME}: conflicting spec values {duplicates}")
+        return specs, duplicates
+
+    async def _extract_spec_table(self, page: Page, selector: str) -> dict:
+        specs, _ = await self._extract_spec_pairs(page, selector)
         return specs
 
     async def _extract_json_ld(self, page: Page) -> Optional[dict]:
@@ -248,6 +1084,45 @@ class BaseStrollerScraper(ABC):
         except Exception:
             return None
 
+    async def _scroll_once(self, page: Page, selector: str, wait: float = 4.0,
+                           settle: float = 0.3) -> Tuple[int, int]:
+        """Scroll to the bottom and wait for more ``selector`` matches.
+
+        Returns (count before, count after) as soon as the count has grown and
+        the page has been quiet for ``settle`` seconds, or after ``wait``
+        seconds without growth. (0, 0) if the page couldn't be scrolled.
+        """
+        try:
+            before, after = await page.evaluate(
+                _SCROLL_JS, [selector, int(wait * 1000), int(settle * 1000)]
+            )
+            return before, after
+        except Exception:
+            return 0, 0
+
+    async def _scroll_load(self, page: Page, selector: str, wait: float = 4.0,
+                           max_scrolls: int = 50) -> Tuple[int, float]:
+        """Scroll until the number of ``selector`` matches stops growing.
+
+        Unlike _scroll_to_bottom this ignores height changes from footers or
+        lazy images and moves on as soon as a batch of items has rendered.
+        Returns (scrolls, seconds).
+        """
+        started = time.monotonic()
+        scrolls = count = 0
+        for _ in range(max_scrolls):
+            before, count = await self._scroll_once(page, selector, wait)
+            scrolls += 1
+            if count <= before:
+                break
+        seconds = time.monotonic() - started
+        self._report_scroll(count, scrolls, seconds)
+        return scrolls, seconds
+
+    def _report_scroll(self, items: int, scrolls: int, seconds: float):
+        self.logger.info(f"{self.RETAILER_NAME}: {items} items after {scrolls} scrolls ({seconds:.1f}s)")
+        self._emit(f"  [{self.RETAILER_NAME}] Scrolled: {items} items in {scrolls} scrolls ({seconds:.1f}s)")
+
     async def _scroll_to_bottom(self, page: Page, pause: float = 1.0, max_scrolls: int = 50):
         previous_height = 0
         for _ in range(max_scrolls):
@@ -281,6 +1156,10 @@ class BaseStrollerScraper(ABC):
             except Exception:
                 continue
 
+    def _api_product_url(self, value: str) -> Optional[str]:
+        """Map a string from a listing's JSON to an absolute product URL, or None."""
+        return None
+
     def _make_absolute(self, url: str) -> str:
         if not url:
             return ""
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from typing import Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+
+class BrowserPool:
+    """Long-lived Chromium shared by every retailer in a run.
+
+    Each retailer gets its own isolated BrowserContext (cookies, storage,
+    cache) inside the one browser process, so launching Chromium is paid
+    once per run instead of once per retailer. If the browser crashes or
+    disconnects, the next new_context() call relaunches it transparently.
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self.logger = logging.getLogger("browser_pool")
+        self.launch_count = 0
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Launch Chromium up front so the first retailer doesn't pay for it."""
+        async with self._lock:
+            await self._ensure_browser()
+
+    def is_healthy(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_browser(self) -> Browser:
+        # Caller must hold self._lock
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        if self._browser is None or not self._browser.is_connected():
+            if self._browser is not None:
+                self.logger.warning("Chromium disconnected — relaunching")
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            self.launch_count += 1
+        return self._browser
+
+    async def new_context(self, **options) -> BrowserContext:
+        """Open a fresh isolated context, relaunching Chromium if it died."""
+        async with self._lock:
+            browser = await self._ensure_browser()
+        try:
+            return await browser.new_context(**options)
+        except Exception:
+            if browser.is_connected():
+                raise
+            # Browser went away between the check and the call — retry once
+            async with self._lock:
+                browser = await self._ensure_browser()
+            return await browser.new_context(**options)
+
+    async def persistent_context(self, user_data_dir: str, args=(), **options) -> BrowserContext:
+        """Open a context backed by an on-disk profile (its own Chromium process)."""
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch_persistent_context(
+            user_data_dir, headless=self.headless, args=list(args), **options,
+        )
+
+    async def close(self):
+        async with self._lock:
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception:
+                    pass
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
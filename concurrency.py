@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+import statistics
+from typing import Dict, List
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on how many product pages a retailer loads at once.
+
+    Every product outcome (latency, success, timeout) is recorded. After
+    each window of outcomes the limit goes up by one if the retailer is
+    keeping up, and is halved if pages were timing out, failing or getting
+    slow. A timeout halves the limit straight away, at most once per
+    window, so a struggling SPA backs off before the next batch.
+    """
+
+    WINDOW = 6  # outcomes per adjustment
+    SLOW_LATENCY = 15.0  # seconds — median page time that counts as trouble
+    MAX_ERROR_RATE = 0.2
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 6):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._since_decrease = self.WINDOW
+
+    async def acquire(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def record(self, latency: float, ok: bool, timed_out: bool = False) -> bool:
+        """Record one product outcome; returns True if the limit changed."""
+        self._since_decrease += 1
+        if timed_out:
+            if self._since_decrease >= self.WINDOW:
+                return self._decrease()
+            return False
+
+        self._latencies.append(latency)
+        if not ok:
+            self._errors += 1
+        if len(self._latencies) < self.WINDOW:
+            return False
+
+        error_rate = self._errors / len(self._latencies)
+        slow = statistics.median(self._latencies) > self.SLOW_LATENCY
+        self._latencies = []
+        self._errors = 0
+        if error_rate > self.MAX_ERROR_RATE or slow:
+            return self._decrease()
+        return self._increase()
+
+    def _increase(self) -> bool:
+        # Waiters re-check the higher limit on the caller's next release()
+        if self.limit >= self.maximum:
+            return False
+        self.limit += 1
+        return True
+
+    def _decrease(self) -> bool:
+        self._since_decrease = 0
+        self._latencies = []
+        self._errors = 0
+        new_limit = max(self.minimum, self.limit // 2)
+        changed = new_limit != self.limit
+        self.limit = new_limit
+        return changed
+
+
+class ConcurrencyStore:
+    """Remembers each retailer's learned concurrency between runs."""
+
+    FILENAME = "concurrency_state.json"
+
+    def __init__(self, state_dir: str):
+        os.makedirs(state_dir, exist_ok=True)
+        self.path = os.path.join(state_dir, self.FILENAME)
+
+    def _load(self) -> Dict[str, int]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {}
+
+    def get(self, retailer: str, default: int) -> int:
+        return self._load().get(retailer, default)
+
+    def save(self, retailer: str, limit: int):
+        # Re-read before writing so parallel retailers don't clobber each
+        # other, and swap the file in atomically for worker processes
+        state = self._load()
+        state[retailer] = limit
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -113,6 +113,13 @@ RETAILERS = {
 
 DEFAULT_KEYWORD = "strollers"
 
+# Default politeness limits per retailer host (retailer classes can override)
+RATE_LIMIT_RPS = 1.0
+RATE_LIMIT_BURST = 3
+
+# Persistent per-retailer browser profiles (--persistent-profile): total disk cap
+PROFILE_MAX_MB = 2048
+
 KNOWN_BRANDS = [
     "Bugaboo", "Cybex", "Joie", "Silver Cross", "Stokke", "Babyzen",
     "UPPAbaby", "Mamas & Papas", "Maclaren", "Chicco", "Graco",
@@ -0,0 +1,263 @@
+"""
+Distributed coordinator/worker mode backed by a shared work queue.
+
+The coordinator (run_all_scrapers with ``work_queue=``) puts one listing
+item per retailer into the queue. Any number of workers — usually
+separate containers sharing the queue file — lease items and run them:
+a listing item returns the retailer's product URLs, which the coordinator
+splits into product batches and queues again; a batch item returns
+normalized products plus the URLs it scraped. The coordinator keeps the
+one ProgressTracker checkpoint and does all accounting and CSV output,
+so results look exactly like a local run.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional
+
+from models import StrollerProduct
+from work_queue import SQLiteWorkQueue, WorkItem, LISTING, PRODUCTS, DONE
+
+PRODUCT_BATCH_SIZE = 20
+POLL_INTERVAL = 1.0  # seconds
+
+
+class LeaseProgress:
+    """ProgressTracker stand-in for a worker: records what this lease scraped."""
+
+    def __init__(self):
+        self.scraped: List[str] = []
+
+    def is_already_scraped(self, retailer: str, url: str) -> bool:
+        return False  # the coordinator only queues URLs that still need scraping
+
+    def mark_scraped(self, retailer: str, url: str):
+        self.scraped.append(url)
+
+    def update(self, retailer: str, current: int, total: int):
+        pass
+
+
+# ── Coordinator ──
+
+async def run_coordinated(
+    names: List[str],
+    queue_path: str,
+    options: dict,
+    progress,
+    on_started: Callable[[str], None],
+    on_status: Callable[[str], None],
+    on_finished: Callable[..., None],
+    on_failed: Callable[[str, str], None],
+    should_stop=None,
+    should_skip=None,
+):
+    """Queue ``names`` as work for remote workers and collect their results."""
+    wq = SQLiteWorkQueue(queue_path)
+    job_id = uuid.uuid4().hex[:12]
+    logger = logging.getLogger("coordinator")
+
+    for name in names:
+        wq.enqueue(job_id, LISTING, name, {"keywords": options["keywords"],
+                                           "fast": options.get("fast", False)})
+    logger.info(f"Queued job {job_id} ({len(names)} retailers) in {queue_path}")
+
+    # Per-retailer bookkeeping once its listing is back
+    batches: Dict[str, Dict[int, List[StrollerProduct]]] = {}
+    expected: Dict[str, int] = {}
+    url_totals: Dict[str, int] = {}
+    timings: Dict[str, dict] = {}
+    detail_started: Dict[str, float] = {}
+    urls_done: Dict[str, int] = {}
+    started_order: List[str] = []
+    active = set(names)
+    stopping = False
+
+    def finish(name, was_skipped=False):
+        active.discard(name)
+        parts = batches.pop(name, {})
+        products = [p for i in sorted(parts) for p in parts[i]]
+        run_timings = timings.pop(name, None)
+        if run_timings is not None and name in detail_started:
+            # Wall time across all workers, which is what scheduling cares about
+            run_timings["detail_seconds"] = time.monotonic() - detail_started.pop(name)
+            run_timings["seconds"] = run_timings.get("listing_seconds", 0.0) + run_timings["detail_seconds"]
+        on_finished(name, products, was_skipped, run_timings)
+
+    def handle(item: WorkItem):
+        name = item.retailer
+        if name not in active:
+            return  # skipped while this item was in flight
+
+        if item.kind == LISTING:
+            if item.status != DONE:
+                active.discard(name)
+                on_failed(name, item.error or "listing failed")
+                return
+            on_started(name)
+            started_order.append(name)
+            urls = item.result.get("urls", [])
+            url_keywords = item.result.get("url_keywords", {})
+            listing_products = item.result.get("listing_products", {})
+            listing_sources = item.result.get("listing_sources", {})
+            on_status(f"  Found {len(urls)} product URLs on {name}")
+            if stopping:
+                finish(name)  # listing was in flight when stop came — queue no product batches
+                return
+            todo = [u for u in urls if not progress.is_already_scraped(name, u)]
+            chunks = [todo[i:i + PRODUCT_BATCH_SIZE] for i in range(0, len(todo), PRODUCT_BATCH_SIZE)]
+            batches[name] = {}
+            expected[name] = len(chunks)
+            url_totals[name] = len(urls)
+            urls_done[name] = len(urls) - len(todo)
+            timings[name] = dict(item.result.get("timings", {}), detail_pages=0)
+            detail_started[name] = time.monotonic()
+            for index, chunk in enumerate(chunks):
+                wq.enqueue(job_id, PRODUCTS, name, {
+                    "keywords": options["keywords"], "urls": chunk, "batch": index,
+                    "url_keywords": {u: url_keywords[u] for u in chunk if u in url_keywords},
+                    "fast": options.get("fast", False),
+                    "listing_products": {u: listing_products[u] for u in chunk if u in listing_products},
+                    "listing_sources": {u: listing_sources[u] for u in chunk if u in listing_sources},
+                })
+            if not chunks:
+                finish(name)
+            return
+
+        index = item.payload["batch"]
+        if item.status == DONE:
+            products = [StrollerProduct(**d) for d in item.result.get("products", [])]
+            for url in item.result.get("scraped", []):
+                progress.mark_scraped(name, url)
+        else:
+            logger.warning(f"{name} batch {index} failed: {item.error}")
+            products = []
+        batches[name][index] = products
+        timings[name]["detail_pages"] += (item.result or {}).get("detail_pages", 0)
+        urls_done[name] += len(item.payload["urls"])
+        scraped = sum(len(b) for b in batches[name].values())
+        on_status(f"  [{name}] Product {urls_done[name]}/{url_totals[name]} — {scraped} scraped")
+        if len(batches[name]) == expected[name]:
+            finish(name)
+
+    while active:
+        if not stopping and should_stop and should_stop():
+            stopping = True
+            wq.cancel(job_id)
+
+        for name in [n for n in started_order if n in active]:
+            if should_skip and should_skip(name):
+                wq.cancel(job_id, name)
+                on_status(f"  [{name}] Skipping (user requested)...")
+                finish(name, was_skipped=True)
+
+        wq.requeue_expired()
+        for item in wq.take_results(job_id):
+            handle(item)
+
+        if stopping and wq.outstanding(job_id) == 0:
+            # Keep what the in-flight batches brought back for started retailers
+            for name in [n for n in started_order if n in active]:
+                finish(name)
+            break
+
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+# ── Worker ──
+
+async def _heartbeat(wq: SQLiteWorkQueue, item: WorkItem, worker_id: str):
+    logger = logging.getLogger("worker")
+    while True:
+        await asyncio.sleep(wq.LEASE_SECONDS / 3)
+        if not wq.heartbeat(item.id, worker_id):
+            logger.warning(f"Lost lease on item {item.id} ({item.retailer})")
+            return
+
+
+async def run_worker(
+    queue_path: str,
+    worker_id: Optional[str] = None,
+    headless: bool = True,
+    state_dir: str = "output",
+    idle_exit: Optional[float] = None,
+    persistent_profiles: bool = False,
+):
+    """Lease and run work items until idle for ``idle_exit`` seconds (forever if None)."""
+    from retailers import get_scraper_registry
+    from browser_pool import BrowserPool
+    from rate_limiter import HostRateLimiter
+    from concurrency import ConcurrencyStore
+    from exporter import normalize_product
+    from profiles import ProfileStore
+
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    logger = logging.getLogger("worker")
+    wq = SQLiteWorkQueue(queue_path)
+    registry = get_scraper_registry()
+    rate_limiter = HostRateLimiter()
+    concurrency_store = ConcurrencyStore(state_dir)
+    profile_store = None
+    if persistent_profiles:
+        profile_store = ProfileStore(os.path.join(state_dir, "profiles"))
+        profile_store.enforce_cap()
+
+    async def process(item: WorkItem, pool) -> dict:
+        lease_progress = LeaseProgress()
+        scraper = registry[item.retailer](
+            progress=lease_progress,
+            headless=headless,
+            keywords=item.payload.get("keywords"),
+            on_status=logger.info,
+            browser_pool=pool,
+            rate_limiter=rate_limiter,
+            concurrency_store=concurrency_store,
+            profile_store=profile_store,
+            fast=item.payload.get("fast", False),
+        )
+        if item.kind == LISTING:
+            urls = await scraper.collect_product_urls()
+            harvester = scraper.harvester
+            listing_products = harvester.products if harvester else {}
+            return {"urls": urls, "url_keywords": scraper.url_keywords, "timings": scraper.timings,
+                    "listing_products": {u: asdict(p) for u, p in listing_products.items()},
+                    "listing_sources": harvester.sources if harvester else {}}
+        products = await scraper.scrape_product_urls(
+            item.payload["urls"], item.payload.get("url_keywords"),
+            [StrollerProduct(**d) for d in item.payload.get("listing_products", {}).values()],
+            item.payload.get("listing_sources"),
+        )
+        return {
+            "products": [asdict(normalize_product(p)) for p in products],
+            "scraped": lease_progress.scraped,
+            "detail_pages": scraper.timings.get("detail_pages", 0),
+        }
+
+    logger.info(f"Worker {worker_id} polling {queue_path}")
+    idle_since = time.monotonic()
+    async with BrowserPool(headless=headless) as pool:
+        while True:
+            item = wq.lease(worker_id)
+            if item is None:
+                if idle_exit is not None and time.monotonic() - idle_since > idle_exit:
+                    logger.info(f"Worker {worker_id} idle for {idle_exit}s — exiting")
+                    return
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+
+            logger.info(f"Leased {item.kind} item {item.id} for {item.retailer} (attempt {item.attempts})")
+            heartbeat = asyncio.create_task(_heartbeat(wq, item, worker_id))
+            try:
+                result = await process(item, pool)
+                wq.complete(item.id, worker_id, result)
+            except Exception as e:
+                logger.exception(f"Item {item.id} ({item.retailer}) failed")
+                wq.fail(item.id, worker_id, str(e))
+            finally:
+                heartbeat.cancel()
+                idle_since = time.monotonic()
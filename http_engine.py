@@ -0,0 +1,244 @@
+import asyncio
+import json
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from typing import Dict, List, Optional, Tuple
+
+from anti_bot import get_random_user_agent
+from rate_limiter import HostRateLimiter, RateLimitedError, host_of, parse_retry_after
+
+try:
+    import httpx
+except ImportError:  # optional — retailers fall back to the browser without it
+    httpx = None
+
+HTTP2 = find_spec("h2") is not None  # httpx only speaks HTTP/2 with the h2 package
+
+
+def http_available() -> bool:
+    return httpx is not None
+
+
+# ── HTML parsing ──
+
+class HtmlDocument(HTMLParser):
+    """What the scrapers read from server-rendered HTML, parsed in one pass.
+
+    Collects JSON-LD blocks, __NEXT_DATA__, <meta> tags, link hrefs, the
+    first <h1> and spec pairs (two-cell table rows and dt/dd), so a product
+    page can be mapped without a browser. Spec keys are lowercased with
+    trailing colons stripped, like _extract_spec_pairs.
+    """
+
+    def __init__(self, html: str, url: str = ""):
+        super().__init__(convert_charrefs=True)
+        self.url = url
+        self.json_ld: List = []
+        self.next_data: Optional[dict] = None
+        self.meta: Dict[str, str] = {}
+        self.links: List[str] = []
+        self.h1 = ""
+        self.specs: Dict[str, str] = {}
+        self._capture: Optional[str] = None  # what the text being read belongs to
+        self._text: List[str] = []
+        self._cells: List[str] = []
+        self._dt = ""
+        self.feed(html)
+        self.close()
+
+    def _start(self, what: str):
+        self._capture = what
+        self._text = []
+
+    def _end(self) -> str:
+        self._capture = None
+        return " ".join("".join(self._text).split())
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script":
+            if (attrs.get("type") or "").lower() == "application/ld+json":
+                self._start("ld")
+            elif attrs.get("id") == "__NEXT_DATA__":
+                self._start("next")
+        elif tag == "meta":
+            key = attrs.get("property") or attrs.get("name") or attrs.get("itemprop")
+            if key and attrs.get("content") and key.lower() not in self.meta:
+                self.meta[key.lower()] = attrs["content"].strip()
+        elif tag == "a" and attrs.get("href"):
+            self.links.append(attrs["href"].strip())
+        elif tag == "h1" and not self.h1 and self._capture is None:
+            self._start("h1")
+        elif tag == "tr":
+            self._cells = []
+        elif tag in ("th", "td", "dt", "dd") and self._capture is None:
+            self._start(tag)
+
+    def handle_endtag(self, tag):
+        what = self._capture
+        if tag == "script" and what in ("ld", "next"):
+            raw = "".join(self._text)
+            self._capture = None
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                return
+            if what == "ld":
+                self.json_ld.append(data)
+            elif isinstance(data, dict):
+                self.next_data = data
+        elif tag == "h1" and what == "h1":
+            self.h1 = self._end()
+        elif tag in ("th", "td") and what in ("th", "td"):
+            self._cells.append(self._end())
+        elif tag == "tr":
+            if len(self._cells) == 2:
+                self._add_spec(*self._cells)
+            self._cells = []
+        elif tag == "dt" and what == "dt":
+            self._dt = self._end()
+        elif tag == "dd" and what == "dd":
+            value = self._end()
+            if self._dt:
+                self._add_spec(self._dt, value)
+            self._dt = ""
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._text.append(data)
+
+    def _add_spec(self, label: str, value: str):
+        key = label.strip().rstrip(":").strip().lower()
+        if key and value:
+            self.specs[key] = value
+
+    def json_ld_product(self) -> Optional[dict]:
+        """The first JSON-LD Product, looking inside lists and @graph."""
+        for data in self.json_ld:
+            candidates = data if isinstance(data, list) else [data]
+            if isinstance(data, dict) and isinstance(data.get("@graph"), list):
+                candidates = [data] + data["@graph"]
+            for item in candidates:
+                if isinstance(item, dict) and item.get("@type") in ("Product", "ProductGroup"):
+                    return item
+        return None
+
+    def links_containing(self, fragment: str) -> List[str]:
+        """Every href containing ``fragment``, without query strings, once each."""
+        return list(dict.fromkeys(h.split("?")[0] for h in self.links if fragment in h))
+
+
+class _TextParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.items: List[str] = []
+        self._item: Optional[List[str]] = None
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag == "li":
+            self._item = []
+        if tag in ("p", "br", "li", "div", "tr", "h2", "h3", "h4"):
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self._skip = max(0, self._skip - 1)
+        elif tag == "li" and self._item is not None:
+            text = " ".join("".join(self._item).split())
+            if text:
+                self.items.append(text)
+            self._item = None
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        self.parts.append(data)
+        if self._item is not None:
+            self._item.append(data)
+
+
+def html_text(fragment: str) -> Tuple[str, List[str]]:
+    """The text of an HTML fragment on one line, and its list items."""
+    parser = _TextParser()
+    parser.feed(fragment or "")
+    parser.close()
+    return " ".join("".join(parser.parts).split()), parser.items
+
+
+# ── Engine ──
+
+class HttpEngine:
+    """Plain HTTP client for pages that don't need a browser to render.
+
+    One httpx.AsyncClient per retailer keeps connections alive between
+    requests, speaks HTTP/2 when h2 is installed and accepts compressed
+    bodies. Requests are paced by the shared HostRateLimiter like page
+    navigations, and at most ``max_per_host`` are in flight per host.
+    """
+
+    def __init__(self, rate_limiter: Optional[HostRateLimiter] = None, user_agent: str = "",
+                 timeout: float = 15.0, max_per_host: int = 6):
+        if httpx is None:
+            raise RuntimeError("httpx is not installed")
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.max_per_host = max_per_host
+        self.requests = 0
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._client = httpx.AsyncClient(
+            http2=HTTP2,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=4 * max_per_host),
+            headers={
+                "User-Agent": user_agent or get_random_user_agent(),
+                "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-AE,en;q=0.9",
+            },
+        )
+
+    async def __aenter__(self) -> "HttpEngine":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """Send one request once the host's limiter allows it.
+
+        429s (and 503s with Retry-After) slow the host down and raise
+        RateLimitedError, like BaseStrollerScraper._goto; other error
+        statuses raise httpx.HTTPStatusError.
+        """
+        host = host_of(url)
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with slots:
+            await self.rate_limiter.acquire(url)
+            response = await self._client.request(method, url, **kwargs)
+        self.requests += 1
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if response.status_code == 429 or (response.status_code == 503 and retry_after is not None):
+            self.rate_limiter.penalize(url, retry_after)
+            raise RateLimitedError(f"HTTP {response.status_code} for {url}")
+        response.raise_for_status()
+        return response
+
+    async def get_html(self, url: str, **kwargs) -> HtmlDocument:
+        response = await self.request("GET", url, **kwargs)
+        return HtmlDocument(response.text, str(response.url))
+
+    async def get_json(self, url: str, **kwargs):
+        headers = {"Accept": "application/json", **kwargs.pop("headers", {})}
+        response = await self.request("GET", url, headers=headers, **kwargs)
+        return response.json()
+
+    async def post_json(self, url: str, payload, **kwargs):
+        headers = {"Accept": "application/json", **kwargs.pop("headers", {})}
+        response = await self.request("POST", url, json=payload, headers=headers, **kwargs)
+        return response.json()
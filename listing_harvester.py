@@ -0,0 +1,178 @@
+import logging
+from typing import Callable, Dict, List, Optional
+
+from models import DATA_FIELDS, StrollerProduct
+
+# Keys listing APIs (Algolia, Magento, SFCC, custom) use for each card value,
+# most specific first
+URL_KEYS = ("url", "productUrl", "product_url", "pdpUrl", "canonicalUrl", "link", "href", "url_key", "slug")
+NAME_KEYS = ("name", "title", "productName", "product_name", "displayName")
+BRAND_KEYS = ("brand", "brandName", "brand_name", "designer", "designerName", "vendor", "manufacturer")
+PRICE_KEYS = ("finalPrice", "final_price", "salePrice", "sale_price", "sellingPrice", "special_price",
+              "price", "priceValue", "price_value", "amount")
+IMAGE_KEYS = ("image", "imageUrl", "image_url", "thumbnail", "thumbnail_url", "small_image", "images", "media")
+# Inside a price object
+PRICE_VALUE_KEYS = ("AED", "aed", "final", "special", "sale", "current", "value", "amount", "default", "regular")
+
+
+def _text(value) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):  # localised {"en": ...} or {"name": ...}
+        for key in ("en", "name", "label", "value"):
+            if isinstance(value.get(key), str):
+                return value[key].strip()
+    if isinstance(value, list) and value:
+        return _text(value[0])
+    return ""
+
+
+def parse_price(value) -> str:
+    """A price from a number, string or price object, as an "AED ..." string."""
+    if isinstance(value, bool):
+        return ""
+    if isinstance(value, (int, float)):
+        return f"AED {value}" if value else ""
+    if isinstance(value, str):
+        value = value.strip()
+        if not any(c in "123456789" for c in value):  # no digits, or "0.00"
+            return ""
+        return value if any(c.isalpha() for c in value) else f"AED {value}"
+    if isinstance(value, dict):
+        for key in PRICE_VALUE_KEYS:
+            if key in value:
+                found = parse_price(value[key])
+                if found:
+                    return found
+    return ""
+
+
+def _image(value) -> str:
+    if isinstance(value, str):
+        return value.strip() if value.startswith(("http", "//", "/")) else ""
+    if isinstance(value, list) and value:
+        return _image(value[0])
+    if isinstance(value, dict):
+        for key in ("url", "src", "href", "large", "medium", "small"):
+            found = _image(value.get(key))
+            if found:
+                return found
+    return ""
+
+
+def _first(record: dict, keys, read) -> str:
+    for key in keys:
+        if key in record:
+            found = read(record[key])
+            if found:
+                return found
+    return ""
+
+
+def fill_missing(product: StrollerProduct, other: StrollerProduct) -> List[str]:
+    """Copy into ``product`` every data field it lacks that ``other`` has.
+
+    Returns the names of the fields filled in.
+    """
+    filled = []
+    for name in DATA_FIELDS:
+        if not getattr(product, name) and getattr(other, name):
+            setattr(product, name, getattr(other, name))
+            filled.append(name)
+    return filled
+
+
+class ListingHarvester:
+    """Keeps the product data a listing page's own JSON responses carry.
+
+    SPAs fetch every card's name, brand, price, image and URL as JSON while
+    the listing scrolls. Attached to the listing page, this parses those
+    responses into partial StrollerProducts keyed by product URL, so the
+    detail scrape only has to fill in what they lack. ``to_url`` maps a
+    string from the JSON to an absolute product URL, or None. Fast mode also
+    adds what the listing's cards show through ``add``; ``sources`` records
+    which of them supplied each field.
+    """
+
+    def __init__(self, to_url: Callable[[str], Optional[str]], retailer: str = ""):
+        self.to_url = to_url
+        self.retailer = retailer
+        self.products: Dict[str, StrollerProduct] = {}
+        self.sources: Dict[str, Dict[str, str]] = {}  # url -> field -> "listing-api", "card", ...
+        self.responses = 0
+        self.logger = logging.getLogger("harvester")
+
+    def attach(self, page):
+        page.on("response", self._on_response)
+
+    def detach(self, page):
+        try:
+            page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+    def get(self, url: str) -> Optional[StrollerProduct]:
+        return self.products.get(url)
+
+    def add(self, product: StrollerProduct, source: str):
+        existing = self.products.get(product.link)
+        if existing:
+            filled = fill_missing(existing, product)
+        else:
+            self.products[product.link] = product
+            filled = [name for name in DATA_FIELDS if getattr(product, name)]
+        fields = self.sources.setdefault(product.link, {})
+        for name in filled:
+            fields[name] = source
+
+    async def _on_response(self, response):
+        try:
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
+            if "json" not in response.headers.get("content-type", ""):
+                return
+            data = await response.json()
+        except Exception:
+            return  # body gone with a navigation, or not JSON after all
+        found = self.harvest(data)
+        if found:
+            self.responses += 1
+            self.logger.debug(f"{self.retailer}: {found} products from {response.url}")
+
+    def harvest(self, data) -> int:
+        """Collect every product-looking object in a JSON document; returns how many."""
+        found = 0
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                product = self._parse(node)
+                if product:
+                    self.add(product, "listing-api")
+                    found += 1
+                else:
+                    stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        return found
+
+    def _parse(self, record: dict) -> Optional[StrollerProduct]:
+        url = ""
+        for key in URL_KEYS:
+            value = record.get(key)
+            if isinstance(value, dict):
+                value = _text(value)
+            if isinstance(value, str) and value:
+                url = self.to_url(value.strip()) or ""
+                if url:
+                    break
+        name = _first(record, NAME_KEYS, _text)
+        if not url or not name:
+            return None
+        return StrollerProduct(
+            product=name,
+            brand=_first(record, BRAND_KEYS, _text),
+            price=_first(record, PRICE_KEYS, parse_price),
+            image_url=_first(record, IMAGE_KEYS, _image),
+            link=url,
+        )
@@ -7,9 +7,16 @@ Scrapes baby products from 22 UAE online retailers.
 Usage:
     python -m stroller_scraper.main                          # All retailers, default keyword
     python -m stroller_scraper.main --keyword cribs          # Search for cribs
+    python -m stroller_scraper.main --keyword strollers prams "car seats"   # Several in one job
     python -m stroller_scraper.main --retailers Mumzworld    # Specific retailer(s)
     python -m stroller_scraper.main --resume                 # Resume interrupted run
     python -m stroller_scraper.main --headful                # Show browser window
+    python -m stroller_scraper.main --jobs 4                 # Scrape 4 retailers at a time
+    python -m stroller_scraper.main --jobs 8 --processes 4   # ...spread over 4 CPU cores
+    python -m stroller_scraper.main --queue state/queue.db   # Hand work to queue workers
+    python -m stroller_scraper.main --worker --queue state/queue.db   # Run a queue worker
+    python -m stroller_scraper.main --persistent-profile     # Reuse cache/cookies between runs
+    python -m stroller_scraper.main --clear-profiles         # Delete saved browser profiles
     python -m stroller_scraper.main --list                   # List all retailers
 """
 
@@ -22,6 +29,13 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from retailers import get_scraper_registry
+from browser_pool import BrowserPool
+from rate_limiter import HostRateLimiter
+from concurrency import ConcurrencyStore
+from run_history import RunHistory
+from profiles import ProfileStore
+from sharding import run_sharded
+from distributed import run_coordinated, run_worker
 from exporter import export_combined_csv, normalize_product
 from progress import ProgressTracker
 
@@ -35,8 +49,57 @@ async def run_all_scrapers(
     progress_callback=None,
     should_stop=None,
     should_skip=None,
+    max_parallel_retailers=1,
+    browser_pool=None,
+    rate_limiter=None,
+    state_dir=None,
+    processes=0,
+    work_queue=None,
+    keywords=None,
+    persistent_profiles=False,
+    fast=False,
 ):
-    """Main scraping orchestration. Can be called from CLI or Flask."""
+    """Main scraping orchestration. Can be called from CLI or Flask.
+
+    Pass ``keywords`` to search several keywords in one job: each retailer
+    is searched once per keyword, product pages found by more than one are
+    scraped once, and every product lists the keywords that found it.
+
+    Up to ``max_parallel_retailers`` retailers are scraped at the same time.
+    Every retailer is a different host, so running several at once overlaps
+    their idle network waits without hitting any single site harder.
+
+    All retailers share one Chromium (each in its own isolated context).
+    Pass ``browser_pool`` to reuse a browser the caller already owns;
+    otherwise one is launched for this run and closed at the end.
+    Navigation is paced per host by ``rate_limiter`` (a fresh
+    HostRateLimiter unless the caller shares one across runs).
+
+    Things learned about retailers that should outlive a single job (such
+    as each retailer's comfortable concurrency) are kept in ``state_dir``,
+    which defaults to ``output_dir``. That includes how long each retailer
+    took last time: retailers expected to take longest are started first
+    and the opening message predicts the total duration.
+
+    With ``persistent_profiles`` each retailer keeps a Chromium profile
+    (HTTP cache, cookies, storage) under ``state_dir``/profiles between
+    runs, trimmed to PROFILE_MAX_MB least-recently-used first.
+
+    With ``fast`` a product whose listing card (or listing JSON) already
+    has every REQUIRED_FIELDS value is taken from there without visiting its
+    detail page; the "Field Sources" column says where each value came from.
+
+    With ``processes`` > 1 the retailers are spread over that many worker
+    processes (see sharding.py) instead of sharing this event loop; the
+    combined output is the same either way.
+
+    With ``work_queue`` (path to an SQLite file) nothing is scraped here:
+    the work is queued for ``--worker`` processes, possibly in other
+    containers sharing the file, and their results are collected as they
+    come back (see distributed.py).
+    """
+    keywords = list(dict.fromkeys(k for k in (keywords or [keyword]) if k))
+    keyword = keywords[0]
     os.makedirs(output_dir, exist_ok=True)
     progress = ProgressTracker(output_dir)
 
@@ -48,80 +111,185 @@ async def run_all_scrapers(
         if progress_callback:
             progress_callback(msg, percent)
 
-    all_products = []
     registry = get_scraper_registry()
     targets = retailers or list(registry.keys())
+    rate_limiter = rate_limiter or HostRateLimiter()
+    concurrency_store = ConcurrencyStore(state_dir or output_dir)
+    history = RunHistory(state_dir or output_dir)
+    profile_root = os.path.join(state_dir or output_dir, "profiles")
+    profile_store = None
+    if persistent_profiles:
+        profile_store = ProfileStore(profile_root)
+        profile_store.enforce_cap()
 
     total = len(targets)
     completed = 0
+    started = 0
     failed = []
-
-    log(f"Starting scrape for \"{keyword}\" across {total} retailer{'s' if total != 1 else ''}...", 0)
-
     skipped = []
+    stop_logged = False
+
+    # Products per retailer, filled in as retailers finish (in any order).
+    # Combined output is always assembled in ``targets`` order so the CSV
+    # doesn't depend on which retailer happened to finish first.
+    results = {}
+
+    def collected():
+        return [p for name in targets for p in results.get(name, [])]
+
+    def percent():
+        return int((completed / total) * 100)
+
+    # Work out what will actually run up front so the opening message can
+    # say how long it should take
+    unknown = [name for name in targets if name not in registry]
+    already_done = [name for name in targets
+                    if name in registry and resume and progress.is_retailer_done(name)]
+    pending = [name for name in targets if name in registry and name not in already_done]
+    parallel = max(1, max_parallel_retailers or 1)
+    pending, makespan = history.schedule(pending, parallel)
+
+    eta = f" (expected ~{max(1, round(makespan / 60))} min)" if makespan else ""
+    quoted = ", ".join(f'"{k}"' for k in keywords)
+    log(f"Starting scrape for {quoted} across {total} retailer{'s' if total != 1 else ''}{eta}...", 0)
+
+    # on_status sends per-product messages to the UI
+    def _make_status_cb(cb):
+        def _cb(msg):
+            if cb:
+                cb(msg)
+        return _cb
+
+    def log_stopped():
+        nonlocal stop_logged
+        if not stop_logged:
+            stop_logged = True
+            count = len(collected())
+            log(f"STOPPED — {count} products collected from {completed}/{total} retailers", percent())
+
+    def retailer_started(name):
+        nonlocal started
+        started += 1
+        log(f"Scraping: {name} ({started}/{total})", percent())
+
+    def retailer_finished(name, products, was_skipped, timings=None):
+        nonlocal completed
+        results[name] = products
+        completed += 1
+        # Skipped or stopped runs would teach the history the wrong durations
+        if timings and not was_skipped and not (should_stop and should_stop()):
+            history.record(name, timings)
+
+        if was_skipped:
+            skipped.append(name)
+            progress.mark_retailer_failed(name, "skipped by user")
+            log(f"[SKIP] {name}: skipped by user ({len(products)} products collected)", percent())
+        else:
+            progress.mark_retailer_done(name)
+            all_so_far = collected()
+            partial_path = os.path.join(output_dir, "products_partial.csv")
+            export_combined_csv(all_so_far, partial_path)
+            log(f"[OK] {name}: {len(products)} products scraped (total so far: {len(all_so_far)})", percent())
+
+    def retailer_failed(name, error):
+        nonlocal completed
+        progress.mark_retailer_failed(name, error)
+        failed.append(name)
+        completed += 1
+        log(f"[FAIL] {name}: {error}", percent())
+
+    async def scrape_retailer(name, semaphore, pool):
+        async with semaphore:
+            # Check if user requested full stop
+            if should_stop and should_stop():
+                log_stopped()
+                return
+
+            retailer_started(name)
+
+            scraper = registry[name](
+                progress=progress,
+                headless=headless,
+                keyword=keyword,
+                keywords=keywords,
+                on_status=_make_status_cb(progress_callback),
+                should_stop=should_stop,
+                should_skip=should_skip,
+                browser_pool=pool,
+                rate_limiter=rate_limiter,
+                concurrency_store=concurrency_store,
+                profile_store=profile_store,
+                fast=fast,
+            )
+
+            try:
+                products = await scraper.run()
+            except Exception as e:
+                logging.exception(f"Failed to scrape {name}")
+                retailer_failed(name, str(e))
+                return
 
-    for name in targets:
-        # Check if user requested full stop
-        if should_stop and should_stop():
-            log(f"STOPPED — {len(all_products)} products collected from {completed}/{total} retailers", int((completed / total) * 100))
-            break
-
-        if name not in registry:
-            log(f"[WARN] Unknown retailer: {name}")
-            continue
-
-        if resume and progress.is_retailer_done(name):
-            log(f"[SKIP] {name} (already completed)")
-            completed += 1
-            continue
-
-        retailer_pct = int((completed / total) * 100)
-        log(f"Scraping: {name} ({completed + 1}/{total})", retailer_pct)
-
-        scraper_cls = registry[name]
-
-        # on_status sends per-product messages to the UI
-        def _make_status_cb(cb):
-            def _cb(msg):
-                if cb:
-                    cb(msg)
-            return _cb
-
-        scraper = scraper_cls(
-            progress=progress,
-            headless=headless,
-            keyword=keyword,
+            # Check if this retailer was skipped mid-scrape
+            was_skipped = getattr(scraper, '_was_skipped', False)
+            retailer_finished(name, [normalize_product(p) for p in products], was_skipped,
+                              scraper.timings)
+
+    for name in unknown:
+        log(f"[WARN] Unknown retailer: {name}")
+    for name in already_done:
+        log(f"[SKIP] {name} (already completed)")
+        completed += 1
+        started += 1
+
+    if pending and work_queue:
+        await run_coordinated(
+            pending,
+            work_queue,
+            {"keywords": keywords, "fast": fast},
+            progress,
+            on_started=retailer_started,
             on_status=_make_status_cb(progress_callback),
+            on_finished=retailer_finished,
+            on_failed=retailer_failed,
             should_stop=should_stop,
             should_skip=should_skip,
         )
-
+        if should_stop and should_stop() and started < total:
+            log_stopped()
+    elif pending and processes and processes > 1:
+        await run_sharded(
+            pending,
+            processes,
+            {
+                "headless": headless,
+                "keyword": keyword,
+                "keywords": keywords,
+                "fast": fast,
+                "profile_root": profile_root if persistent_profiles else None,
+                "state_dir": state_dir or output_dir,
+                # Split the overall parallelism between the worker processes
+                "retailers_per_process": max(1, -(-parallel // processes)),
+            },
+            progress,
+            on_started=retailer_started,
+            on_status=_make_status_cb(progress_callback),
+            on_finished=retailer_finished,
+            on_failed=retailer_failed,
+            should_stop=should_stop,
+            should_skip=should_skip,
+        )
+        if should_stop and should_stop() and started < total:
+            log_stopped()
+    elif pending:
+        semaphore = asyncio.Semaphore(parallel)
+        pool = browser_pool or BrowserPool(headless=headless)
         try:
-            products = await scraper.run()
+            await asyncio.gather(*(scrape_retailer(name, semaphore, pool) for name in pending))
+        finally:
+            if browser_pool is None:
+                await pool.close()
 
-            # Check if this retailer was skipped mid-scrape
-            was_skipped = getattr(scraper, '_was_skipped', False)
-
-            products = [normalize_product(p) for p in products]
-            all_products.extend(products)
-            completed += 1
-
-            if was_skipped:
-                skipped.append(name)
-                progress.mark_retailer_failed(name, "skipped by user")
-                log(f"[SKIP] {name}: skipped by user ({len(products)} products collected)", int((completed / total) * 100))
-            else:
-                progress.mark_retailer_done(name)
-                partial_path = os.path.join(output_dir, "products_partial.csv")
-                export_combined_csv(all_products, partial_path)
-                log(f"[OK] {name}: {len(products)} products scraped (total so far: {len(all_products)})", int((completed / total) * 100))
-
-        except Exception as e:
-            logging.exception(f"Failed to scrape {name}")
-            progress.mark_retailer_failed(name, str(e))
-            failed.append(name)
-            completed += 1
-            log(f"[FAIL] {name}: {e}", int((completed / total) * 100))
+    all_products = collected()
 
     # Only show DONE summary if we weren't stopped early (app.py handles that message)
     if not (should_stop and should_stop()):
@@ -143,12 +311,30 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument("--retailers", nargs="+", help="Specific retailer(s)")
-    parser.add_argument("--keyword", default="strollers", help="Product keyword (default: strollers)")
+    parser.add_argument("--keyword", nargs="+", default=["strollers"],
+                        help="Product keyword(s); several are searched in one job (default: strollers)")
     parser.add_argument("--resume", action="store_true", help="Resume from checkpoint")
     parser.add_argument("--headful", action="store_true", help="Show browser")
     parser.add_argument("--output", default="output/uae_products.csv", help="Output CSV")
     parser.add_argument("--output-dir", default="output", help="Output directory")
     parser.add_argument("--list", action="store_true", help="List retailers")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of retailers to scrape in parallel (default: 1)")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Spread retailers over this many worker processes (default: off)")
+    parser.add_argument("--persistent-profile", action="store_true",
+                        help="Keep a browser profile (HTTP cache, cookies) per retailer between runs")
+    parser.add_argument("--fast", action="store_true",
+                        help="Take name/brand/price/image from listing cards; visit product pages only for gaps")
+    parser.add_argument("--clear-profiles", action="store_true",
+                        help="Delete the saved browser profiles and exit")
+    parser.add_argument("--queue", metavar="PATH",
+                        help="SQLite work queue shared with worker containers (coordinator mode)")
+    parser.add_argument("--worker", action="store_true",
+                        help="Run as a queue worker instead of coordinating a scrape (needs --queue)")
+    parser.add_argument("--worker-id", help="Worker name in the queue (default: host-pid)")
+    parser.add_argument("--idle-exit", type=float,
+                        help="Worker exits after this many idle seconds (default: run forever)")
 
     args = parser.parse_args()
 
@@ -159,6 +345,11 @@ def main():
         print(f"\nTotal: {len(get_scraper_registry())} retailers")
         return
 
+    if args.clear_profiles:
+        removed = ProfileStore(os.path.join(args.output_dir, "profiles")).clear()
+        print(f"Removed {removed} browser profile{'s' if removed != 1 else ''}")
+        return
+
     os.makedirs(args.output_dir, exist_ok=True)
     logging.basicConfig(
         level=logging.INFO,
@@ -169,13 +360,31 @@ def main():
         ],
     )
 
+    if args.worker:
+        if not args.queue:
+            parser.error("--worker needs --queue")
+        asyncio.run(run_worker(
+            args.queue,
+            worker_id=args.worker_id,
+            headless=not args.headful,
+            state_dir=args.output_dir,
+            idle_exit=args.idle_exit,
+            persistent_profiles=args.persistent_profile,
+        ))
+        return
+
     products = asyncio.run(
         run_all_scrapers(
             retailers=args.retailers,
             headless=not args.headful,
             resume=args.resume,
             output_dir=args.output_dir,
-            keyword=args.keyword,
+            keywords=args.keyword,
+            max_parallel_retailers=args.jobs,
+            processes=args.processes,
+            work_queue=args.queue,
+            persistent_profiles=args.persistent_profile,
+            fast=args.fast,
         )
     )
 
@@ -1,6 +1,12 @@
 from dataclasses import dataclass, field, fields, asdict
 from typing import Optional
 
+# Fields that hold scraped data (as opposed to bookkeeping like link or keywords)
+DATA_FIELDS = (
+    "brand", "product", "description", "make", "weight", "features", "color",
+    "frame_color", "suitable_for", "price", "travel_friendly", "image_url",
+)
+
 
 @dataclass
 class StrollerProduct:
@@ -21,6 +27,8 @@ class StrollerProduct:
     travel_friendly: str = ""
     image_url: str = ""
     scraped_at: str = ""
+    keywords: str = ""  # search keywords that found this product, "; "-separated
+    field_sources: str = ""  # e.g. "card: product, price; detail: weight"
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -31,7 +39,7 @@ class StrollerProduct:
             "Retailer", "Brand", "Product", "Description", "Make", "Weight",
             "Features", "Color", "Frame Color", "Suitable For", "Price",
             "Price (AED)", "Currency", "Link", "Travel Friendly", "Image URL",
-            "Scraped At",
+            "Scraped At", "Keywords", "Field Sources",
         ]
 
     def csv_row(self) -> list:
@@ -41,5 +49,5 @@ class StrollerProduct:
             self.suitable_for, self.price,
             str(self.price_aed) if self.price_aed is not None else "",
             self.currency, self.link, self.travel_friendly, self.image_url,
-            self.scraped_at,
+            self.scraped_at, self.keywords, self.field_sources,
         ]
@@ -1,14 +1,25 @@
 import asyncio
-from anti_bot import random_delay
+import json
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+from rate_limiter import parse_retry_after
 
-async def paginate_by_url(page, base_url, param_name="page", start=1,
-                          max_pages=50, product_selector="a", base_url_has_params=False):
+
+async def paginate_by_url(scraper, page, base_url, param_name="page", start=1,
+                          max_pages=50, product_selector="a", base_url_has_params=False,
+                          ready_cap=5.0):
+    """Collect hrefs from ``base_url`` and its numbered pages until one has none.
+
+    Pages are loaded through ``scraper._goto`` (so they wait for the host's
+    rate limiter and back off on 429) and read as soon as a
+    ``product_selector`` match appears, after at most ``ready_cap`` seconds.
+    """
     all_urls = []
     for page_num in range(start, start + max_pages):
         sep = "&" if base_url_has_params else "?"
         url = f"{base_url}{sep}{param_name}={page_num}" if page_num > start else base_url
-        await page.goto(url, wait_until="networkidle", timeout=30000)
+        await scraper._goto(page, url)
+        await scraper._wait_ready(page, (product_selector,), cap=ready_cap)
 
         links = await page.query_selector_all(product_selector)
         if not links:
@@ -24,13 +35,18 @@ async def paginate_by_url(page, base_url, param_name="page", start=1,
             break
 
         all_urls.extend(new_urls)
-        await random_delay(1.5, 3.0)
 
     return list(dict.fromkeys(all_urls))
 
 
-async def paginate_by_load_more(page, button_selector, product_selector,
-                                 max_clicks=30, wait_after_click=2.0):
+async def paginate_by_load_more(scraper, page, button_selector, product_selector,
+                                max_clicks=30, wait_after_click=2.0):
+    """Click a load-more button until it goes away; returns the hrefs shown.
+
+    Each click waits for the host's rate limiter, then for more
+    ``product_selector`` matches to render, for at most ``wait_after_click``
+    seconds.
+    """
     for _ in range(max_clicks):
         btn = await page.query_selector(button_selector)
         if not btn:
@@ -40,11 +56,13 @@ async def paginate_by_load_more(page, button_selector, product_selector,
             if not visible:
                 break
             await btn.scroll_into_view_if_needed()
+            shown = await page.eval_on_selector_all(product_selector, "els => els.length")
+            await scraper.rate_limiter.acquire(page.url)
             await btn.click()
-            await asyncio.sleep(wait_after_click)
-            await random_delay(0.3, 1.0)
         except Exception:
             break
+        await scraper._wait_ready(page, ({"selector": product_selector, "more_than": shown},),
+                                  cap=wait_after_click)
 
     links = await page.query_selector_all(product_selector)
     urls = []
@@ -73,3 +91,224 @@ async def paginate_by_scroll(page, product_selector, max_scrolls=50, scroll_paus
         if href:
             urls.append(href)
     return list(dict.fromkeys(urls))
+
+
+# ── Load-more API replay ──
+
+PAGE_KEYS = ("page", "p", "currentPage", "current_page", "pageNumber", "page_number", "pageIndex")
+OFFSET_KEYS = ("offset", "start", "from", "skip")
+SIZE_KEYS = ("limit", "size", "pageSize", "page_size", "hitsPerPage", "rows", "perPage", "per_page")
+SKIP_HEADERS = {"content-length", "host", "connection", "cookie", "accept-encoding"}
+
+
+def _find_paging(params):
+    """(key, kind, value, size) for the paging parameter of a flat dict, else None."""
+    size = next((int(params[k]) for k in SIZE_KEYS if str(params.get(k, "")).isdigit()), None)
+    for keys, kind in ((OFFSET_KEYS, "offset"), (PAGE_KEYS, "page")):
+        for key in keys:
+            if str(params.get(key, "")).isdigit():
+                return key, kind, int(params[key]), size
+    return None
+
+
+class _PagedRequest:
+    """A captured load-more request that can be re-issued for any later page.
+
+    The paging parameter is looked for in the query string, a form body, a
+    JSON body (at any depth) and URL-encoded strings inside JSON, as Algolia
+    sends them.
+    """
+
+    def __init__(self, url, method, headers, body):
+        self.url, self.method, self.headers, self.body = url, method, headers, body
+        self.paging = None  # (location, key, kind, value, size)
+        self._json = None
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        found = _find_paging(query)
+        if found:
+            self.paging = ("query",) + found
+        elif body:
+            try:
+                self._json = json.loads(body)
+            except ValueError:
+                found = _find_paging(dict(parse_qsl(body)))
+                if found:
+                    self.paging = ("form",) + found
+            else:
+                found = self._find_in_json(self._json)
+                if found:
+                    self.paging = ("json",) + found
+
+    def _find_in_json(self, node):
+        if isinstance(node, dict):
+            found = _find_paging(node)
+            if found:
+                return found
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        elif isinstance(node, str) and "=" in node:
+            return _find_paging(dict(parse_qsl(node)))
+        else:
+            return None
+        for child in children:
+            found = self._find_in_json(child)
+            if found:
+                return found
+        return None
+
+    def _with_value(self, params, key, value):
+        if isinstance(params, dict):
+            if key in params and str(params[key]).isdigit():
+                params = dict(params)
+                params[key] = value if isinstance(params[key], int) else str(value)
+                return params, True
+            for k, v in params.items():
+                new, done = self._with_value(v, key, value)
+                if done:
+                    return {**params, k: new}, True
+        elif isinstance(params, list):
+            for i, v in enumerate(params):
+                new, done = self._with_value(v, key, value)
+                if done:
+                    return params[:i] + [new] + params[i + 1:], True
+        elif isinstance(params, str) and "=" in params:
+            pairs = parse_qsl(params, keep_blank_values=True)
+            if any(k == key for k, _ in pairs):
+                return urlencode([(k, value if k == key else v) for k, v in pairs]), True
+        return params, False
+
+    def for_step(self, step: int, page_size: int):
+        """(url, body) for ``step`` pages after the captured one."""
+        location, key, kind, value, _ = self.paging
+        value += step * page_size if kind == "offset" else step
+        if location == "query":
+            parts = urlsplit(self.url)
+            query, _ = self._with_value(urlencode(parse_qsl(parts.query, keep_blank_values=True)), key, value)
+            return urlunsplit(parts._replace(query=query)), self.body
+        if location == "form":
+            return self.url, self._with_value(self.body, key, value)[0]
+        return self.url, json.dumps(self._with_value(self._json, key, value)[0])
+
+
+def _json_urls(data, to_url):
+    """Every product URL ``to_url`` recognises among the strings in a JSON document."""
+    urls = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, str):
+            url = to_url(node)
+            if url:
+                urls.append(url)
+    return list(dict.fromkeys(urls))
+
+
+def _longest_list(data):
+    """Length of the longest list of objects in a JSON document: a page's items."""
+    longest = 0
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(v, dict) for v in node):
+                longest = max(longest, len(node))
+            stack.extend(node)
+    return longest
+
+
+def _is_json_xhr(response):
+    return (response.request.resource_type in ("xhr", "fetch")
+            and "json" in response.headers.get("content-type", ""))
+
+
+async def paginate_by_load_more_api(page, button_selector, to_url, max_pages=30,
+                                    concurrency=4, rate_limiter=None, timeout=10000):
+    """Collect listing URLs by replaying the JSON request behind a load-more button.
+
+    Clicks the button once, captures the JSON XHR it fires and finds the
+    page/offset parameter in it. Then it requests the following pages
+    directly through the page's request context, which shares its cookies.
+    Up to ``concurrency`` pages are fetched at a time, within the rate
+    limiter, until a page adds no new URLs. An offset advances by the
+    request's own size/limit parameter, else by the number of items in the
+    first response. ``to_url`` maps a string from the JSON to an absolute
+    product URL, or None.
+
+    Returns the product URLs found in the responses. Returns None when there
+    is no button or no replayable request, or when a page can't be fetched
+    (a 429 is retried once, after the limiter's backoff), so the caller can
+    fall back to clicking rather than take a failure for the end of the list.
+    """
+    btn = await page.query_selector(button_selector)
+    try:
+        if not btn or not await btn.is_visible():
+            return None
+        await btn.scroll_into_view_if_needed()
+        if rate_limiter:
+            await rate_limiter.acquire(page.url)
+        async with page.expect_response(_is_json_xhr, timeout=timeout) as info:
+            await btn.click()
+        response = await info.value
+        first = await response.json()
+        request = response.request
+        headers = {k: v for k, v in (await request.all_headers()).items()
+                   if not k.startswith(":") and k.lower() not in SKIP_HEADERS}
+        paged = _PagedRequest(request.url, request.method, headers, request.post_data)
+    except Exception:
+        return None
+
+    urls = _json_urls(first, to_url)
+    if not paged.paging or not urls:
+        return None
+    page_size = paged.paging[4] or _longest_list(first) or len(urls)
+    api = page.context.request
+    sem = asyncio.Semaphore(concurrency)
+
+    async def fetch(step):
+        """The step's product URLs, or None if it couldn't be fetched."""
+        url, body = paged.for_step(step, page_size)
+        async with sem:
+            for attempt in range(2):
+                if rate_limiter:
+                    await rate_limiter.acquire(url)
+                try:
+                    resp = await api.fetch(url, method=paged.method, headers=paged.headers,
+                                           data=body, timeout=timeout)
+                except Exception:
+                    return None
+                if resp.status == 429 and rate_limiter:
+                    rate_limiter.penalize(url, parse_retry_after(resp.headers.get("retry-after")))
+                    if not attempt:
+                        continue  # acquire() waits out the penalty first
+                if not resp.ok:
+                    return None
+                try:
+                    return _json_urls(await resp.json(), to_url)
+                except Exception:
+                    return None
+
+    seen = set(urls)
+    step = 1
+    while step < max_pages:
+        wave = range(step, min(step + concurrency, max_pages))
+        results = await asyncio.gather(*(fetch(s) for s in wave))
+        step = wave.stop
+        if any(found is None for found in results):
+            return None
+        exhausted = False
+        for found in results:
+            new = [u for u in found if u not in seen]
+            exhausted = exhausted or not new
+            seen.update(new)
+            urls.extend(new)
+        if exhausted:
+            break
+    return urls
@@ -0,0 +1,143 @@
+import fcntl
+import logging
+import os
+import re
+import shutil
+import socket
+from typing import Dict, Optional
+
+from config import PROFILE_MAX_MB
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass  # Chromium may delete cache entries while we walk
+    return total
+
+
+class ProfileStore:
+    """Per-retailer Chromium profile directories kept between runs.
+
+    A profile keeps the HTTP cache, cookies (consent banners, anti-bot
+    tokens) and local storage, so repeat runs mostly load static assets
+    from disk. Chromium can only open a profile from one browser at a
+    time, so profiles are locked while in use; a retailer whose profile is
+    busy (another job, another worker process) just runs without one.
+    The lock is an flock on a file inside the profile, held for as long as
+    the profile is in use: the kernel drops it when the holder exits or
+    crashes, and it works the same across containers sharing the volume,
+    where PIDs mean nothing.
+    enforce_cap() (run at the start of each run) deletes the least recently
+    used profiles once together they grow past ``max_mb``.
+    """
+
+    LOCK_FILE = "scraper.lock"
+
+    def __init__(self, root: str, max_mb: float = PROFILE_MAX_MB):
+        self.root = root
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.logger = logging.getLogger("profiles")
+        self._locks: Dict[str, int] = {}  # profile path -> fd holding its flock
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, retailer: str) -> str:
+        slug = re.sub(r"[^a-z0-9]+", "-", retailer.lower()).strip("-")
+        return os.path.join(self.root, slug)
+
+    def _try_lock(self, path: str, create: bool) -> Optional[int]:
+        """Open the profile's lock file and flock it; the fd, or None if held elsewhere."""
+        try:
+            fd = os.open(os.path.join(path, self.LOCK_FILE),
+                         os.O_RDWR | (os.O_CREAT if create else 0), 0o644)
+        except OSError:
+            return None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    def _locked(self, path: str) -> bool:
+        if path in self._locks:
+            return True
+        if not os.path.exists(os.path.join(path, self.LOCK_FILE)):
+            return False
+        fd = self._try_lock(path, create=False)
+        if fd is None:
+            return True
+        os.close(fd)  # closing drops the probe's lock
+        return False
+
+    def acquire(self, retailer: str) -> Optional[str]:
+        """Lock and return the retailer's profile directory, or None if busy."""
+        path = self._path(retailer)
+        if path in self._locks:
+            return None
+        os.makedirs(path, exist_ok=True)
+        fd = self._try_lock(path, create=True)
+        if fd is None:
+            return None
+        # Who holds it, for anyone looking at the volume
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{socket.gethostname()}:{os.getpid()}".encode())
+        os.utime(path)  # eviction uses the directory's mtime as "last used"
+        self._locks[path] = fd
+        return path
+
+    def user_agent(self, retailer: str, default: str) -> str:
+        """Keep one user agent per profile so stored cookies and tokens stay valid."""
+        path = os.path.join(self._path(retailer), "user_agent.txt")
+        try:
+            with open(path) as f:
+                stored = f.read().strip()
+            if stored:
+                return stored
+        except OSError:
+            pass
+        with open(path, "w") as f:
+            f.write(default)
+        return default
+
+    def release(self, retailer: str):
+        # The lock file stays: removing it would let a newcomer lock a fresh
+        # file while another process still waits on the old one
+        fd = self._locks.pop(self._path(retailer), None)
+        if fd is not None:
+            os.close(fd)
+
+    def enforce_cap(self):
+        """Delete least recently used profiles until the total fits the cap."""
+        profiles = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if not os.path.isdir(path):
+                continue
+            profiles.append((os.path.getmtime(path), path, _dir_size(path)))
+        total = sum(size for _, _, size in profiles)
+        for _, path, size in sorted(profiles):
+            if total <= self.max_bytes:
+                break
+            if self._locked(path):
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.logger.info(f"Evicted browser profile {os.path.basename(path)} ({size / 1e6:.0f} MB)")
+
+    def clear(self, retailer: Optional[str] = None) -> int:
+        """Delete one retailer's profile, or all of them. Returns how many went."""
+        paths = [self._path(retailer)] if retailer else [
+            os.path.join(self.root, n) for n in os.listdir(self.root)
+        ]
+        removed = 0
+        for path in paths:
+            if not os.path.isdir(path) or self._locked(path):
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        return removed
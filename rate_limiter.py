@@ -0,0 +1,114 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import RATE_LIMIT_RPS, RATE_LIMIT_BURST
+
+
+class RateLimitedError(Exception):
+    """Raised when a site answers 429 so the normal retry path kicks in."""
+
+
+def host_of(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    MIN_RATE = 0.05  # never slow a host below one request per 20s
+    RECOVERY_SECONDS = 60.0  # double the rate again after this long without trouble
+
+    def __init__(self, rate: float, burst: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.last_penalty = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        if self.rate < self.base_rate and now - self.last_penalty > self.RECOVERY_SECONDS:
+            self.rate = min(self.base_rate, self.rate * 2)
+            self.last_penalty = now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        # The lock makes waiters queue up in order instead of racing for tokens
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.MIN_RATE, self.rate / 2)
+        self.tokens = 0.0
+        self.last_penalty = now
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class HostRateLimiter:
+    """Per-host politeness limiter shared by everything that talks to a site.
+
+    Each host gets a token bucket with a requests-per-second rate and a
+    burst size. Only requests to the same host wait on each other, so a slow
+    retailer never holds up the others. A 429 or Retry-After response halves
+    that host's rate (recovering gradually) and pauses it for the requested
+    time.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT_RPS, burst: int = RATE_LIMIT_BURST):
+        self.default_rate = rate
+        self.default_burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def configure(self, url_or_host: str, rate: float, burst: int):
+        """Set the rate for a host unless it's already in use (keeps any penalty)."""
+        host = host_of(url_or_host) if "/" in url_or_host else url_or_host
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(rate, burst)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = host_of(url)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.default_rate, self.default_burst)
+        return bucket
+
+    async def acquire(self, url: str):
+        await self._bucket(url).acquire()
+
+    def penalize(self, url: str, retry_after: Optional[float] = None):
+        self._bucket(url).penalize(retry_after)
+
+    def current_rate(self, url: str) -> float:
+        return self._bucket(url).rate
@@ -0,0 +1,79 @@
+from typing import Iterable
+
+from rate_limiter import host_of
+
+# Nothing the scrapers read comes from these: the DOM, JSON-LD and image
+# URLs (as strings) are all there without them.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+BLOCKED_HOSTS = (
+    # Analytics / tag managers
+    "google-analytics.com", "googletagmanager.com", "analytics.google.com",
+    "clarity.ms", "hotjar.com", "hotjar.io", "segment.io", "segment.com",
+    "mixpanel.com", "amplitude.com", "newrelic.com", "nr-data.net",
+    "quantummetric.com", "contentsquare.net", "mouseflow.com", "yandex.ru",
+    # Ads / retargeting pixels
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+    "facebook.net", "facebook.com", "connect.facebook.net", "criteo.com",
+    "criteo.net", "tiktok.com", "analytics.tiktok.com", "snapchat.com",
+    "sc-static.net", "bat.bing.com", "ads.linkedin.com", "pinterest.com",
+    "taboola.com", "outbrain.com", "adroll.com",
+    # Chat / support widgets
+    "intercom.io", "intercomcdn.com", "zopim.com", "zdassets.com",
+    "livechatinc.com", "tawk.to", "freshchat.com", "wchat.freshchat.com",
+    "crisp.chat", "tidio.co", "gorgias.chat",
+)
+
+
+class ResourceBlocker:
+    """Aborts requests a scraper never needs, per browser context.
+
+    Images, media, fonts and requests to known analytics, ads and chat
+    hosts are aborted. ``allow_types`` / ``allow_hosts`` let a retailer keep
+    what its site can't work without. Counts what was blocked and how many
+    bytes the requests that did go through transferred.
+    """
+
+    def __init__(self, allow_types: Iterable[str] = (), allow_hosts: Iterable[str] = ()):
+        self.blocked_types = BLOCKED_RESOURCE_TYPES - set(allow_types)
+        allowed = set(allow_hosts)
+        self.blocked_hosts = tuple(h for h in BLOCKED_HOSTS if h not in allowed)
+        self.blocked = {}  # reason -> request count
+        self.allowed = 0
+        self.bytes_transferred = 0
+
+    async def install(self, context):
+        await context.route("**/*", self._handle)
+        context.on("requestfinished", self._on_finished)
+
+    def _block_reason(self, request) -> str:
+        if request.resource_type in self.blocked_types:
+            return request.resource_type
+        host = host_of(request.url)
+        for blocked in self.blocked_hosts:
+            if host == blocked or host.endswith("." + blocked):
+                return "tracker"
+        return ""
+
+    async def _handle(self, route):
+        reason = self._block_reason(route.request)
+        if reason:
+            self.blocked[reason] = self.blocked.get(reason, 0) + 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def _on_finished(self, request):
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return  # page or context already gone
+        self.bytes_transferred += sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0)
+
+    def summary(self) -> str:
+        total = sum(self.blocked.values())
+        detail = ", ".join(f"{n} {reason}" for reason, n in sorted(self.blocked.items()))
+        mb = self.bytes_transferred / (1024 * 1024)
+        return (f"blocked {total} requests ({detail or 'none'}), "
+                f"loaded {self.allowed} ({mb:.1f} MB)")
@@ -1,13 +1,12 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import MagentoBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class BabiesAndMoreScraper(BaseStrollerScraper):
@@ -19,6 +18,17 @@ class BabiesAndMoreScraper(BaseStrollerScraper):
     RETAILER_NAME = "Babies and More"
     BASE_URL = "https://www.babiesandmore.com"
     LISTING_URL = "https://www.babiesandmore.com/en-ae/strollers"
+    BACKEND = MagentoBackend
+    BACKEND_OPTIONS = {"url_prefix": "https://www.babiesandmore.com/en-ae"}
+    LISTING_READY = ("a[href*='/p/']",)
+    PRODUCT_READY = ("@next-data", "@json-ld", ("h1", "[class*='price']"))
+    PRODUCT_FIELDS = {
+        "product": Field("h1"),
+        "brand": Field("[class*='brand'], .product-brand, .product-vendor"),
+        "price": Field("[class*='price'], .product-price"),
+        "description": Field("[class*='description'], .product-description"),
+        "features": Field("[class*='description'] li", many=True),
+    }
 
     def _is_product_url(self, href: str) -> bool:
         """Check if URL is a product page."""
@@ -39,8 +49,8 @@ class BabiesAndMoreScraper(BaseStrollerScraper):
             f"{self.BASE_URL}/en-ae/search?q={self.keyword}",
         ]:
             try:
-                await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(4)
+                await self._goto(page, search_url)
+                await self._wait_ready(page, self.LISTING_READY, cap=4)
                 await self._scroll_to_bottom(page, pause=1.5, max_scrolls=15)
 
                 links = await page.query_selector_all("a[href]")
@@ -59,8 +69,8 @@ class BabiesAndMoreScraper(BaseStrollerScraper):
         # Fallback: try listing URL anyway (may redirect but have some products)
         if not urls:
             try:
-                await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(3)
+                await self._goto(page, self._get_start_url())
+                await self._wait_ready(page, self.LISTING_READY, cap=3)
                 await self._scroll_to_bottom(page, pause=1.5, max_scrolls=10)
 
                 links = await page.query_selector_all("a[href]")
@@ -76,8 +86,8 @@ class BabiesAndMoreScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=3)
 
         product = StrollerProduct()
 
@@ -118,16 +128,17 @@ class BabiesAndMoreScraper(BaseStrollerScraper):
                 if isinstance(brand_info, dict):
                     product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], .product-brand, .product-vendor")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(page, "[class*='price'], .product-price")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='description'], .product-description")
+            product.description = dom["description"]
 
-        features = await self._safe_all_text(page, "[class*='description'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,19 +1,36 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import ShopifyBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class BabyCareScraper(BaseStrollerScraper):
     RETAILER_NAME = "Baby Care"
     BASE_URL = "https://www.bcbabycare.ae"
     LISTING_URL = "https://www.bcbabycare.ae/collections/strollers"
+    HTTP_LISTING = True
+    HTTP_DETAIL = True
+    BACKEND = ShopifyBackend
+    LISTING_CARD = ".card-wrapper, .product-card, .grid-product, .product-item"
+    CARD_FIELDS = {
+        "link": Field("a[href*='/products/']", attr="href"),
+        "product": Field((".card__heading", ".product-card__title", ".grid-product__title", ".product-item__title")),
+        "brand": Field((".card__vendor", ".caption-with-letter-spacing", "[class*='vendor']")),
+        "price": Field((".price-item--sale", ".price-item--regular", ".money", "[class*='price']")),
+        "image_url": Field("img", attr="src"),
+    }
+    PRODUCT_FIELDS = {
+        "product": Field("h1"),
+        "brand": Field(".product-vendor, [class*='vendor'], [class*='brand']"),
+        "price": Field(".product-price, .price, [class*='price']"),
+        "description": Field(".product-description, [class*='description']"),
+        "features": Field(".product-description li", many=True),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         urls = set()
@@ -25,11 +42,13 @@ class BabyCareScraper(BaseStrollerScraper):
             self.BASE_URL,
         ]:
             try:
-                await page.goto(try_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(2)
+                await self._goto(page, try_url)
+                await self._wait_ready(page, self.LISTING_READY, cap=2)
             except Exception:
                 continue
 
+            await self._read_cards(page)
+
             links = await page.query_selector_all("a[href*='/products/']")
             for link in links:
                 href = await link.get_attribute("href")
@@ -43,8 +62,8 @@ class BabyCareScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -64,16 +83,17 @@ class BabyCareScraper(BaseStrollerScraper):
             if isinstance(brand_info, dict):
                 product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, ".product-vendor, [class*='vendor'], [class*='brand']")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(page, ".product-price, .price, [class*='price']")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, ".product-description, [class*='description']")
+            product.description = dom["description"]
 
-        features = await self._safe_all_text(page, ".product-description li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,4 +1,3 @@
-import asyncio
 import re
 from typing import List, Optional
 from playwright.async_api import Page
@@ -6,9 +5,9 @@ from playwright.async_api import Page
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import OdooBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class BabyLifeScraper(BaseStrollerScraper):
@@ -19,6 +18,26 @@ class BabyLifeScraper(BaseStrollerScraper):
     RETAILER_NAME = "BabyLife UAE"
     BASE_URL = "https://www.babylifeuae.com"
     LISTING_URL = "https://www.babylifeuae.com/shop/category/gear-strollers-prams-2"
+    BACKEND = OdooBackend
+    # Odoo's product search has no brand (the exporter infers it from the
+    # name), so only a missing price/image or a long description needs a render.
+    # The shop grid shows no description, so a card could never be complete:
+    # fast mode doesn't read cards here and the browser fallback renders each page.
+    REQUIRED_FIELDS = ("product", "price", "image_url", "description")
+    LISTING_READY = (".oe_product a[href*='/shop/']", "a[itemprop='url'][href*='/shop/']")
+    PRODUCT_FIELDS = {
+        "product": Field("h1, #product_detail h1, .product_detail_name"),
+        "brand": Field("[class*='brand'], .product-brand"),
+        # Odoo uses specific price selectors
+        "price": Field(
+            ".product_price .oe_price .oe_currency_value, "
+            ".product_price span[class*='price'], "
+            "[class*='price'] .oe_currency_value, "
+            ".product_price"
+        ),
+        "description": Field("#product_full_description, .product_description, [class*='description']"),
+        "features": Field("[class*='description'] li, [class*='feature'] li", many=True),
+    }
 
     # Non-product /shop/ paths to exclude
     _EXCLUDE_PATHS = {
@@ -64,11 +83,11 @@ class BabyLifeScraper(BaseStrollerScraper):
         urls = set()
 
         # Load the strollers category page
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=3)
 
         # Scroll to load all products
-        await self._scroll_to_bottom(page, pause=1.5, max_scrolls=20)
+        await self._scroll_load(page, ", ".join(self.LISTING_READY), max_scrolls=20)
 
         # Collect product links
         links = await page.query_selector_all("a[href*='/shop/']")
@@ -84,8 +103,8 @@ class BabyLifeScraper(BaseStrollerScraper):
         while page_num <= 10:
             paged_url = f"{self._get_start_url()}?page={page_num}"
             try:
-                await page.goto(paged_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(2)
+                await self._goto(page, paged_url)
+                await self._wait_ready(page, self.LISTING_READY, cap=2)
 
                 new_count = 0
                 links = await page.query_selector_all("a[href*='/shop/']")
@@ -103,14 +122,13 @@ class BabyLifeScraper(BaseStrollerScraper):
             except Exception:
                 break
             page_num += 1
-            await random_delay(1.0, 2.0)
 
         # Fallback: search
         if not urls:
             search_url = f"{self.BASE_URL}/shop?search={self.keyword}"
             try:
-                await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(2)
+                await self._goto(page, search_url)
+                await self._wait_ready(page, self.LISTING_READY, cap=2)
                 links = await page.query_selector_all("a[href*='/shop/']")
                 for link in links:
                     href = await link.get_attribute("href")
@@ -122,8 +140,8 @@ class BabyLifeScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -145,29 +163,19 @@ class BabyLifeScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # Odoo DOM selectors
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1, #product_detail h1, .product_detail_name")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], .product-brand")
+            product.brand = dom["brand"]
         if not product.price:
-            # Odoo uses specific price selectors
-            product.price = await self._safe_text(
-                page,
-                ".product_price .oe_price .oe_currency_value, "
-                ".product_price span[class*='price'], "
-                "[class*='price'] .oe_currency_value, "
-                ".product_price"
-            )
+            product.price = dom["price"]
             if product.price and not product.price.startswith("AED"):
                 product.price = f"AED {product.price}"
         if not product.description:
-            product.description = await self._safe_text(
-                page,
-                "#product_full_description, .product_description, "
-                "[class*='description']"
-            )
+            product.description = dom["description"]
 
-        features = await self._safe_all_text(page, "[class*='description'] li, [class*='feature'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
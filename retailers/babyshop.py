@@ -1,13 +1,12 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
+from pagination import paginate_by_load_more, paginate_by_load_more_api
 
 
 class BabyshopScraper(BaseStrollerScraper):
@@ -17,32 +16,40 @@ class BabyshopScraper(BaseStrollerScraper):
     RETAILER_NAME = "Babyshop"
     BASE_URL = "https://www.babyshopstores.com"
     LISTING_URL = "https://www.babyshopstores.com/ae/en/c/baby-gear-strollersandprams-strollers"
+    DETAIL_WORKERS = 2  # heavy SPA — more tabs start timing out
+    MAX_DETAIL_WORKERS = 4
+    ALLOW_HOSTS = ("googletagmanager.com",)  # product data is read back from dataLayer
+    HARVEST_LISTING = True  # listing API returns full product cards
+    LISTING_READY = ("a[href*='/buy-']",)
+    PRODUCT_FIELDS = {
+        "product": Field("h1"),
+        "brand": Field("[class*='brand'], .product-brand, [data-testid*='brand']"),
+        "price": Field("[class*='price'] span, [class*='Price'], .product-price"),
+        "description": Field("[class*='description'], .product-description, [class*='detail']"),
+        "features": Field("[class*='feature'] li, .product-description li, [class*='detail'] li", many=True),
+    }
+
+    _LOAD_MORE = (
+        "button:has-text('Load More'), button:has-text('Show More'), "
+        "[class*='loadMore'], [class*='showMore']"
+    )
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(6)  # Heavy JS SPA needs time to hydrate
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=6)
 
         # Scroll to load all products — Babyshop uses lazy loading
-        await self._scroll_to_bottom(page, pause=2.0, max_scrolls=40)
+        await self._scroll_load(page, "a[href*='/buy-']", max_scrolls=40)
 
-        # Also try clicking Load More / Show More
-        for _ in range(20):
-            btn = await page.query_selector(
-                "button:has-text('Load More'), button:has-text('Show More'), "
-                "[class*='loadMore'], [class*='showMore']"
-            )
-            if not btn:
-                break
-            try:
-                if not await btn.is_visible():
-                    break
-                await btn.scroll_into_view_if_needed()
-                await btn.click()
-                await asyncio.sleep(2)
-            except Exception:
-                break
+        # Load More: replay its JSON request page by page, else click through
+        api_urls = await paginate_by_load_more_api(
+            page, self._LOAD_MORE, self._api_product_url, rate_limiter=self.rate_limiter
+        )
+        if api_urls is None:
+            await paginate_by_load_more(self, page, self._LOAD_MORE, "a[href*='/buy-']",
+                                        max_clicks=20, wait_after_click=2)
 
-        urls = set()
+        urls = set(api_urls or [])
         # Primary selector: product links with /p/ pattern
         links = await page.query_selector_all("a[href*='/p/']")
         for link in links:
@@ -73,9 +80,14 @@ class BabyshopScraper(BaseStrollerScraper):
 
         return list(urls)
 
+    def _api_product_url(self, value: str) -> Optional[str]:
+        if "/p/" in value and "/buy-" in value and value.startswith(("/", "http")):
+            return self._make_absolute(value.split("?")[0])
+        return None
+
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(4)  # Wait for JS rendering
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=4)
 
         product = StrollerProduct()
 
@@ -131,17 +143,16 @@ class BabyshopScraper(BaseStrollerScraper):
                 pass
 
         # DOM fallbacks
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], .product-brand, [data-testid*='brand']")
+            product.brand = dom["brand"]
         if not product.price:
-            price_text = await self._safe_text(page, "[class*='price'] span, [class*='Price'], .product-price")
-            if price_text:
-                product.price = price_text.strip()
+            product.price = dom["price"]
 
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='description'], .product-description, [class*='detail']")
+            product.description = dom["description"]
 
         # Specs
         specs = await self._extract_spec_table(page, "[class*='spec'], [class*='detail'], table")
@@ -150,7 +161,7 @@ class BabyshopScraper(BaseStrollerScraper):
         product.suitable_for = specs.get("suitable for", specs.get("age", specs.get("age range", "")))
 
         # Features
-        features = await self._safe_all_text(page, "[class*='feature'] li, .product-description li, [class*='detail'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,13 +1,12 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import ShopifyBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class BirdsAndBeesScraper(BaseStrollerScraper):
@@ -19,6 +18,27 @@ class BirdsAndBeesScraper(BaseStrollerScraper):
     RETAILER_NAME = "Birds and Bees"
     BASE_URL = "https://www.birdsn-bees.com"
     LISTING_URL = "https://www.birdsn-bees.com/collections/strollers"
+    HTTP_LISTING = True
+    HTTP_DETAIL = True
+    BACKEND = ShopifyBackend
+    LISTING_CARD = ".card-wrapper, .product-card, .grid-product, .product-item"
+    CARD_FIELDS = {
+        "link": Field("a[href*='/products/']", attr="href"),
+        "product": Field((".card__heading", ".product-card__title", ".grid-product__title", ".product-item__title")),
+        "brand": Field((".card__vendor", ".caption-with-letter-spacing", "[class*='vendor']")),
+        "price": Field((".price-item--sale", ".price-item--regular", ".money", "[class*='price']")),
+        "image_url": Field("img", attr="src"),
+    }
+    PRODUCT_FIELDS = {
+        "product": Field("h1.product__title, h1"),
+        "brand": Field(".product-vendor, .product__vendor, [class*='vendor']"),
+        "price": Field(".product-price, .price, .product__price"),
+        "description": Field(".product-description, .product__description, [class*='description']"),
+        "features": Field(".product-description li, .product__description li", many=True),
+    }
+
+    def _is_listing_link(self, href: str) -> bool:
+        return "gift-card" not in href.lower()
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         urls = set()
@@ -26,8 +46,10 @@ class BirdsAndBeesScraper(BaseStrollerScraper):
         # Try search first (diagnostic showed it works)
         search_url = f"{self.BASE_URL}/search?q={self.keyword}"
         try:
-            await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(3)
+            await self._goto(page, search_url)
+            await self._wait_ready(page, self.LISTING_READY, cap=3)
+
+            await self._read_cards(page)
 
             links = await page.query_selector_all("a[href*='/products/']")
             for link in links:
@@ -48,8 +70,10 @@ class BirdsAndBeesScraper(BaseStrollerScraper):
                 f"{self.BASE_URL}/collections/all",
             ]:
                 try:
-                    await page.goto(try_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                    await asyncio.sleep(2)
+                    await self._goto(page, try_url)
+                    await self._wait_ready(page, self.LISTING_READY, cap=2)
+
+                    await self._read_cards(page)
 
                     links = await page.query_selector_all("a[href*='/products/']")
                     for link in links:
@@ -68,8 +92,8 @@ class BirdsAndBeesScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -91,14 +115,15 @@ class BirdsAndBeesScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # Shopify DOM fallbacks
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1.product__title, h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, ".product-vendor, .product__vendor, [class*='vendor']")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(page, ".product-price, .price, .product__price")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, ".product-description, .product__description, [class*='description']")
+            product.description = dom["description"]
 
         # Try Shopify product data
         if not product.brand or not product.price:
@@ -119,7 +144,7 @@ class BirdsAndBeesScraper(BaseStrollerScraper):
             except Exception:
                 pass
 
-        features = await self._safe_all_text(page, ".product-description li, .product__description li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,4 +1,3 @@
-import asyncio
 import re
 from typing import List, Optional
 from playwright.async_api import Page
@@ -6,9 +5,8 @@ from playwright.async_api import Page
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class BloomingdalesScraper(BaseStrollerScraper):
@@ -19,6 +17,14 @@ class BloomingdalesScraper(BaseStrollerScraper):
     RETAILER_NAME = "Bloomingdales"
     BASE_URL = "https://www.bloomingdales.ae"
     LISTING_URL = "https://www.bloomingdales.ae/kids-baby/"
+    LISTING_READY = ()  # product links are only told apart by URL pattern
+    PRODUCT_FIELDS = {
+        "product": Field("h1, [class*='product-name']"),
+        "brand": Field("[class*='brand'], .product-brand, [class*='designer']"),
+        "price": Field("[class*='price']"),
+        "description": Field("[class*='description'], .product-details"),
+        "features": Field("[class*='feature'] li, .product-description li", many=True),
+    }
 
     # Category pages to exclude
     _CATEGORY_PATHS = {
@@ -48,11 +54,11 @@ class BloomingdalesScraper(BaseStrollerScraper):
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         # Try search first for strollers
         search_url = f"{self.BASE_URL}/search?q={self.keyword}"
-        await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(4)
+        await self._goto(page, search_url)
+        await self._wait_ready(page, self.LISTING_READY, cap=4)
 
         # Scroll to load all results
-        await self._scroll_to_bottom(page, pause=2.0, max_scrolls=30)
+        await self._scroll_load(page, "a[href$='.html']", max_scrolls=30)
 
         urls = set()
         links = await page.query_selector_all("a[href$='.html']")
@@ -65,9 +71,9 @@ class BloomingdalesScraper(BaseStrollerScraper):
 
         # Fallback: try the kids-baby category page
         if not urls:
-            await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(3)
-            await self._scroll_to_bottom(page, pause=2.0, max_scrolls=20)
+            await self._goto(page, self._get_start_url())
+            await self._wait_ready(page, self.LISTING_READY, cap=3)
+            await self._scroll_load(page, "a[href$='.html']", max_scrolls=20)
 
             links = await page.query_selector_all("a[href$='.html']")
             for link in links:
@@ -80,8 +86,8 @@ class BloomingdalesScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=3)
 
         product = StrollerProduct()
 
@@ -101,16 +107,17 @@ class BloomingdalesScraper(BaseStrollerScraper):
             if isinstance(brand_info, dict):
                 product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1, [class*='product-name']")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], .product-brand, [class*='designer']")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(page, "[class*='price']")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='description'], .product-details")
+            product.description = dom["description"]
 
-        features = await self._safe_all_text(page, "[class*='feature'] li, .product-description li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,13 +1,12 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import WooCommerceBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class EggsAndSoldiersScraper(BaseStrollerScraper):
@@ -19,6 +18,26 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
     RETAILER_NAME = "Eggs and Soldiers"
     BASE_URL = "https://www.eggsnsoldiers.com"
     LISTING_URL = "https://www.eggsnsoldiers.com/product-category/out-about/strollers/"
+    BACKEND = WooCommerceBackend
+    LISTING_READY = ("li.product a[href]", ".products .product a[href]")
+    LISTING_CARD = "li.product, .products .product"
+    CARD_FIELDS = {
+        "link": Field(("a.woocommerce-LoopProduct-link", "a[href]"), attr="href"),
+        "product": Field((".woocommerce-loop-product__title", "h2", "h3")),
+        "brand": Field("[class*='brand']"),
+        "price": Field((".price ins .amount", ".price .amount")),
+        "image_url": Field("img", attr="src"),
+    }
+    PRODUCT_FIELDS = {
+        "product": Field("h1.product_title, h1.entry-title, h1"),
+        "brand": Field(
+            ".woocommerce-product-attributes-item--attribute_pa_brand .woocommerce-product-attributes-item__value, "
+            "[class*='brand'], .product-vendor"
+        ),
+        "price": Field(".woocommerce-Price-amount, .price ins .amount, .price .amount, .summary .price"),
+        "description": Field(".woocommerce-product-details__short-description, #tab-description, .product-description"),
+        "features": Field(".product-description li, #tab-description li, .woocommerce-Tabs-panel li", many=True),
+    }
 
     # Non-product pages
     _NON_PRODUCT_SLUGS = {
@@ -56,11 +75,12 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
         # Strategy 1: Try WooCommerce search (most reliable)
         search_url = f"{self.BASE_URL}/?s={self.keyword}&post_type=product"
         try:
-            await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(4)
+            await self._goto(page, search_url)
+            await self._wait_ready(page, self.LISTING_READY, cap=4)
             await self._scroll_to_bottom(page, pause=1.5, max_scrolls=5)
 
             # Collect hrefs using JavaScript for reliability
+            await self._read_cards(page)
             hrefs = await page.evaluate("""
                 () => Array.from(document.querySelectorAll('a[href]'))
                     .map(a => a.href)
@@ -73,10 +93,12 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
         # Strategy 2: Try the strollers category page
         if not urls:
             try:
-                await page.goto(self.LISTING_URL, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(4)
+                await self._goto(page, self.LISTING_URL)
+                await self._wait_ready(page, self.LISTING_READY, cap=4)
                 await self._scroll_to_bottom(page, pause=1.5, max_scrolls=5)
 
+                await self._read_cards(page)
+
                 hrefs = await page.evaluate("""
                     () => Array.from(document.querySelectorAll('a[href]'))
                         .map(a => a.href)
@@ -93,8 +115,10 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
                 f"{self.BASE_URL}/product-category/out-about/car-seats/",
             ]:
                 try:
-                    await page.goto(cat_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                    await asyncio.sleep(3)
+                    await self._goto(page, cat_url)
+                    await self._wait_ready(page, self.LISTING_READY, cap=3)
+
+                    await self._read_cards(page)
 
                     hrefs = await page.evaluate("""
                         () => Array.from(document.querySelectorAll('a[href]'))
@@ -110,8 +134,8 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -132,26 +156,15 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # WooCommerce DOM fallbacks
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1.product_title, h1.entry-title, h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(
-                page,
-                ".woocommerce-product-attributes-item--attribute_pa_brand .woocommerce-product-attributes-item__value, "
-                "[class*='brand'], .product-vendor"
-            )
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(
-                page,
-                ".woocommerce-Price-amount, .price ins .amount, .price .amount, "
-                ".summary .price"
-            )
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(
-                page,
-                ".woocommerce-product-details__short-description, "
-                "#tab-description, .product-description"
-            )
+            product.description = dom["description"]
 
         # WooCommerce product attributes table
         specs = await self._extract_spec_table(page, ".woocommerce-product-attributes, .shop_attributes, table")
@@ -159,7 +172,7 @@ class EggsAndSoldiersScraper(BaseStrollerScraper):
         product.color = specs.get("color", specs.get("colour", ""))
         product.suitable_for = specs.get("suitable for", specs.get("age", ""))
 
-        features = await self._safe_all_text(page, ".product-description li, #tab-description li, .woocommerce-Tabs-panel li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
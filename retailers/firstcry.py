@@ -1,13 +1,11 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class FirstCryScraper(BaseStrollerScraper):
@@ -15,6 +13,18 @@ class FirstCryScraper(BaseStrollerScraper):
     BASE_URL = "https://www.firstcry.ae"
     LISTING_URL = "https://www.firstcry.ae/baby-strollers-and-prams/7/44"
     RETRY_DELAY = 8.0  # FirstCry has aggressive anti-bot
+    DETAIL_WORKERS = 1
+    MAX_DETAIL_WORKERS = 1
+    REQUESTS_PER_SECOND = 0.3
+    REQUEST_BURST = 1
+    LISTING_READY = ("a[href*='/productdetail/'], a[href*='/product/'], .product-card a, .product-box a",)
+    PRODUCT_FIELDS = {
+        "product": Field("h1.product-title, h1.product-name, h1[class*='title'], h1"),
+        "brand": Field(".brand-name a, .product-brand, [class*='brand'] a"),
+        "price": Field(".selling-price, .offer-price, .final-price, [class*='price']:not([class*='original'])"),
+        "description": Field(".product-description, #product-desc, [class*='description']"),
+        "features": Field(".key-features li, .product-features li, [class*='feature'] li", many=True),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         all_urls = set()
@@ -22,8 +32,8 @@ class FirstCryScraper(BaseStrollerScraper):
 
         while page_num <= 50:
             url = f"{self._get_start_url()}?page={page_num}" if page_num > 1 else self._get_start_url()
-            await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(4)
+            await self._goto(page, url)
+            await self._wait_ready(page, self.LISTING_READY, cap=4)
 
             links = await page.query_selector_all(
                 "a[href*='/product/'], a[href*='/productdetail/'], .product-card a, .product-box a, .product_link"
@@ -55,13 +65,12 @@ class FirstCryScraper(BaseStrollerScraper):
                 break
 
             page_num += 1
-            await random_delay(3.0, 5.0)
 
         return list(all_urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=3)
 
         product = StrollerProduct()
 
@@ -83,20 +92,21 @@ class FirstCryScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # DOM fallbacks
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1.product-title, h1.product-name, h1[class*='title'], h1")
+            product.product = dom["product"]
 
         if not product.brand:
-            product.brand = await self._safe_text(page, ".brand-name a, .product-brand, [class*='brand'] a")
+            product.brand = dom["brand"]
 
         if not product.price:
-            product.price = await self._safe_text(page, ".selling-price, .offer-price, .final-price, [class*='price']:not([class*='original'])")
+            product.price = dom["price"]
 
         if not product.description:
-            product.description = await self._safe_text(page, ".product-description, #product-desc, [class*='description']")
+            product.description = dom["description"]
 
         # Key Features
-        features = await self._safe_all_text(page, ".key-features li, .product-features li, [class*='feature'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,44 +1,48 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
+from pagination import paginate_by_load_more, paginate_by_load_more_api
 
 
 class GaleriesLafayetteScraper(BaseStrollerScraper):
     RETAILER_NAME = "Galeries Lafayette"
     BASE_URL = "https://www.galerieslafayette.ae"
     LISTING_URL = "https://www.galerieslafayette.ae/ae/en/category/kids-baby-care-strollers-and-travel-strollers"
+    LISTING_READY = ("a[href*='/product/'], a[href*='/p/'], .product-card a, .product-tile a",)
+    PRODUCT_FIELDS = {
+        "product": Field("h1"),
+        "brand": Field("[class*='brand']"),
+        "price": Field("[class*='price']"),
+        "description": Field("[class*='description']"),
+        "features": Field("[class*='feature'] li, [class*='description'] li", many=True),
+    }
+
+    _LOAD_MORE = (
+        "button:has-text('Load More'), button:has-text('Show More'), "
+        "[class*='loadMore'], [class*='showMore']"
+    )
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=3)
 
         # Scroll and load more
-        await self._scroll_to_bottom(page, pause=2.0, max_scrolls=30)
-
-        for _ in range(20):
-            btn = await page.query_selector(
-                "button:has-text('Load More'), button:has-text('Show More'), "
-                "[class*='loadMore'], [class*='showMore']"
-            )
-            if not btn:
-                break
-            try:
-                if not await btn.is_visible():
-                    break
-                await btn.scroll_into_view_if_needed()
-                await btn.click()
-                await asyncio.sleep(2)
-            except Exception:
-                break
+        await self._scroll_load(page, self.LISTING_READY[0], max_scrolls=30)
+
+        # Load More: replay its JSON request page by page, else click through
+        api_urls = await paginate_by_load_more_api(
+            page, self._LOAD_MORE, self._api_product_url, rate_limiter=self.rate_limiter
+        )
+        if api_urls is None:
+            await paginate_by_load_more(self, page, self._LOAD_MORE, self.LISTING_READY[0],
+                                        max_clicks=20, wait_after_click=2)
 
-        urls = set()
+        urls = set(api_urls or [])
         links = await page.query_selector_all(
             "a[href*='/product/'], a[href*='/p/'], "
             ".product-card a, .product-tile a, [class*='product'] a[href]"
@@ -54,8 +58,8 @@ class GaleriesLafayetteScraper(BaseStrollerScraper):
             page_num = 1
             while page_num <= 10:
                 url = f"{self._get_start_url()}?page={page_num}" if page_num > 1 else self._get_start_url()
-                await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(2)
+                await self._goto(page, url)
+                await self._wait_ready(page, self.LISTING_READY, cap=2)
 
                 links = await page.query_selector_all("a[href*='/product/'], a[href*='/p/']")
                 if not links:
@@ -66,13 +70,17 @@ class GaleriesLafayetteScraper(BaseStrollerScraper):
                         urls.add(self._make_absolute(href.split("?")[0]))
 
                 page_num += 1
-                await random_delay(2.0, 4.0)
 
         return list(urls)
 
+    def _api_product_url(self, value: str) -> Optional[str]:
+        if ("/product/" in value or "/p/" in value) and value.startswith(("/", "http")):
+            return self._make_absolute(value.split("?")[0])
+        return None
+
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -92,20 +100,21 @@ class GaleriesLafayetteScraper(BaseStrollerScraper):
             if isinstance(brand_info, dict):
                 product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand']")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(page, "[class*='price']")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='description']")
+            product.description = dom["description"]
 
         specs = await self._extract_spec_table(page, "[class*='spec'], table")
         product.weight = specs.get("weight", "")
         product.color = specs.get("color", specs.get("colour", ""))
 
-        features = await self._safe_all_text(page, "[class*='feature'] li, [class*='description'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,13 +1,11 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class JikelScraper(BaseStrollerScraper):
@@ -20,14 +18,33 @@ class JikelScraper(BaseStrollerScraper):
     RETAILER_NAME = "Jikel"
     BASE_URL = "https://www.jikelbaby.ae"
     LISTING_URL = "https://www.jikelbaby.ae/strollers"
+    DETAIL_WORKERS = 1  # cards are read off the one listing page by index
+    MAX_DETAIL_WORKERS = 1
+    LISTING_READY = (".product-card, .product-item, .grid-product, a[href*='/products/']",)
+    PRODUCT_FIELDS = {  # jikelbaby.com product pages
+        "product": Field(
+            "h1.product__title, h1.product-title, "
+            ".product-single__title, .product__title, h1"
+        ),
+        "price": Field(
+            ".product__price, .product-price, .price, "
+            "[class*='price'] .money, [class*='price']"
+        ),
+        "description": Field(
+            ".product__description, .product-description, "
+            ".product-single__description, [class*='description']"
+        ),
+        "og_title": Field('meta[property="og:title"]', attr="content"),
+        "features": Field(".product-description li, [class*='feature'] li", many=True),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         """Jikel doesn't have individual product pages.
         Instead, we return the category URL as a marker and scrape cards
         directly from the listing page.
         """
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=3)
 
         # Check if there are product cards on the page
         cards = await page.query_selector_all(
@@ -44,8 +61,8 @@ class JikelScraper(BaseStrollerScraper):
 
         # Try jikelbaby.com (the .com version might have products)
         try:
-            await page.goto("https://www.jikelbaby.com/collections", wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(2)
+            await self._goto(page, "https://www.jikelbaby.com/collections")
+            await self._wait_ready(page, self.LISTING_READY, cap=2)
             links = await page.query_selector_all("a[href*='/products/']")
             urls = set()
             for link in links:
@@ -67,8 +84,8 @@ class JikelScraper(BaseStrollerScraper):
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
         # If the URL is from jikelbaby.com, scrape normally
         if "jikelbaby.com" in url and "/products/" in url:
-            await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(2)
+            await self._goto(page, url)
+            await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
             product = StrollerProduct()
 
@@ -88,25 +105,14 @@ class JikelScraper(BaseStrollerScraper):
                 if isinstance(brand_info, dict):
                     product.brand = brand_info.get("name", "")
 
+            dom = await self._extract_fields(page)
             if not product.product:
-                product.product = await self._safe_text(
-                    page,
-                    "h1.product__title, h1.product-title, "
-                    ".product-single__title, .product__title, h1"
-                )
+                product.product = dom["product"]
             product.brand = product.brand or "Jikel"
             if not product.price:
-                product.price = await self._safe_text(
-                    page,
-                    ".product__price, .product-price, .price, "
-                    "[class*='price'] .money, [class*='price']"
-                )
+                product.price = dom["price"]
             if not product.description:
-                product.description = await self._safe_text(
-                    page,
-                    ".product__description, .product-description, "
-                    ".product-single__description, [class*='description']"
-                )
+                product.description = dom["description"]
             # Try Shopify product data for name fallback
             if not product.product:
                 try:
@@ -142,9 +148,9 @@ class JikelScraper(BaseStrollerScraper):
 
             # Last resort: extract from meta og:title
             if not product.product:
-                product.product = await self._safe_attr(page, 'meta[property="og:title"]', "content")
+                product.product = dom["og_title"]
 
-            features = await self._safe_all_text(page, ".product-description li, [class*='feature'] li")
+            features = dom["features"]
             if features:
                 product.features = " ; ".join(features[:15])
 
@@ -161,8 +167,8 @@ class JikelScraper(BaseStrollerScraper):
             # Navigate to listing page if not already there
             current = page.url
             if "/strollers" not in current:
-                await page.goto(f"{self.BASE_URL}/strollers", wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(3)
+                await self._goto(page, f"{self.BASE_URL}/strollers")
+                await self._wait_ready(page, self.LISTING_READY, cap=3)
 
             # Get product cards
             cards = await page.query_selector_all(
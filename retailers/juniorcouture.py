@@ -1,13 +1,12 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import MagentoBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class JuniorCoutureScraper(BaseStrollerScraper):
@@ -18,6 +17,24 @@ class JuniorCoutureScraper(BaseStrollerScraper):
     RETAILER_NAME = "Junior Couture"
     BASE_URL = "https://www.juniorcouture.ae"
     LISTING_URL = "https://www.juniorcouture.ae/en/strollers"
+    BACKEND = MagentoBackend
+    BACKEND_OPTIONS = {"store": "en", "url_prefix": "https://www.juniorcouture.ae/en"}
+    LISTING_READY = ("a.product-item-link", ".product-item a[href$='.html']")
+    LISTING_CARD = ".product-item"
+    CARD_FIELDS = {
+        "link": Field("a.product-item-link", attr="href"),
+        "product": Field("a.product-item-link"),
+        "brand": Field("[class*='brand']"),
+        "price": Field((".special-price .price", ".price-box .price")),
+        "image_url": Field("img.product-image-photo", attr="src"),
+    }
+    PRODUCT_FIELDS = {
+        "product": Field("h1.page-title span, h1.page-title, h1"),
+        "brand": Field("[class*='brand'], .product-brand"),
+        "price": Field(".price-wrapper .price, .special-price .price, [class*='price'] .price"),
+        "description": Field("[class*='description'], .product-description"),
+        "features": Field("[class*='description'] li, [class*='feature'] li", many=True),
+    }
 
     # CMS / non-product .html pages on Junior Couture
     _CMS_PAGES = {
@@ -62,9 +79,11 @@ class JuniorCoutureScraper(BaseStrollerScraper):
         # Try catalogsearch first (most reliable for Magento)
         search_url = f"{self.BASE_URL}/en/catalogsearch/result/?q={self.keyword}"
         try:
-            await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(3)
-            await self._scroll_to_bottom(page, pause=1.5, max_scrolls=20)
+            await self._goto(page, search_url)
+            await self._wait_ready(page, self.LISTING_READY, cap=3)
+            await self._scroll_load(page, "a[href$='.html']", max_scrolls=20)
+
+            await self._read_cards(page)
 
             links = await page.query_selector_all("a[href$='.html']")
             for link in links:
@@ -80,9 +99,11 @@ class JuniorCoutureScraper(BaseStrollerScraper):
         # Fallback: listing page
         if not urls:
             try:
-                await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(3)
-                await self._scroll_to_bottom(page, pause=1.5, max_scrolls=20)
+                await self._goto(page, self._get_start_url())
+                await self._wait_ready(page, self.LISTING_READY, cap=3)
+                await self._scroll_load(page, "a[href$='.html']", max_scrolls=20)
+
+                await self._read_cards(page)
 
                 links = await page.query_selector_all("a[href$='.html']")
                 for link in links:
@@ -97,9 +118,11 @@ class JuniorCoutureScraper(BaseStrollerScraper):
         # Fallback: homepage product links
         if not urls:
             try:
-                await page.goto(f"{self.BASE_URL}/en/", wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(3)
-                await self._scroll_to_bottom(page, pause=1.5, max_scrolls=10)
+                await self._goto(page, f"{self.BASE_URL}/en/")
+                await self._wait_ready(page, self.LISTING_READY, cap=3)
+                await self._scroll_load(page, "a[href$='.html']", max_scrolls=10)
+
+                await self._read_cards(page)
 
                 links = await page.query_selector_all("a[href$='.html']")
                 for link in links:
@@ -114,8 +137,8 @@ class JuniorCoutureScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -135,16 +158,17 @@ class JuniorCoutureScraper(BaseStrollerScraper):
             if isinstance(brand_info, dict):
                 product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1.page-title span, h1.page-title, h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], .product-brand")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(page, ".price-wrapper .price, .special-price .price, [class*='price'] .price")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='description'], .product-description")
+            product.description = dom["description"]
 
-        features = await self._safe_all_text(page, "[class*='description'] li, [class*='feature'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -1,13 +1,12 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import ShopifyBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class LeBouquetScraper(BaseStrollerScraper):
@@ -15,6 +14,25 @@ class LeBouquetScraper(BaseStrollerScraper):
     RETAILER_NAME = "Le Bouquet"
     BASE_URL = "https://www.lebouquetbaby.com"
     LISTING_URL = "https://www.lebouquetbaby.com/collections/strollers-prams"
+    HTTP_LISTING = True
+    HTTP_DETAIL = True
+    BACKEND = ShopifyBackend
+    LISTING_CARD = ".card-wrapper, .product-card, .grid-product, .product-item"
+    CARD_FIELDS = {
+        "link": Field("a[href*='/products/']", attr="href"),
+        "product": Field((".card__heading", ".product-card__title", ".grid-product__title", ".product-item__title")),
+        "brand": Field((".card__vendor", ".caption-with-letter-spacing", "[class*='vendor']")),
+        "price": Field((".price-item--sale", ".price-item--regular", ".money", "[class*='price']")),
+        "image_url": Field("img", attr="src"),
+    }
+    PRODUCT_FIELDS = {
+        "product": Field("h1.product-title, h1.product__title, h1"),
+        "brand": Field(".product-vendor, .product__vendor, [class*='vendor']"),
+        "price": Field(".product-price, .price, [class*='price'] .money"),
+        "description": Field(".product-description, .product__description, [class*='description']"),
+        "features": Field(".product-description li, .product__description li", many=True),
+        "color": Field(".swatch-label, [class*='variant'] [class*='color'], .color-swatch.active"),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         urls = set()
@@ -22,8 +40,10 @@ class LeBouquetScraper(BaseStrollerScraper):
 
         while page_num <= 20:
             url = f"{self._get_start_url()}?page={page_num}" if page_num > 1 else self._get_start_url()
-            await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(2)
+            await self._goto(page, url)
+            await self._wait_ready(page, self.LISTING_READY, cap=2)
+
+            await self._read_cards(page)
 
             links = await page.query_selector_all(
                 "a[href*='/products/'], .product-card a, .grid-product a, "
@@ -47,13 +67,12 @@ class LeBouquetScraper(BaseStrollerScraper):
                 break
 
             page_num += 1
-            await random_delay(1.5, 3.0)
 
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -98,24 +117,25 @@ class LeBouquetScraper(BaseStrollerScraper):
                         product.price = str(price_val)
 
         # DOM fallbacks
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1.product-title, h1.product__title, h1")
+            product.product = dom["product"]
 
         if not product.brand:
-            product.brand = await self._safe_text(page, ".product-vendor, .product__vendor, [class*='vendor']")
+            product.brand = dom["brand"]
 
         if not product.price:
-            product.price = await self._safe_text(page, ".product-price, .price, [class*='price'] .money")
+            product.price = dom["price"]
 
         if not product.description:
-            product.description = await self._safe_text(page, ".product-description, .product__description, [class*='description']")
+            product.description = dom["description"]
 
         # Features from description bullet points
-        features = await self._safe_all_text(page, ".product-description li, .product__description li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
         # Color from variant selector
-        product.color = await self._safe_text(page, ".swatch-label, [class*='variant'] [class*='color'], .color-swatch.active")
+        product.color = dom["color"]
 
         return product
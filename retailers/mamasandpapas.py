@@ -1,42 +1,43 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import WooCommerceBackend
+from base_scraper import BaseStrollerScraper, Field
+from http_engine import HtmlDocument
 from models import StrollerProduct
-from anti_bot import random_delay
+from pagination import paginate_by_load_more
 
 
 class MamasAndPapasScraper(BaseStrollerScraper):
     RETAILER_NAME = "Mamas & Papas"
     BASE_URL = "https://www.mamasandpapas.ae"
     LISTING_URL = "https://www.mamasandpapas.ae/travel-strollers-carrycots-all-strollers/"
+    HTTP_DETAIL = True
+    BACKEND = WooCommerceBackend
+    LISTING_READY = ("a[href*='/product/'], .product-card a, .product-tile a",)
+    PRODUCT_FIELDS = {
+        "product": Field("h1"),
+        "price": Field("[class*='price'], .product-price"),
+        "description": Field("[class*='description'], .product-description"),
+        "features": Field("[class*='feature'] li, .product-description li, [class*='detail'] li", many=True),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=3)
 
         # Scroll to load all and try load more
         await self._scroll_to_bottom(page, pause=2.0, max_scrolls=30)
 
-        for _ in range(20):
-            btn = await page.query_selector(
-                "button:has-text('Load More'), button:has-text('Show More'), "
-                "a:has-text('Load More'), [class*='loadMore']"
-            )
-            if not btn:
-                break
-            try:
-                if not await btn.is_visible():
-                    break
-                await btn.scroll_into_view_if_needed()
-                await btn.click()
-                await asyncio.sleep(2)
-            except Exception:
-                break
+        await paginate_by_load_more(
+            self, page,
+            "button:has-text('Load More'), button:has-text('Show More'), "
+            "a:has-text('Load More'), [class*='loadMore']",
+            self.LISTING_READY[0], max_clicks=20, wait_after_click=2,
+        )
 
         urls = set()
         links = await page.query_selector_all(
@@ -54,8 +55,8 @@ class MamasAndPapasScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -75,16 +76,17 @@ class MamasAndPapasScraper(BaseStrollerScraper):
             if isinstance(brand_info, dict):
                 product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1")
+            product.product = dom["product"]
         if not product.brand:
             product.brand = "Mamas & Papas"  # Own brand store
         if not product.price:
-            product.price = await self._safe_text(page, "[class*='price'], .product-price")
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='description'], .product-description")
+            product.description = dom["description"]
 
-        features = await self._safe_all_text(page, "[class*='feature'] li, .product-description li, [class*='detail'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
@@ -94,3 +96,13 @@ class MamasAndPapasScraper(BaseStrollerScraper):
         product.suitable_for = specs.get("suitable from", specs.get("suitable for", specs.get("age", "")))
 
         return product
+
+    def _parse_product_html(self, doc: HtmlDocument, url: str) -> Optional[StrollerProduct]:
+        product = super()._parse_product_html(doc, url)
+        if not product.brand:
+            product.brand = "Mamas & Papas"  # Own brand store
+        specs = doc.specs
+        product.weight = specs.get("weight", "")
+        product.color = specs.get("color", specs.get("colour", ""))
+        product.suitable_for = specs.get("suitable from", specs.get("suitable for", specs.get("age", "")))
+        return product
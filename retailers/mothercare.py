@@ -5,38 +5,56 @@ from playwright.async_api import Page
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import MagentoBackend
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
+from pagination import paginate_by_load_more, paginate_by_load_more_api
 
 
 class MothercareScraper(BaseStrollerScraper):
     RETAILER_NAME = "Mothercare"
     BASE_URL = "https://www.mothercare.ae"
     LISTING_URL = "https://www.mothercare.ae/en/shop-strollers"
+    BACKEND = MagentoBackend
+    BACKEND_OPTIONS = {"store": "en", "url_prefix": "https://www.mothercare.ae/en"}
+    ALLOW_HOSTS = ("googletagmanager.com",)  # product data is read back from dataLayer
+    LISTING_READY = ("a.product-item-title[href], a[data-link='pdp'][href]",)
+    PRODUCT_FIELDS = {
+        "product": Field("h6.pdp-product__title"),
+        "brand": Field(
+            ".pdp-product-description__attribute--product_brand "
+            "span:not(.pdp-product-description__attribute--label)"
+        ),
+        "price": Field(".pdp-product__prices span.dropin-price"),
+        "meta_price": Field('meta[name="product:price-amount"]', attr="content"),
+        "color": Field(
+            ".pdp-product-description__attribute--color "
+            "span:not(.pdp-product-description__attribute--label)"
+        ),
+    }
+    # Read after the description accordion has been opened
+    _DESCRIPTION_FIELDS = {
+        "description": Field(".pdp-product__description--details.accordion-item-body"),
+        "features": Field(
+            ".pdp-product__description--details li, .pdp-product__description ul li", many=True
+        ),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(5)  # JS-rendered SPA, needs time to hydrate
-
-        # Click "load more products" button until all products are shown
-        for _ in range(30):
-            btn = await page.query_selector("button.pager-button")
-            if not btn:
-                break
-            try:
-                visible = await btn.is_visible()
-                if not visible:
-                    break
-                await btn.scroll_into_view_if_needed()
-                await btn.click()
-                await asyncio.sleep(3)
-                await random_delay(0.5, 1.5)
-            except Exception:
-                break
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=5)
+
+        # "Load more products": replay its JSON request page by page, else
+        # click it until all products are shown
+        api_urls = await paginate_by_load_more_api(
+            page, "button.pager-button", self._api_product_url, rate_limiter=self.rate_limiter
+        )
+        if api_urls is None:
+            await paginate_by_load_more(self, page, "button.pager-button", self.LISTING_READY[0],
+                                        max_clicks=30, wait_after_click=3)
 
         # Extract product URLs from product cards
-        urls = set()
+        urls = set(api_urls or [])
         links = await page.query_selector_all("a.product-item-title[href], a[data-link='pdp'][href]")
 
         for link in links:
@@ -52,9 +70,17 @@ class MothercareScraper(BaseStrollerScraper):
 
         return list(urls)
 
+    def _api_product_url(self, value: str) -> Optional[str]:
+        # hrefs are like /en/buy-...; the API may also give just the url key
+        if value.startswith("buy-") and "/" not in value and " " not in value:
+            value = f"/en/{value}"
+        if "/buy-" in value and value.startswith(("/", "http")):
+            return self._make_absolute(value.split("?")[0])
+        return None
+
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)  # Wait for JS to render product details
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=3)
 
         product = StrollerProduct()
 
@@ -77,28 +103,23 @@ class MothercareScraper(BaseStrollerScraper):
             if isinstance(brand_info, dict):
                 product.brand = brand_info.get("name", "")
 
+        dom = await self._extract_fields(page)
+
         # DOM fallbacks for title
         if not product.product:
-            product.product = await self._safe_text(page, "h6.pdp-product__title")
+            product.product = dom["product"]
 
         # DOM fallback for brand from attributes section
         if not product.brand:
-            product.brand = await self._safe_text(
-                page,
-                ".pdp-product-description__attribute--product_brand span:not(.pdp-product-description__attribute--label)"
-            )
+            product.brand = dom["brand"]
 
         # DOM fallback for price
         if not product.price:
-            price_text = await self._safe_text(page, ".pdp-product__prices span.dropin-price")
-            if price_text:
-                product.price = price_text.strip()
+            product.price = dom["price"]
 
         # Meta tag fallbacks
-        if not product.price:
-            meta_price = await self._safe_attr(page, 'meta[name="product:price-amount"]', "content")
-            if meta_price:
-                product.price = f"AED {meta_price}"
+        if not product.price and dom["meta_price"]:
+            product.price = f"AED {dom['meta_price']}"
 
         if not product.brand:
             # Try dataLayer
@@ -122,10 +143,7 @@ class MothercareScraper(BaseStrollerScraper):
                 pass
 
         # Color from attributes section
-        product.color = await self._safe_text(
-            page,
-            ".pdp-product-description__attribute--color span:not(.pdp-product-description__attribute--label)"
-        )
+        product.color = dom["color"]
 
         # Description from accordion
         if not product.description:
@@ -139,47 +157,31 @@ class MothercareScraper(BaseStrollerScraper):
                         await asyncio.sleep(0.5)
             except Exception:
                 pass
-            product.description = await self._safe_text(
-                page, ".pdp-product__description--details.accordion-item-body"
-            )
+        details = await self._extract_fields(page, self._DESCRIPTION_FIELDS)
+        if not product.description:
+            product.description = details["description"]
 
         # Features — try to get bullet points from description
-        features = await self._safe_all_text(
-            page,
-            ".pdp-product__description--details li, "
-            ".pdp-product__description ul li"
-        )
+        features = details["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
-        # Specs from attributes section
-        try:
-            attrs = await page.query_selector_all(".pdp-product-description__attribute")
-            for attr_el in attrs:
-                label_el = await attr_el.query_selector(".pdp-product-description__attribute--label")
-                if not label_el:
-                    continue
-                label = (await label_el.inner_text()).strip().lower()
-                # Get the sibling span (value)
-                spans = await attr_el.query_selector_all("span:not(.pdp-product-description__attribute--label)")
-                value = ""
-                for span in spans:
-                    text = (await span.inner_text()).strip()
-                    if text:
-                        value = text
-                        break
-
-                if not value:
-                    continue
-
-                if "weight" in label:
-                    product.weight = value
-                elif "colour" in label or "color" in label:
-                    if not product.color:
-                        product.color = value
-                elif "age" in label or "suitable" in label:
-                    product.suitable_for = value
-        except Exception:
-            pass
+        # Specs from attributes section (label span + sibling value span)
+        specs, _ = await self._extract_spec_pairs(
+            page, ".pdp-product-description__attribute",
+            pairs=(
+                ".pdp-product-description__attribute",
+                ".pdp-product-description__attribute--label",
+                "span:not(.pdp-product-description__attribute--label)",
+            ),
+        )
+        for label, value in specs.items():
+            if "weight" in label:
+                product.weight = value
+            elif "colour" in label or "color" in label:
+                if not product.color:
+                    product.color = value
+            elif "age" in label or "suitable" in label:
+                product.suitable_for = value
 
         return product
@@ -1,46 +1,73 @@
-import asyncio
-from typing import List, Optional
+import time
+from typing import AsyncIterator, List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class MumzworldScraper(BaseStrollerScraper):
     RETAILER_NAME = "Mumzworld"
     BASE_URL = "https://www.mumzworld.com"
     LISTING_URL = "https://www.mumzworld.com/en/travel-gear/strollers-prams"
+    DETAIL_WORKERS = 4
+    LISTING_READY = ()  # product links are only told apart by URL pattern
+    HARVEST_LISTING = True  # Algolia hits carry name, brand, price and image
+    PRODUCT_FIELDS = {
+        "product": Field("h1"),
+        "brand": Field("a[href*='/en/'][class*='brand'], a[href*='brand']"),
+        "price": Field("[class*='price'] span, [class*='Price']"),
+        "list_items": Field("ul li", many=True),
+    }
 
     async def _get_all_product_urls(self, page: Page) -> List[str]:
-        await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
-
-        # Mumzworld uses infinite scroll with Algolia backend
-        await self._scroll_to_bottom(page, pause=2.0, max_scrolls=60)
-
-        urls = set()
-        links = await page.query_selector_all("a[href*='/en/']")
-        for link in links:
-            href = await link.get_attribute("href")
-            if href and "/en/" in href and not any(x in href for x in [
-                "/travel-gear", "/strollers-prams", "/brand", "/category",
-                "/cart", "/account", "/wishlist", "/checkout",
-            ]):
-                # Product URLs typically have a long slug with SKU
-                parts = href.split("/en/")
-                if len(parts) > 1 and len(parts[1]) > 20 and "-" in parts[1]:
-                    clean = href.split("?")[0]
-                    urls.add(self._make_absolute(clean))
-
-        return list(urls)
+        return [url async for url in self._iter_product_urls(page)]
+
+    async def _iter_product_urls(self, page: Page) -> AsyncIterator[str]:
+        await self._goto(page, self._get_start_url())
+        await self._wait_ready(page, self.LISTING_READY, cap=3)
+
+        # Mumzworld uses infinite scroll with Algolia backend — hand out each
+        # batch of product links as it loads instead of after the last scroll
+        seen = set()
+        started = time.monotonic()
+        scrolls = 0
+        for _ in range(60):
+            for url in await self._product_links(page):
+                if url not in seen:
+                    seen.add(url)
+                    yield url
+
+            before, count = await self._scroll_once(page, "a[href*='/en/']")
+            scrolls += 1
+            if count <= before:
+                break
+        self._report_scroll(len(seen), scrolls, time.monotonic() - started)
+
+    async def _product_links(self, page: Page) -> List[str]:
+        # One round trip per scroll step, however many links are on the page
+        hrefs = await page.eval_on_selector_all(
+            "a[href*='/en/']", "links => links.map(a => a.getAttribute('href') || '')"
+        )
+        return [url for url in map(self._api_product_url, hrefs) if url]
+
+    def _api_product_url(self, value: str) -> Optional[str]:
+        if "/en/" in value and " " not in value and not any(x in value for x in [
+            "/travel-gear", "/strollers-prams", "/brand", "/category",
+            "/cart", "/account", "/wishlist", "/checkout",
+        ]):
+            # Product URLs typically have a long slug with SKU
+            parts = value.split("/en/")
+            if len(parts) > 1 and len(parts[1]) > 20 and "-" in parts[1]:
+                return self._make_absolute(value.split("?")[0])
+        return None
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -62,14 +89,15 @@ class MumzworldScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # Fallback / supplement with DOM
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1")
+            product.product = dom["product"]
 
         if not product.brand:
-            product.brand = await self._safe_text(page, "a[href*='/en/'][class*='brand'], a[href*='brand']")
+            product.brand = dom["brand"]
 
         if not product.price:
-            product.price = await self._safe_text(page, "[class*='price'] span, [class*='Price']")
+            product.price = dom["price"]
 
         # Extract specs from Overview/Details section
         # Mumzworld uses dt/dd pairs in specs
@@ -77,7 +105,7 @@ class MumzworldScraper(BaseStrollerScraper):
 
         # Also try extracting from all dt/dd on page
         if not specs:
-            specs = await self._extract_all_specs(page)
+            specs, _ = await self._extract_spec_pairs(page)
 
         product.weight = specs.get("weight", specs.get("product weight", specs.get("item weight", "")))
         product.color = specs.get("color", specs.get("colour", ""))
@@ -87,32 +115,9 @@ class MumzworldScraper(BaseStrollerScraper):
 
         # Features from bullet list
         if not product.description:
-            features_list = await self._safe_all_text(page, "ul li")
             # Filter to likely product features (not nav items)
-            features = [f for f in features_list if len(f) > 10 and len(f) < 200]
+            features = [f for f in dom["list_items"] if len(f) > 10 and len(f) < 200]
             if features:
                 product.features = " ; ".join(features[:15])
 
         return product
-
-    async def _extract_all_specs(self, page: Page) -> dict:
-        specs = {}
-        try:
-            pairs = await page.evaluate("""
-                () => {
-                    const specs = {};
-                    const dts = document.querySelectorAll('dt');
-                    dts.forEach(dt => {
-                        const dd = dt.nextElementSibling;
-                        if (dd && dd.tagName === 'DD') {
-                            specs[dt.textContent.trim().toLowerCase().replace(':', '')] = dd.textContent.trim();
-                        }
-                    });
-                    return specs;
-                }
-            """)
-            if pairs:
-                specs.update(pairs)
-        except Exception:
-            pass
-        return specs
@@ -1,13 +1,13 @@
-import asyncio
 from typing import List, Optional
 from playwright.async_api import Page
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from backends import MagentoBackend
+from base_scraper import BaseStrollerScraper, Field
+from http_engine import HtmlDocument
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class NananScraper(BaseStrollerScraper):
@@ -18,6 +18,25 @@ class NananScraper(BaseStrollerScraper):
     RETAILER_NAME = "Nanan"
     BASE_URL = "https://www.nanan.ae/en"
     LISTING_URL = "https://www.nanan.ae/en/strollers.html"
+    HTTP_DETAIL = True
+    BACKEND = MagentoBackend
+    BACKEND_OPTIONS = {"store": "en"}
+    LISTING_READY = ("a.product-item-link",)
+    LISTING_CARD = ".product-item"
+    CARD_FIELDS = {
+        "link": Field("a.product-item-link", attr="href"),
+        "product": Field("a.product-item-link"),
+        "brand": Field("[class*='brand']"),
+        "price": Field((".special-price .price", ".price-box .price")),
+        "image_url": Field("img.product-image-photo", attr="src"),
+    }
+    PRODUCT_FIELDS = {
+        "product": Field("h1.page-title span, h1.page-title, h1"),
+        "brand": Field("[class*='brand'], .product-brand"),
+        "price": Field(".price-wrapper .price, .special-price .price, [class*='price'] .price, .price-box .price"),
+        "description": Field("#product-description, .product.attribute.description, [class*='description']"),
+        "features": Field(".product-description li, [class*='feature'] li", many=True),
+    }
 
     # Known category pages to exclude
     _CATEGORY_PAGES = {
@@ -59,12 +78,13 @@ class NananScraper(BaseStrollerScraper):
         while page_num <= 20:
             url = f"{self._get_start_url()}?p={page_num}" if page_num > 1 else self._get_start_url()
             try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-                await asyncio.sleep(3)
+                await self._goto(page, url)
+                await self._wait_ready(page, self.LISTING_READY, cap=3)
             except Exception:
                 break
 
             # Use Magento-specific product link selector (most reliable)
+            await self._read_cards(page)
             links = await page.query_selector_all("a.product-item-link")
 
             # Fallback to broader selectors
@@ -87,14 +107,15 @@ class NananScraper(BaseStrollerScraper):
             if new_count == 0:
                 break
             page_num += 1
-            await random_delay(1.5, 3.0)
 
         # Fallback: try Magento search
         if not urls:
             try:
                 search_url = f"https://www.nanan.ae/en/catalogsearch/result/?q={self.keyword}"
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await asyncio.sleep(2)
+                await self._goto(page, search_url)
+                await self._wait_ready(page, self.LISTING_READY, cap=2)
+
+                await self._read_cards(page)
 
                 links = await page.query_selector_all("a.product-item-link, .product-item a[href$='.html']")
                 for link in links:
@@ -107,8 +128,8 @@ class NananScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(2)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=2)
 
         product = StrollerProduct()
 
@@ -129,22 +150,15 @@ class NananScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # Magento DOM selectors
+        dom = await self._extract_fields(page)
         if not product.product:
-            product.product = await self._safe_text(page, "h1.page-title span, h1.page-title, h1")
+            product.product = dom["product"]
         if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], .product-brand")
+            product.brand = dom["brand"]
         if not product.price:
-            product.price = await self._safe_text(
-                page,
-                ".price-wrapper .price, .special-price .price, "
-                "[class*='price'] .price, .price-box .price"
-            )
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(
-                page,
-                "#product-description, .product.attribute.description, "
-                "[class*='description']"
-            )
+            product.description = dom["description"]
 
         # Magento spec table
         specs = await self._extract_spec_table(page, ".additional-attributes, .product-specs, table.data")
@@ -153,8 +167,17 @@ class NananScraper(BaseStrollerScraper):
         product.frame_color = specs.get("frame color", specs.get("frame colour", ""))
         product.suitable_for = specs.get("suitable for", specs.get("age", specs.get("recommended age", "")))
 
-        features = await self._safe_all_text(page, ".product-description li, [class*='feature'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
         return product
+
+    def _parse_product_html(self, doc: HtmlDocument, url: str) -> Optional[StrollerProduct]:
+        product = super()._parse_product_html(doc, url)
+        specs = doc.specs
+        product.weight = specs.get("weight", "")
+        product.color = specs.get("color", specs.get("colour", ""))
+        product.frame_color = specs.get("frame color", specs.get("frame colour", ""))
+        product.suitable_for = specs.get("suitable for", specs.get("age", specs.get("recommended age", "")))
+        return product
@@ -6,9 +6,8 @@ from playwright.async_api import Page
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseStrollerScraper
+from base_scraper import BaseStrollerScraper, Field
 from models import StrollerProduct
-from anti_bot import random_delay
 
 
 class OunassScraper(BaseStrollerScraper):
@@ -20,6 +19,18 @@ class OunassScraper(BaseStrollerScraper):
     BASE_URL = "https://www.ounass.ae"
     LISTING_URL = "https://www.ounass.ae/kids/accessories/strollers/"
     RETRY_DELAY = 5.0
+    DETAIL_WORKERS = 2  # heavy SPA — more tabs start timing out
+    MAX_DETAIL_WORKERS = 4
+    LISTING_READY = ("a[href*='shop-'][href$='.html']",)
+    HARVEST_LISTING = True  # the search SPA loads each page of results as JSON
+    PRODUCT_FIELDS = {
+        "product": Field("h1, [class*='product-name'], [data-testid='product-name']"),
+        "brand": Field("[class*='brand'], [data-testid='product-brand'], [class*='designer']"),
+        "price": Field("[class*='price'], [data-testid='product-price']"),
+        "description": Field("[class*='detail'], [class*='description']"),
+        "features": Field("[class*='detail'] li, [class*='feature'] li", many=True),
+        "color": Field("[class*='color-name'], [class*='colorName'], [class*='selected-color']"),
+    }
 
     def _is_product_url(self, href: str) -> bool:
         """Check if URL is a product page (not category/nav)."""
@@ -35,14 +46,19 @@ class OunassScraper(BaseStrollerScraper):
             return True
         return False
 
+    def _api_product_url(self, value: str) -> Optional[str]:
+        if " " not in value and self._is_product_url(value):
+            return self._make_absolute(value.split("?")[0])
+        return None
+
     async def _get_all_product_urls(self, page: Page) -> List[str]:
         # Ounass search works well — use it as primary approach
         search_url = f"{self.BASE_URL}/search/?q={self.keyword}"
-        await page.goto(search_url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(5)
+        await self._goto(page, search_url)
+        await self._wait_ready(page, self.LISTING_READY, cap=5)
 
         # Scroll to load all products
-        await self._scroll_to_bottom(page, pause=2.0, max_scrolls=30)
+        await self._scroll_load(page, self.LISTING_READY[0], max_scrolls=30)
 
         urls = set()
         links = await page.query_selector_all("a[href]")
@@ -55,9 +71,9 @@ class OunassScraper(BaseStrollerScraper):
 
         # Fallback: try the listing URL directly
         if not urls:
-            await page.goto(self._get_start_url(), wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(4)
-            await self._scroll_to_bottom(page, pause=2.0, max_scrolls=20)
+            await self._goto(page, self._get_start_url())
+            await self._wait_ready(page, self.LISTING_READY, cap=4)
+            await self._scroll_load(page, self.LISTING_READY[0], max_scrolls=20)
 
             links = await page.query_selector_all("a[href]")
             for link in links:
@@ -70,8 +86,8 @@ class OunassScraper(BaseStrollerScraper):
         return list(urls)
 
     async def _scrape_product_page(self, page: Page, url: str) -> Optional[StrollerProduct]:
-        await page.goto(url, wait_until="domcontentloaded", timeout=self.PAGE_LOAD_TIMEOUT)
-        await asyncio.sleep(3)
+        await self._goto(page, url)
+        await self._wait_ready(page, self.PRODUCT_READY, cap=3)
 
         product = StrollerProduct()
 
@@ -93,13 +109,6 @@ class OunassScraper(BaseStrollerScraper):
                 product.brand = brand_info.get("name", "")
 
         # DOM fallbacks
-        if not product.product:
-            product.product = await self._safe_text(page, "h1, [class*='product-name'], [data-testid='product-name']")
-        if not product.brand:
-            product.brand = await self._safe_text(page, "[class*='brand'], [data-testid='product-brand'], [class*='designer']")
-        if not product.price:
-            product.price = await self._safe_text(page, "[class*='price'], [data-testid='product-price']")
-
         # Expand details section
         try:
             details_btn = await page.query_selector(
@@ -112,18 +121,24 @@ class OunassScraper(BaseStrollerScraper):
         except Exception:
             pass
 
+        # DOM fallbacks, read once the details are expanded
+        dom = await self._extract_fields(page)
+        if not product.product:
+            product.product = dom["product"]
+        if not product.brand:
+            product.brand = dom["brand"]
+        if not product.price:
+            product.price = dom["price"]
         if not product.description:
-            product.description = await self._safe_text(page, "[class*='detail'], [class*='description']")
+            product.description = dom["description"]
 
         # Features
-        features = await self._safe_all_text(page, "[class*='detail'] li, [class*='feature'] li")
+        features = dom["features"]
         if features:
             product.features = " ; ".join(features[:15])
 
         # Color
         if not product.color:
-            product.color = await self._safe_text(
-                page, "[class*='color-name'], [class*='colorName'], [class*='selected-color']"
-            )
+            product.color = dom["color"]
 
         return product
@@ -0,0 +1,93 @@
+import heapq
+import json
+import os
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+
+class RunHistory:
+    """Remembers how long each retailer took so runs can be scheduled.
+
+    After a retailer finishes normally its listing, detail and wall times,
+    URL count and the number of detail pages it actually loaded are stored
+    (smoothed over runs). Retailers expected to take longest are started first, so a slow
+    retailer never starts last and leaves the whole job waiting on it.
+
+    The estimate is the wall time itself: listing and detail overlap when
+    URLs are streamed, and products taken from a listing or a catalogue
+    API load no page at all, so neither a listing+detail sum nor a rate
+    times the URL count matches what a run costs.
+    """
+
+    FILENAME = "run_history.json"
+    SMOOTHING = 0.5  # weight of the newest run
+
+    def __init__(self, state_dir: str):
+        os.makedirs(state_dir, exist_ok=True)
+        self.path = os.path.join(state_dir, self.FILENAME)
+
+    def _load(self) -> Dict[str, dict]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {}
+
+    def record(self, retailer: str, timings: dict):
+        """Store one run's listing/detail/wall seconds, url_count and detail_pages."""
+        if "listing_seconds" not in timings or "seconds" not in timings:
+            return  # never got past the listing
+        sample = {
+            "listing_seconds": timings["listing_seconds"],
+            "detail_seconds": timings.get("detail_seconds", 0.0),
+            "seconds": timings["seconds"],
+            "url_count": timings.get("url_count", 0),
+            "detail_pages": timings.get("detail_pages", 0),
+        }
+
+        # Same re-read + atomic swap as ConcurrencyStore, for parallel writers
+        state = self._load()
+        previous = state.get(retailer)
+        if previous:
+            a = self.SMOOTHING
+            for key, value in sample.items():
+                sample[key] = a * value + (1 - a) * previous[key]
+            sample["runs"] = previous["runs"] + 1
+        else:
+            sample["runs"] = 1
+        state[retailer] = sample
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def expected_seconds(self, retailer: str, state: Optional[dict] = None) -> Optional[float]:
+        entry = (state if state is not None else self._load()).get(retailer)
+        return entry["seconds"] if entry else None
+
+    def schedule(self, names: List[str], slots: int) -> Tuple[List[str], Optional[float]]:
+        """Order ``names`` longest-expected-first and predict the makespan.
+
+        Retailers without history are assumed to take the median of the
+        known ones. The prediction simulates ``slots`` retailers running at
+        once, each starting as soon as a slot frees up; it is None when
+        nothing about these retailers is known yet.
+        """
+        state = self._load()
+        known = {n: self.expected_seconds(n, state) for n in names}
+        known = {n: s for n, s in known.items() if s is not None}
+        if not known:
+            return list(names), None
+
+        fallback = statistics.median(known.values())
+        expected = {n: known.get(n, fallback) for n in names}
+        # sorted() is stable, so ties keep the caller's order
+        ordered = sorted(names, key=lambda n: -expected[n])
+
+        finish_times = [0.0] * max(1, min(slots, len(ordered)))
+        for name in ordered:
+            earliest = heapq.heappop(finish_times)
+            heapq.heappush(finish_times, earliest + expected[name])
+        return ordered, max(finish_times)
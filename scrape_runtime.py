@@ -0,0 +1,113 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Optional
+
+from browser_pool import BrowserPool
+from rate_limiter import HostRateLimiter
+from main import run_all_scrapers
+
+
+class ScrapeRuntime:
+    """Long-lived scrape runtime for the web app.
+
+    Owns one event loop on a background thread plus a warm BrowserPool and
+    HostRateLimiter, all started at app boot. Jobs are submitted as
+    coroutines to that loop, so a new job starts logging straight away
+    instead of first creating a loop, starting the Playwright driver and
+    launching Chromium. A watchdog relaunches the browser if it dies
+    between jobs.
+    """
+
+    HEALTH_INTERVAL = 30.0  # seconds between browser checks
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self.logger = logging.getLogger("runtime")
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.pool: Optional[BrowserPool] = None
+        self.rate_limiter: Optional[HostRateLimiter] = None
+        self.started_at: Optional[float] = None
+        self.active_jobs = 0
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._start_lock = threading.Lock()
+        self._watchdog_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        with self._start_lock:
+            if self.is_running():
+                return
+            self._ready.clear()
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, name="scrape-runtime", daemon=True)
+            self._thread.start()
+            self._ready.wait(timeout=10)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.pool = BrowserPool(headless=self.headless)
+        self.rate_limiter = HostRateLimiter()
+        self.started_at = time.time()
+        self._watchdog_task = self.loop.create_task(self._watchdog())
+        self.loop.call_soon(self._ready.set)  # only once the loop is really running
+        self.loop.run_forever()
+
+    async def _watchdog(self):
+        while True:
+            if not self.pool.is_healthy():
+                try:
+                    await self.pool.start()
+                    self.logger.info(f"Browser ready (launch #{self.pool.launch_count})")
+                except Exception:
+                    self.logger.exception("Could not launch browser — retrying")
+            await asyncio.sleep(self.HEALTH_INTERVAL)
+
+    def is_running(self) -> bool:
+        return (self._thread is not None and self._thread.is_alive()
+                and self.loop is not None and self.loop.is_running())
+
+    def run_scrape(self, **kwargs) -> concurrent.futures.Future:
+        """Start run_all_scrapers on the runtime; returns a future for its products."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self._tracked(kwargs), self.loop)
+
+    async def _tracked(self, kwargs):
+        self.active_jobs += 1
+        try:
+            return await run_all_scrapers(
+                browser_pool=self.pool, rate_limiter=self.rate_limiter, **kwargs,
+            )
+        finally:
+            self.active_jobs -= 1
+
+    def health(self) -> dict:
+        running = self.is_running()
+        return {
+            "ok": running and self.pool is not None and self.pool.is_healthy(),
+            "loop_running": running,
+            "browser_connected": self.pool is not None and self.pool.is_healthy(),
+            "browser_launches": self.pool.launch_count if self.pool else 0,
+            "active_jobs": self.active_jobs,
+            "uptime_seconds": round(time.time() - self.started_at) if self.started_at else 0,
+        }
+
+    def stop(self, timeout: float = 10.0):
+        if not self.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+    async def _shutdown(self):
+        self._watchdog_task.cancel()
+        try:
+            await self._watchdog_task
+        except asyncio.CancelledError:
+            pass
+        await self.pool.close()
@@ -0,0 +1,201 @@
+"""
+Process-pool sharding for run_all_scrapers.
+
+Retailers are spread over worker processes, each with its own event loop,
+Chromium and rate limiter, so JSON-LD parsing, normalization and
+Playwright traffic for different retailers use different cores. Workers
+pull retailer names from a shared queue (so a slow retailer never holds
+up a whole shard) and stream status messages, checkpoint updates and
+normalized product batches back to the parent, which keeps doing all
+accounting and CSV output exactly as in the single-process path.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+from dataclasses import asdict
+from typing import Callable, Dict, List
+
+from models import StrollerProduct
+
+PRODUCT_BATCH_SIZE = 50
+POLL_INTERVAL = 0.5  # seconds between stop/skip checks in the parent
+
+
+class ShardProgress:
+    """ProgressTracker stand-in for worker processes.
+
+    Reads come from a snapshot of the parent's checkpoint; writes are sent
+    to the parent, which owns the one real checkpoint file.
+    """
+
+    def __init__(self, scraped_urls: Dict[str, List[str]], events):
+        self._scraped = {r: set(urls) for r, urls in scraped_urls.items()}
+        self._events = events
+
+    def is_already_scraped(self, retailer: str, url: str) -> bool:
+        return url in self._scraped.get(retailer, ())
+
+    def mark_scraped(self, retailer: str, url: str):
+        self._scraped.setdefault(retailer, set()).add(url)
+        self._events.put(("scraped", retailer, url))
+
+    def update(self, retailer: str, current: int, total: int):
+        pct = int((current / total) * 100) if total > 0 else 0
+        print(f"  [{retailer}] {current}/{total} ({pct}%)")
+
+
+def _shard_main(work, events, stop_event, skip_names, options, scraped_urls):
+    """Worker process entry point."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    )
+    try:
+        asyncio.run(_run_shard(work, events, stop_event, skip_names, options, scraped_urls))
+    finally:
+        events.put(("exit",))
+
+
+async def _run_shard(work, events, stop_event, skip_names, options, scraped_urls):
+    from retailers import get_scraper_registry
+    from browser_pool import BrowserPool
+    from rate_limiter import HostRateLimiter
+    from concurrency import ConcurrencyStore
+    from exporter import normalize_product
+    from profiles import ProfileStore
+
+    registry = get_scraper_registry()
+    progress = ShardProgress(scraped_urls, events)
+    rate_limiter = HostRateLimiter()
+    concurrency_store = ConcurrencyStore(options["state_dir"])
+    profile_store = ProfileStore(options["profile_root"]) if options.get("profile_root") else None
+
+    def should_stop():
+        return stop_event.is_set()
+
+    def should_skip(name):
+        # The parent names each retailer to skip; its scraper consumes the entry
+        return skip_names.pop(name, False)
+
+    def on_status(msg):
+        events.put(("status", msg))
+
+    async def worker(pool):
+        while not should_stop():
+            try:
+                name = work.get_nowait()
+            except queue.Empty:
+                return
+            events.put(("started", name))
+            scraper = registry[name](
+                progress=progress,
+                headless=options["headless"],
+                keyword=options["keyword"],
+                keywords=options["keywords"],
+                on_status=on_status,
+                should_stop=should_stop,
+                should_skip=should_skip,
+                browser_pool=pool,
+                rate_limiter=rate_limiter,
+                concurrency_store=concurrency_store,
+                profile_store=profile_store,
+                fast=options.get("fast", False),
+            )
+            try:
+                products = [normalize_product(p) for p in await scraper.run()]
+            except Exception as e:
+                logging.exception(f"Failed to scrape {name}")
+                events.put(("failed", name, str(e)))
+                continue
+            for i in range(0, len(products), PRODUCT_BATCH_SIZE):
+                batch = [asdict(p) for p in products[i:i + PRODUCT_BATCH_SIZE]]
+                events.put(("products", name, batch))
+            events.put(("finished", name, scraper._was_skipped, scraper.timings))
+
+    async with BrowserPool(headless=options["headless"]) as pool:
+        await asyncio.gather(*(worker(pool) for _ in range(options["retailers_per_process"])))
+
+
+async def run_sharded(
+    names: List[str],
+    processes: int,
+    options: dict,
+    progress,
+    on_started: Callable[[str], None],
+    on_status: Callable[[str], None],
+    on_finished: Callable[..., None],
+    on_failed: Callable[[str, str], None],
+    should_stop=None,
+    should_skip=None,
+):
+    """Scrape ``names`` across worker processes, reporting through the callbacks."""
+    ctx = multiprocessing.get_context("spawn")
+    loop = asyncio.get_running_loop()
+
+    with ctx.Manager() as manager:
+        work = manager.Queue()
+        for name in names:
+            work.put(name)
+        events = manager.Queue()
+        stop_event = manager.Event()
+        skip_names = manager.dict()  # retailer name -> True, until its scraper sees it
+        snapshot = {r: list(urls) for r, urls in progress.state["scraped_urls"].items()}
+
+        procs = [
+            ctx.Process(
+                target=_shard_main,
+                args=(work, events, stop_event, skip_names, options, snapshot),
+                daemon=True,
+            )
+            for _ in range(max(1, min(processes, len(names))))
+        ]
+        for p in procs:
+            p.start()
+
+        batches: Dict[str, List[StrollerProduct]] = {}
+        in_flight = set()
+        running = len(procs)
+
+        while running:
+            if should_stop and should_stop():
+                stop_event.set()
+            for name in list(in_flight):
+                if should_skip and should_skip(name):
+                    skip_names[name] = True
+
+            try:
+                event = await loop.run_in_executor(None, events.get, True, POLL_INTERVAL)
+            except queue.Empty:
+                running = sum(1 for p in procs if p.is_alive())
+                continue
+
+            kind = event[0]
+            if kind == "exit":
+                running -= 1
+            elif kind == "status":
+                on_status(event[1])
+            elif kind == "scraped":
+                progress.mark_scraped(event[1], event[2])
+            elif kind == "started":
+                in_flight.add(event[1])
+                on_started(event[1])
+            elif kind == "products":
+                batches.setdefault(event[1], []).extend(
+                    StrollerProduct(**d) for d in event[2]
+                )
+            elif kind == "finished":
+                in_flight.discard(event[1])
+                on_finished(event[1], batches.pop(event[1], []), event[2], event[3])
+            elif kind == "failed":
+                in_flight.discard(event[1])
+                batches.pop(event[1], None)
+                on_failed(event[1], event[2])
+
+        for p in procs:
+            p.join(timeout=5)
+
+        # A worker that died mid-retailer never reports back
+        for name in sorted(in_flight):
+            on_failed(name, "worker process exited unexpectedly")
@@ -4,6 +4,7 @@ let elapsedTimer = null;
 let startTime = null;
 let selectedRetailers = [];
 let retailerStates = {};   // name -> 'pending' | 'active' | 'done' | 'failed'
+let startedOrder = [];     // retailers in the order they started, for Skip Brand
 let totalProducts = 0;
 let completedRetailers = 0;
 
@@ -81,6 +82,7 @@ async function startScraping() {
     totalProducts = 0;
     completedRetailers = 0;
     retailerStates = {};
+    startedOrder = [];
     selectedRetailers.forEach(name => { retailerStates[name] = 'pending'; });
 
     // Show progress section
@@ -125,7 +127,11 @@ async function startScraping() {
         const res = await fetch('/api/product-scrape', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ keyword, retailers: selectedRetailers }),
+            body: JSON.stringify({
+                keyword,
+                retailers: selectedRetailers,
+                fast: document.getElementById('fastMode').checked,
+            }),
         });
         const data = await res.json();
 
@@ -153,6 +159,8 @@ function buildTrackerChips() {
         chip.className = 'tracker-chip';
         chip.textContent = name;
         chip.id = `tracker-${name.replace(/[^a-zA-Z0-9]/g, '')}`;
+        // Several retailers can run at once — clicking a running one skips it
+        chip.onclick = () => { if (retailerStates[name] === 'active') skipBrand(name); };
         grid.appendChild(chip);
     });
 }
@@ -269,6 +277,7 @@ function handleLogMessage(message) {
     if (scrapingMatch) {
         const name = scrapingMatch[1];
         retailerStates[name] = 'active';
+        startedOrder.push(name);
         updateTrackerChip(name, 'active');
         setActionText(`Scraping ${name}...`, false);
         // Re-enable skip button for the new retailer
@@ -374,13 +383,23 @@ function handleLogMessage(message) {
 
 // ─── Skip / Stop controls ───────────────────────────────────────────────
 
-async function skipBrand() {
+async function skipBrand(name) {
     if (!currentJobId) return;
+    // Without a name (the Skip Brand button), skip the most recently started retailer
+    const retailer = name || startedOrder.filter(n => retailerStates[n] === 'active').pop();
+    if (!retailer) return;
     const btn = document.getElementById('skipBtn');
-    btn.disabled = true;
-    btn.textContent = 'Skipping...';
+    if (!name) {
+        btn.disabled = true;
+        btn.textContent = 'Skipping...';
+    }
+    setActionText(`Skipping ${retailer}...`, false);
     try {
-        await fetch(`/api/skip/${currentJobId}`, { method: 'POST' });
+        await fetch(`/api/skip/${currentJobId}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ retailer }),
+        });
     } catch (e) {
         console.error('Skip request failed:', e);
         btn.disabled = false;
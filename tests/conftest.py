@@ -0,0 +1,37 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Modules live at the repo root, as the scrapers import them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+@pytest.fixture
+def fixture_text():
+    def read(name: str) -> str:
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            return f.read()
+    return read
+
+
+@pytest.fixture
+def fixture_json(fixture_text):
+    return lambda name: json.loads(fixture_text(name))
+
+
+@pytest.fixture
+def mapped(fixture_json):
+    """Every item of a catalogue fixture, through a backend's ``_product``.
+
+    ``keys`` lead from the top of the JSON document to its list of items.
+    """
+    def load(backend, name: str, *keys: str) -> list:
+        items = fixture_json(name)
+        for key in keys:
+            items = items[key]
+        return [backend._product(item) for item in items]
+    return load
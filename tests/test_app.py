@@ -0,0 +1,35 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("playwright")
+
+import app  # noqa: E402
+
+
+def test_job_meta_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "TEMP_DIR", str(tmp_path))
+    created = datetime(2026, 10, 17, 9, 30)
+    job = {
+        "id": "abc12345",
+        "status": "completed",
+        "progress": 100,
+        "messages": ["Done! Exported 3 products to CSV."],
+        "summary": {"total": 3},
+        "csv_filepath": str(tmp_path / "abc12345_stroller_products.csv"),
+        "csv_filename": "stroller_products.csv",
+        "error": None,
+        "created_at": created,
+        "skip_retailers": {"Mumzworld"},
+        "stop_requested": False,
+        "stopped_early": False,
+    }
+
+    app._save_job_meta("abc12345", job)
+    loaded = app._load_job_meta("abc12345")
+
+    assert loaded["created_at"] == created
+    assert "skip_retailers" not in loaded
+    assert {k: v for k, v in loaded.items() if k != "created_at"} == {
+        k: v for k, v in job.items() if k not in ("created_at", "skip_retailers")}
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import os
+
+from concurrency import AdaptiveConcurrency, ConcurrencyStore
+
+
+def test_store_round_trips_limits(tmp_path):
+    store = ConcurrencyStore(str(tmp_path / "state"))
+    assert store.get("Mumzworld", 3) == 3
+    store.save("Mumzworld", 5)
+    store.save("Ounass", 2)
+    assert ConcurrencyStore(str(tmp_path / "state")).get("Mumzworld", 3) == 5
+    assert store.get("Ounass", 3) == 2
+
+
+def test_store_rereads_before_writing(tmp_path):
+    a = ConcurrencyStore(str(tmp_path))
+    b = ConcurrencyStore(str(tmp_path))
+    a.save("Mumzworld", 4)
+    b.save("Babyshop", 2)  # must not drop a's entry
+    with open(a.path) as f:
+        assert json.load(f) == {"Mumzworld": 4, "Babyshop": 2}
+    assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
+
+
+def test_store_ignores_a_corrupt_file(tmp_path):
+    store = ConcurrencyStore(str(tmp_path))
+    with open(store.path, "w") as f:
+        f.write("{not json")
+    assert store.get("Mumzworld", 3) == 3
+    store.save("Mumzworld", 1)
+    assert store.get("Mumzworld", 3) == 1
+
+
+def test_limit_grows_after_a_healthy_window():
+    c = AdaptiveConcurrency(initial=2, maximum=4)
+    changed = [c.record(1.0, ok=True) for _ in range(c.WINDOW)]
+    assert changed[-1] and not any(changed[:-1])
+    assert c.limit == 3
+
+
+def test_errors_or_slow_pages_halve_the_limit():
+    c = AdaptiveConcurrency(initial=4, maximum=6)
+    for n in range(c.WINDOW):
+        c.record(1.0, ok=n >= 2)  # 2 of 6 failed > MAX_ERROR_RATE
+    assert c.limit == 2
+
+    c = AdaptiveConcurrency(initial=4, maximum=6)
+    for _ in range(c.WINDOW):
+        c.record(c.SLOW_LATENCY + 1, ok=True)
+    assert c.limit == 2
+
+
+def test_timeout_halves_at_most_once_per_window():
+    c = AdaptiveConcurrency(initial=6, maximum=6)
+    assert c.record(30.0, ok=False, timed_out=True)
+    assert c.limit == 3
+    assert not c.record(30.0, ok=False, timed_out=True)
+    assert c.limit == 3
+
+
+def test_limit_stays_within_bounds():
+    c = AdaptiveConcurrency(initial=10, minimum=2, maximum=3)
+    assert c.limit == 3
+    for _ in range(c.WINDOW):
+        c.record(1.0, ok=True)
+    assert c.limit == 3
+    c.record(30.0, ok=False, timed_out=True)
+    c._since_decrease = c.WINDOW
+    c.record(30.0, ok=False, timed_out=True)
+    assert c.limit == 2
+
+
+def test_acquire_waits_for_a_free_slot():
+    async def run():
+        c = AdaptiveConcurrency(initial=1)
+        await c.acquire()
+        waiter = asyncio.ensure_future(c.acquire())
+        await asyncio.sleep(0.01)
+        blocked = not waiter.done()
+        await c.release()
+        await asyncio.wait_for(waiter, 1)
+        return blocked
+
+    assert asyncio.run(run())
@@ -0,0 +1,45 @@
+from http_engine import HtmlDocument, html_text
+
+
+def test_html_document_reads_product_page(fixture_text):
+    doc = HtmlDocument(fixture_text("product_page.html"), "https://www.example.ae/en/joie-litetrax-4")
+
+    # Malformed JSON-LD is dropped; the Product is found inside @graph
+    assert len(doc.json_ld) == 2
+    assert doc.json_ld_product()["offers"]["price"] == "1199.00"
+    assert doc.next_data == {"props": {"pageProps": {"sku": "JL4-COAL"}}}
+
+    # Keys are lowercased, first one wins, content is stripped
+    assert doc.meta["og:title"] == "Joie Litetrax 4 Stroller - Coal"
+    assert doc.meta["description"] == "Four-wheel stroller"
+
+    assert doc.h1 == "Joie Litetrax 4 Stroller"
+    assert doc.links == ["/en/strollers?page=2", "/en/joie-litetrax-4?colour=coal",
+                         "/en/joie-litetrax-4", "/en/bugaboo-fox-5"]
+    assert doc.links_containing("/en/joie") == ["/en/joie-litetrax-4"]
+
+    # Only two-cell rows with a value become specs
+    assert doc.specs == {
+        "weight": "9.7 kg",
+        "colour": "Coal & Grey",
+        "suitable for": "Birth to 22 kg",
+        "folded size": "54 x 33 x 92 cm",
+    }
+
+
+def test_json_ld_product_in_a_list_or_missing():
+    html = ('<script type="application/ld+json">'
+            '[{"@type": "Organization"}, {"@type": "ProductGroup", "name": "Fox 5"}]</script>')
+    assert HtmlDocument(html).json_ld_product() == {"@type": "ProductGroup", "name": "Fox 5"}
+    assert HtmlDocument("<p>No structured data</p>").json_ld_product() is None
+
+
+def test_html_text_flattens_and_collects_list_items():
+    text, items = html_text(
+        "<p>Light&nbsp;and compact.</p><style>p { color: red }</style>"
+        "<ul><li> One-hand <b>fold</b> </li><li></li><li>Cabin size</li></ul>"
+        "<script>var x = 1;</script>"
+    )
+    assert text == "Light and compact. One-hand fold Cabin size"
+    assert items == ["One-hand fold", "Cabin size"]
+    assert html_text(None) == ("", [])
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from listing_harvester import ListingHarvester, fill_missing, parse_price
+from models import StrollerProduct
+
+
+def _to_url(value: str) -> Optional[str]:
+    """Like Mumzworld's _api_product_url: long /en/ slugs only."""
+    path = value.split("example.ae")[-1].split("?")[0]
+    if path.startswith("/en/") and "/" not in path[4:] and len(path) > 24:
+        return f"https://www.example.ae{path}"
+    return None
+
+
+def test_parse_price():
+    assert parse_price(1199) == "AED 1199"
+    assert parse_price(12.5) == "AED 12.5"
+    assert parse_price(0) == ""
+    assert parse_price(True) == ""
+    assert parse_price("4,299.00") == "AED 4,299.00"
+    assert parse_price(" SAR 99 ") == "SAR 99"
+    assert parse_price("Call us") == ""
+    assert parse_price("0.00") == ""
+    assert parse_price("AED 0") == ""
+    assert parse_price({"AED": {"default": 1199}}) == "AED 1199"
+    assert parse_price({"regular": 10, "sale": 8}) == "AED 8"
+    assert parse_price({"value": None, "amount": "15"}) == "AED 15"
+    assert parse_price(None) == ""
+
+
+def test_fill_missing_copies_only_empty_data_fields():
+    product = StrollerProduct(product="Fox 5", price="AED 4299", link="https://a/1")
+    other = StrollerProduct(product="Bugaboo Fox 5", brand="Bugaboo", weight="9.9 kg",
+                            link="https://b/2", keywords="strollers")
+    assert fill_missing(product, other) == ["brand", "weight"]
+    assert (product.product, product.brand, product.weight) == ("Fox 5", "Bugaboo", "9.9 kg")
+    assert (product.link, product.keywords) == ("https://a/1", "")  # bookkeeping fields untouched
+
+
+def test_harvest_reads_common_listing_shapes(fixture_json):
+    harvester = ListingHarvester(_to_url, "Example")
+    assert harvester.harvest(fixture_json("algolia_listing.json")) == 2
+
+    joie = harvester.get("https://www.example.ae/en/joie-litetrax-4-stroller-coal-1001")
+    assert (joie.product, joie.brand, joie.price, joie.image_url) == (
+        "Joie Litetrax 4 Stroller", "Joie", "AED 1199", "https://cdn.example.ae/joie-litetrax.jpg")
+
+    fox = harvester.get("https://www.example.ae/en/bugaboo-fox-5-complete-black-1002")
+    # finalPrice wins over the list price
+    assert (fox.product, fox.brand, fox.price, fox.image_url) == (
+        "Bugaboo Fox 5 Complete", "Bugaboo", "AED 4,299.00", "https://cdn.example.ae/fox5.jpg")
+
+    # The category facet has a name but no product URL
+    assert len(harvester.products) == 2
+
+
+def test_add_merges_and_records_each_fields_source(fixture_json):
+    harvester = ListingHarvester(_to_url)
+    harvester.harvest(fixture_json("algolia_listing.json"))
+    url = "https://www.example.ae/en/joie-litetrax-4-stroller-coal-1001"
+    harvester.add(StrollerProduct(product="Card name", brand="Card brand", color="Coal", link=url), "card")
+
+    merged = harvester.get(url)
+    assert (merged.product, merged.brand, merged.color) == ("Joie Litetrax 4 Stroller", "Joie", "Coal")
+    assert harvester.sources[url] == {"product": "listing-api", "brand": "listing-api",
+                                      "price": "listing-api", "image_url": "listing-api",
+                                      "color": "card"}
+
+
+def test_harvest_ignores_non_product_json():
+    harvester = ListingHarvester(_to_url)
+    assert harvester.harvest({"facets": {"brand": ["Joie"]}, "page": 2}) == 0
+    assert harvester.harvest([1, "two", None]) == 0
+    assert harvester.products == {}
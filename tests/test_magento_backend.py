@@ -0,0 +1,76 @@
+import asyncio
+
+from backends import MagentoBackend
+
+
+class _Backend(MagentoBackend):
+    """Answers the category lookup from ``categories`` and records the paths asked for."""
+
+    def __init__(self, categories=None, **options):
+        super().__init__(None, "https://www.example.ae/en", **options)
+        self.categories = categories or {}
+        self.asked = []
+
+    async def _post(self, payload):
+        path = payload["variables"]["path"]
+        self.asked.append(path)
+        if path == "broken":
+            raise RuntimeError("Cannot query field \"uid\" on type \"CategoryTree\"")
+        uid = self.categories.get(path)
+        return {"data": {"categoryList": [{"uid": uid}] if uid else []}}
+
+
+def test_product_mapping(mapped):
+    backend = MagentoBackend(None, "https://www.example.ae/en/", brand_field="manufacturer_name")
+    joie, nuna, missing = mapped(backend, "magento_products.json", "data", "products", "items")
+
+    assert joie.product == "Joie Litetrax 4"
+    assert joie.link == "https://www.example.ae/en/joie-litetrax-4.html"
+    assert joie.brand == "Joie"
+    assert joie.price == "AED 1199.5"
+    assert joie.image_url.endswith("/jl4.jpg")
+    # An empty description falls through to the short one
+    assert joie.description == "All-terrain stroller. Reversible seat"
+    assert joie.features == "Reversible seat"
+    assert joie.weight == "9.7 kg"
+
+    # Option ids, zero prices, placeholders and zero weights are left empty
+    assert nuna.link == "https://www.example.ae/en/nuna-trvl.html"
+    assert (nuna.brand, nuna.price, nuna.image_url, nuna.weight) == ("", "", "", "")
+    assert nuna.description == "Compact stroller."
+
+    assert missing is None
+
+
+def test_brand_is_only_queried_and_required_with_brand_field():
+    plain = MagentoBackend(None, "https://www.example.ae")
+    branded = MagentoBackend(None, "https://www.example.ae", brand_field="manufacturer_name")
+    assert "manufacturer_name" not in plain.query
+    assert "manufacturer_name" in branded.query
+    assert (plain.unavailable, branded.unavailable) == (("brand",), ())
+
+
+def test_url_uses_prefix_for_relative_paths():
+    backend = MagentoBackend(None, "https://www.example.ae", url_prefix="https://www.example.ae/en/")
+    assert backend._url({"canonical_url": "/strollers/fox.html"}) == "https://www.example.ae/en/strollers/fox.html"
+    assert backend._url({"url_key": "fox"}) == "https://www.example.ae/en/fox"
+    assert backend._url({}) == ""
+
+
+def test_category_uid_from_listing_path():
+    backend = _Backend({"gear/strollers": "MTI="})
+    assert asyncio.run(backend._category_uid("https://www.example.ae/en/gear/strollers.html")) == "MTI="
+    assert asyncio.run(backend._category_uid("https://www.example.ae/en/unknown/")) is None
+    assert backend.asked == ["gear/strollers", "unknown"]
+
+
+def test_category_uid_skips_search_pages_and_old_schemas():
+    backend = _Backend({"strollers": "MTI="})
+    for url in ("https://www.example.ae/en/catalogsearch/result/?q=stroller",
+                "https://www.example.ae/en/strollers.html?p=2",
+                "https://www.example.ae/ar/strollers.html",
+                "https://www.example.ae/en/"):
+        assert asyncio.run(backend._category_uid(url)) is None
+    assert backend.asked == []
+
+    assert asyncio.run(backend._category_uid("https://www.example.ae/en/broken.html")) is None
@@ -0,0 +1,68 @@
+import asyncio
+
+from backends import OdooBackend
+
+BASE_URL = "https://www.example.ae"
+
+
+class _Backend(OdooBackend):
+    """Answers JSON-RPC calls from ``answers`` (route -> result, or an exception to raise)."""
+
+    def __init__(self, answers):
+        super().__init__(None, BASE_URL)
+        self.answers = answers
+        self.asked = []
+
+    async def _call(self, route, params):
+        self.asked.append((route, params.get("term"), params["options"].get("category")))
+        answer = self.answers[route]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer(params) if callable(answer) else answer
+
+
+def _results(fixture_json):
+    return fixture_json("odoo_autocomplete.json")["result"]["results"]
+
+
+def test_product_mapping(mapped):
+    belecoo, doona, missing = mapped(OdooBackend(None, BASE_URL), "odoo_autocomplete.json", "result", "results")
+
+    assert belecoo.product == "Belecoo Baby Stroller"
+    assert belecoo.link == "https://www.example.ae/shop/belecoo-baby-stroller-1243"
+    assert belecoo.price == "1,299.00 AED"
+    assert belecoo.image_url == "https://www.example.ae/web/image/product.template/1243/image_1024"
+    assert belecoo.description == "Lightweight two-way stroller."
+    assert belecoo.travel_friendly == "Yes"
+
+    assert doona.link == "https://www.example.ae/shop/doona-car-seat-stroller-1250"
+    assert doona.price == "AED 2850"
+    assert doona.image_url == "https://www.example.ae/web/image/product.template/1250/image_1024"
+    # Cut at MAX_CHARS, so the detail page has to supply it
+    assert doona.description == ""
+    assert doona.travel_friendly == ""
+
+    assert missing is None
+
+
+def test_search_reads_category_then_keyword(fixture_json):
+    results = _results(fixture_json)
+    backend = _Backend({
+        "/website/snippet/autocomplete": lambda params: {"results": [] if params["options"].get("category")
+                                                          else results},
+    })
+    found = asyncio.run(backend.search("Strollers", f"{BASE_URL}/shop/category/gear-strollers-prams-2"))
+    assert [p.product for p in found] == ["Belecoo Baby Stroller", "Doona Car Seat Stroller"]
+    assert backend.asked == [("/website/snippet/autocomplete", "", "2"),
+                             ("/website/snippet/autocomplete", "stroller", None)]
+
+
+def test_search_falls_back_to_older_route_and_keeps_it(fixture_json):
+    backend = _Backend({
+        "/website/snippet/autocomplete": RuntimeError("404: Not Found"),
+        "/shop/products/autocomplete": {"products": _results(fixture_json)},
+    })
+    assert len(asyncio.run(backend.search("stroller", f"{BASE_URL}/shop"))) == 2
+    assert len(asyncio.run(backend.search("stroller", f"{BASE_URL}/shop"))) == 2
+    assert [route for route, _, _ in backend.asked] == [
+        "/website/snippet/autocomplete", "/shop/products/autocomplete", "/shop/products/autocomplete"]
@@ -0,0 +1,173 @@
+import asyncio
+import json
+from urllib.parse import parse_qsl, urlsplit
+
+from pagination import _PagedRequest, paginate_by_load_more_api
+
+LISTING = "https://shop.example.ae/api/products"
+
+
+def _to_url(value):
+    return f"https://shop.example.ae{value}" if value.startswith("/p/") else None
+
+
+def _listing(offset, count, repeats=0):
+    """A listing API page of ``count`` items from ``offset``.
+
+    The last ``repeats`` items are other colours of the first products, with
+    the same URL.
+    """
+    distinct = count - repeats
+    return {"hits": [{"url": f"/p/item-{offset + i % distinct}", "position": offset + i}
+                     for i in range(count)]}
+
+
+class _Response:
+    def __init__(self, data, status=200, headers=None):
+        self.data, self.status, self.headers = data, status, headers or {}
+        self.ok = 200 <= status < 300
+
+    async def json(self):
+        return self.data
+
+
+class _Request:
+    def __init__(self, url):
+        self.url, self.method, self.post_data = url, "GET", None
+
+    async def all_headers(self):
+        return {"accept": "application/json", ":authority": "shop.example.ae"}
+
+
+class _Captured:
+    def __init__(self, url, data):
+        self.request, self._data = _Request(url), data
+
+    async def json(self):
+        return self._data
+
+
+class _Info:
+    def __init__(self, response):
+        self.response = response
+
+    @property
+    async def value(self):
+        return self.response
+
+
+class _ExpectResponse:
+    def __init__(self, response):
+        self.info = _Info(response)
+
+    async def __aenter__(self):
+        return self.info
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Button:
+    async def is_visible(self):
+        return True
+
+    async def scroll_into_view_if_needed(self):
+        pass
+
+    async def click(self):
+        pass
+
+
+class _Api:
+    """Answers each replayed request with ``answer(offset)``, recording the offsets."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.offsets = []
+
+    async def fetch(self, url, **kwargs):
+        offset = int(dict(parse_qsl(urlsplit(url).query))["offset"])
+        self.offsets.append(offset)
+        return self.answer(offset, self.offsets.count(offset))
+
+
+class _Page:
+    def __init__(self, first_url, first_data, answer):
+        self.url = "https://shop.example.ae/strollers"
+        self.captured = _Captured(first_url, first_data)
+        self.context = type("Context", (), {"request": _Api(answer)})()
+
+    async def query_selector(self, selector):
+        return _Button()
+
+    def expect_response(self, predicate, timeout):
+        return _ExpectResponse(self.captured)
+
+
+class _Limiter:
+    def __init__(self):
+        self.penalized = []
+
+    async def acquire(self, url):
+        pass
+
+    def penalize(self, url, retry_after=None):
+        self.penalized.append((url, retry_after))
+
+
+def _run(page, limiter=None, **kwargs):
+    return asyncio.run(paginate_by_load_more_api(page, "button.more", _to_url,
+                                                 rate_limiter=limiter, concurrency=2, **kwargs))
+
+
+def test_offsets_advance_by_the_requests_size_parameter():
+    # 24 items a page, but the first page only links 20 distinct products
+    page = _Page(f"{LISTING}?offset=24&limit=24", _listing(24, 24, repeats=4),
+                 lambda offset, _: _Response(_listing(offset, 24 if offset < 96 else 0)))
+    urls = _run(page)
+    assert page.context.request.offsets == [48, 72, 96, 120]
+    assert len(urls) == 20 + 24 * 2
+
+
+def test_offsets_fall_back_to_the_first_pages_item_count():
+    page = _Page(f"{LISTING}?offset=10", _listing(10, 10, repeats=2),
+                 lambda offset, _: _Response(_listing(offset, 10 if offset < 30 else 0)))
+    urls = _run(page)
+    # 10 items on the page, though only 8 distinct URLs
+    assert page.context.request.offsets == [20, 30]
+    assert len(urls) == 8 + 10
+
+
+def test_a_429_is_retried_once_after_penalizing():
+    def answer(offset, attempt):
+        if offset == 20 and attempt == 1:
+            return _Response({}, status=429, headers={"retry-after": "2"})
+        return _Response(_listing(offset, 10 if offset < 40 else 0))
+
+    limiter = _Limiter()
+    page = _Page(f"{LISTING}?offset=10&size=10", _listing(10, 10), answer)
+    urls = _run(page, limiter)
+    assert limiter.penalized == [(f"{LISTING}?offset=20&size=10", 2.0)]
+    assert page.context.request.offsets.count(20) == 2
+    assert len(urls) == 30
+
+
+def test_a_failed_page_falls_back_to_clicking_instead_of_ending_the_list():
+    def answer(offset, attempt):
+        if offset == 30 or (offset == 20 and attempt <= 2):
+            return _Response({}, status=429 if offset == 20 else 500)
+        return _Response(_listing(offset, 10))
+
+    assert _run(_Page(f"{LISTING}?offset=10&size=10", _listing(10, 10), answer), _Limiter()) is None
+    # Without a limiter to back off on, a 429 isn't retried
+    page = _Page(f"{LISTING}?offset=10&size=10", _listing(10, 10), answer)
+    assert _run(page) is None
+    assert page.context.request.offsets.count(20) == 1
+
+
+def test_paged_request_in_a_json_body():
+    body = json.dumps({"requests": [{"indexName": "products", "params": "query=&page=0&hitsPerPage=48"}]})
+    paged = _PagedRequest("https://algolia.example/1/indexes/*/queries", "POST", {}, body)
+    assert paged.paging == ("json", "page", "page", 0, 48)
+    url, new_body = paged.for_step(2, 48)
+    assert json.loads(new_body)["requests"][0]["params"] == "query=&page=2&hitsPerPage=48"
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from rate_limiter import HostRateLimiter, TokenBucket, host_of, parse_retry_after
+
+
+def test_host_of_drops_www_and_case():
+    assert host_of("https://WWW.Mumzworld.com/en/x?y=1") == "mumzworld.com"
+    assert host_of("https://shop.example.ae/p") == "shop.example.ae"
+
+
+def test_parse_retry_after_seconds_and_dates():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(" 2.5 ") == 2.5
+    assert parse_retry_after("-4") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+    later = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 50 < parse_retry_after(format_datetime(later, usegmt=True)) <= 60
+    earlier = datetime.now(timezone.utc) - timedelta(seconds=60)
+    assert parse_retry_after(format_datetime(earlier, usegmt=True)) == 0.0
+
+
+def test_burst_is_free_then_requests_are_paced():
+    async def run():
+        bucket = TokenBucket(rate=20.0, burst=3)
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = time.monotonic() - started
+        await bucket.acquire()
+        return burst, time.monotonic() - started
+
+    burst, total = asyncio.run(run())
+    assert burst < 0.03
+    assert total >= 0.04  # the 4th request waits ~1/20 s for a token
+
+
+def test_penalize_halves_rate_down_to_the_floor():
+    bucket = TokenBucket(rate=1.0, burst=3)
+    bucket.penalize()
+    assert bucket.rate == 0.5
+    assert bucket.tokens == 0.0
+    for _ in range(10):
+        bucket.penalize()
+    assert bucket.rate == TokenBucket.MIN_RATE
+
+
+def test_penalize_with_retry_after_blocks_the_host():
+    bucket = TokenBucket(rate=1.0, burst=3)
+    bucket.penalize(retry_after=30)
+    assert bucket.blocked_until - time.monotonic() > 29
+
+
+def test_rate_recovers_after_a_quiet_spell():
+    bucket = TokenBucket(rate=1.0, burst=3)
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 0.25
+    bucket.last_penalty -= TokenBucket.RECOVERY_SECONDS + 1
+    bucket._refill(time.monotonic())
+    assert bucket.rate == 0.5
+    bucket._refill(time.monotonic())
+    assert bucket.rate == 0.5  # one doubling per quiet spell
+
+
+def test_hosts_are_limited_independently():
+    limiter = HostRateLimiter(rate=1.0, burst=1)
+    limiter.penalize("https://www.slow.ae/p/1")
+    assert limiter.current_rate("https://slow.ae/other") == 0.5
+    assert limiter.current_rate("https://fast.ae/") == 1.0
+
+
+def test_configure_keeps_a_bucket_already_in_use():
+    limiter = HostRateLimiter(rate=1.0, burst=1)
+    limiter.configure("https://shop.ae/", rate=5.0, burst=5)
+    assert limiter.current_rate("https://shop.ae/x") == 5.0
+    limiter.penalize("https://shop.ae/x")
+    limiter.configure("shop.ae", rate=5.0, burst=5)
+    assert limiter.current_rate("https://shop.ae/x") == 2.5
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from resource_blocker import ResourceBlocker
+
+
+def _request(url, resource_type="xhr"):
+    return SimpleNamespace(url=url, resource_type=resource_type)
+
+
+def test_blocks_heavy_resource_types():
+    blocker = ResourceBlocker()
+    assert blocker._block_reason(_request("https://cdn.shop.ae/a.jpg", "image")) == "image"
+    assert blocker._block_reason(_request("https://cdn.shop.ae/a.woff2", "font")) == "font"
+    assert blocker._block_reason(_request("https://cdn.shop.ae/app.js", "script")) == ""
+
+
+def test_blocks_tracker_hosts_and_their_subdomains_only():
+    blocker = ResourceBlocker()
+    assert blocker._block_reason(_request("https://www.google-analytics.com/g/collect")) == "tracker"
+    assert blocker._block_reason(_request("https://static.hotjar.com/c/hotjar.js", "script")) == "tracker"
+    assert blocker._block_reason(_request("https://notfacebook.com/x")) == ""
+    assert blocker._block_reason(_request("https://www.mumzworld.com/api/products")) == ""
+
+
+def test_retailer_allow_lists():
+    blocker = ResourceBlocker(allow_types=("image",), allow_hosts=("googletagmanager.com",))
+    assert blocker._block_reason(_request("https://cdn.shop.ae/a.jpg", "image")) == ""
+    assert blocker._block_reason(_request("https://www.googletagmanager.com/gtm.js", "script")) == ""
+    assert blocker._block_reason(_request("https://www.google-analytics.com/g/collect")) == "tracker"
+
+
+def test_summary():
+    blocker = ResourceBlocker()
+    assert blocker.summary() == "blocked 0 requests (none), loaded 0 (0.0 MB)"
+    blocker.blocked = {"tracker": 3, "image": 5}
+    blocker.allowed = 12
+    blocker.bytes_transferred = 3 * 1024 * 1024
+    assert blocker.summary() == "blocked 8 requests (5 image, 3 tracker), loaded 12 (3.0 MB)"
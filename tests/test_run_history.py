@@ -0,0 +1,59 @@
+import json
+
+from run_history import RunHistory
+
+
+def _timings(seconds, pages=0, urls=0):
+    return {"listing_seconds": 1.0, "detail_seconds": seconds - 1.0, "seconds": seconds,
+            "detail_pages": pages, "url_count": urls}
+
+
+def test_expected_seconds_is_the_smoothed_wall_time(tmp_path):
+    history = RunHistory(str(tmp_path))
+    assert history.expected_seconds("Mumzworld") is None
+    history.record("Mumzworld", _timings(100, pages=40, urls=50))
+    assert history.expected_seconds("Mumzworld") == 100
+    history.record("Mumzworld", _timings(50, pages=20, urls=50))
+    entry = json.load(open(history.path))["Mumzworld"]
+    assert entry == {"listing_seconds": 1.0, "detail_seconds": 74.0, "seconds": 75.0,
+                     "url_count": 50.0, "detail_pages": 30.0, "runs": 2}
+    assert history.expected_seconds("Mumzworld") == 75
+
+
+def test_backend_runs_are_not_charged_for_urls_they_never_loaded(tmp_path):
+    history = RunHistory(str(tmp_path))
+    history.record("Birds and Bees", _timings(200, pages=150, urls=150))
+    # Moved to products.json: 600 URLs, none of them rendered
+    history.record("Birds and Bees", _timings(6, pages=0, urls=600))
+    history.record("Birds and Bees", _timings(6, pages=0, urls=600))
+    assert history.expected_seconds("Birds and Bees") < 60
+
+
+def test_runs_that_never_listed_are_ignored(tmp_path):
+    history = RunHistory(str(tmp_path))
+    history.record("Ounass", {"seconds": 3.0})
+    history.record("Ounass", {"listing_seconds": 3.0})
+    assert history.expected_seconds("Ounass") is None
+
+
+def test_schedule_orders_longest_first_and_predicts_makespan(tmp_path):
+    history = RunHistory(str(tmp_path))
+    for name, seconds in (("A", 10), ("B", 100), ("C", 40)):
+        history.record(name, _timings(seconds))
+
+    order, makespan = history.schedule(["A", "B", "C", "New"], slots=2)
+    # "New" has no history and is assumed to take the median (40)
+    assert order == ["B", "C", "New", "A"]
+    assert makespan == 100  # B alone in one slot; C + New + A = 90 in the other
+
+
+def test_schedule_without_history_keeps_the_order(tmp_path):
+    history = RunHistory(str(tmp_path))
+    assert history.schedule(["X", "Y"], slots=4) == (["X", "Y"], None)
+
+
+def test_runs_without_a_detail_phase_record_zero_detail_seconds(tmp_path):
+    history = RunHistory(str(tmp_path))
+    history.record("Nanan", {"listing_seconds": 4.0, "seconds": 5.0, "url_count": 30})
+    entry = json.load(open(history.path))["Nanan"]
+    assert (entry["listing_seconds"], entry["detail_seconds"], entry["detail_pages"]) == (4.0, 0.0, 0)
@@ -0,0 +1,39 @@
+from backends import ShopifyBackend
+from backends.base import keyword_words, matches_keyword
+
+
+BACKEND = ShopifyBackend(None, "https://shop.example.ae/")
+
+
+def test_product_maps_cheapest_in_stock_variant(mapped):
+    libelle, _ = mapped(BACKEND, "shopify_products.json", "products")
+    assert libelle.product == "Cybex Libelle Compact Stroller"
+    assert libelle.brand == "Cybex"
+    assert libelle.link == "https://shop.example.ae/products/cybex-libelle-compact-stroller"
+    # The cheaper variant is sold out, and a zero price isn't a price
+    assert libelle.price == "AED 1,399.00"
+    assert libelle.weight == "5.9 kg"
+    assert libelle.image_url == "https://cdn.shopify.com/libelle-1.jpg"
+    assert libelle.description == "Ultra-compact travel stroller. Fits in overhead lockers One-hand fold"
+    assert libelle.features == "Fits in overhead lockers ; One-hand fold"
+    assert libelle.color == "Moon Black, Lava Grey"
+
+
+def test_product_falls_back_to_sold_out_variants(mapped):
+    _, hooks = mapped(BACKEND, "shopify_products.json", "products")
+    assert (hooks.brand, hooks.price, hooks.weight, hooks.image_url) == ("", "AED 45.00", "", "")
+
+
+def test_keyword_words_singularises():
+    assert keyword_words("Travel Strollers") == ["travel", "stroller"]
+    assert keyword_words("glass bus") == ["glass", "bus"]
+
+
+def test_matches_keyword_on_whole_words():
+    assert matches_keyword("car seat", "Maxi-Cosi Pebble 360 Car Seats")
+    assert matches_keyword("strollers", "Cybex Libelle", "stroller")
+    assert matches_keyword("box", "Storage Boxes")
+    assert not matches_keyword("car", "Gift card")
+    assert not matches_keyword("car", "Muslin scarf")
+    assert not matches_keyword("car seat", "Car mirror")
+    assert matches_keyword("", "anything")
@@ -0,0 +1,35 @@
+from backends import WooCommerceBackend
+
+
+BACKEND = WooCommerceBackend(None, "https://shop.example.ae")
+
+
+def test_product_mapping(mapped):
+    butterfly, _, _ = mapped(BACKEND, "woocommerce_products.json")
+    assert butterfly.product == "Bugaboo Butterfly – Black"
+    assert butterfly.link == "https://shop.example.ae/bugaboo-butterfly-black/"
+    assert butterfly.price == "AED 1899.00"
+    assert butterfly.image_url == "https://shop.example.ae/wp-content/uploads/butterfly.jpg"
+    assert butterfly.description == "Cabin-size stroller. One-second fold 7.3 kg"
+    assert butterfly.features == "One-second fold ; 7.3 kg"
+
+
+def test_brands_then_attributes(mapped):
+    butterfly, fan, _ = mapped(BACKEND, "woocommerce_products.json")
+    # The Brands taxonomy wins over a brand attribute
+    assert butterfly.brand == "Bugaboo & Co"
+    assert butterfly.color == "Black, Stormy Blue"
+    assert butterfly.frame_color == "Black"
+    assert butterfly.suitable_for == "6m – 22kg"
+    assert fan.brand == "Summer"
+
+
+def test_price_minor_units_and_travel_categories(mapped):
+    butterfly, fan, _ = mapped(BACKEND, "woocommerce_products.json")
+    assert fan.price == "KWD 4.500"
+    assert butterfly.travel_friendly == "Yes"
+    assert fan.travel_friendly == ""
+
+
+def test_product_without_permalink_is_dropped(mapped):
+    assert mapped(BACKEND, "woocommerce_products.json")[2] is None
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from work_queue import (COLLECTED, DONE, FAILED, LEASED, LISTING, PENDING, PRODUCTS,
+                        SQLiteWorkQueue)
+
+
+@pytest.fixture
+def wq(tmp_path):
+    return SQLiteWorkQueue(str(tmp_path / "queue" / "work.db"), lease_seconds=60)
+
+
+def _status(wq, item_id):
+    with wq._tx() as db:
+        return db.execute("SELECT status FROM work_items WHERE id = ?", (item_id,)).fetchone()[0]
+
+
+def _expire(wq, item_id):
+    with wq._tx() as db:
+        db.execute("UPDATE work_items SET lease_expires = ? WHERE id = ?", (time.time() - 1, item_id))
+
+
+def test_lease_hands_out_items_in_order_once(wq):
+    first = wq.enqueue("job", LISTING, "Mumzworld", {"keywords": ["strollers"]})
+    second = wq.enqueue("job", LISTING, "Ounass", {"keywords": ["strollers"]})
+
+    item = wq.lease("w1")
+    assert (item.id, item.retailer, item.status, item.attempts) == (first, "Mumzworld", LEASED, 1)
+    assert item.payload == {"keywords": ["strollers"]}
+    assert wq.lease("w2").id == second
+    assert wq.lease("w3") is None
+    assert wq.outstanding("job") == 2
+
+
+def test_complete_and_take_results_once(wq):
+    item_id = wq.enqueue("job", PRODUCTS, "Ounass", {"urls": ["u"], "batch": 0})
+    wq.lease("w1")
+    assert wq.complete(item_id, "w1", {"products": [], "scraped": ["u"]})
+
+    results = wq.take_results("job")
+    assert [(r.id, r.status, r.result) for r in results] == [(item_id, DONE, {"products": [], "scraped": ["u"]})]
+    assert _status(wq, item_id) == COLLECTED
+    assert wq.take_results("job") == []
+    assert wq.outstanding("job") == 0
+
+
+def test_expired_lease_goes_back_to_pending(wq):
+    item_id = wq.enqueue("job", LISTING, "Babyshop", {})
+    wq.lease("crashed")
+    _expire(wq, item_id)
+
+    assert wq.requeue_expired() == 1
+    assert _status(wq, item_id) == PENDING
+    again = wq.lease("w2")
+    assert (again.id, again.attempts) == (item_id, 2)
+    # The crashed worker no longer owns it
+    assert not wq.heartbeat(item_id, "crashed")
+    assert not wq.complete(item_id, "crashed", {})
+    assert wq.heartbeat(item_id, "w2")
+
+
+def test_expired_lease_gives_up_after_max_attempts(wq):
+    item_id = wq.enqueue("job", LISTING, "Babyshop", {})
+    for n in range(wq.MAX_ATTEMPTS):
+        wq.lease(f"w{n}")
+        _expire(wq, item_id)
+        wq.requeue_expired()
+    assert _status(wq, item_id) == FAILED
+    [result] = wq.take_results("job")
+    assert result.error == "lease expired"
+
+
+def test_heartbeat_keeps_a_lease_alive(wq):
+    item_id = wq.enqueue("job", LISTING, "Nanan", {})
+    wq.lease("w1")
+    _expire(wq, item_id)
+    assert wq.heartbeat(item_id, "w1")
+    assert wq.requeue_expired() == 0
+    assert _status(wq, item_id) == LEASED
+
+
+def test_fail_retries_then_gives_up(wq):
+    item_id = wq.enqueue("job", PRODUCTS, "Nanan", {})
+    for n in range(wq.MAX_ATTEMPTS - 1):
+        wq.lease("w")
+        assert wq.fail(item_id, "w", "boom")
+        assert _status(wq, item_id) == PENDING
+    wq.lease("w")
+    wq.fail(item_id, "w", "boom")
+    [result] = wq.take_results("job")
+    assert (result.status, result.error, result.attempts) == (FAILED, "boom", wq.MAX_ATTEMPTS)
+
+
+def test_cancel_drops_only_pending_work(wq):
+    leased = wq.enqueue("job", LISTING, "Mumzworld", {})
+    wq.lease("w1")
+    wq.enqueue("job", PRODUCTS, "Mumzworld", {})
+    wq.enqueue("job", PRODUCTS, "Ounass", {})
+    other_job = wq.enqueue("other", LISTING, "Ounass", {})
+
+    assert wq.cancel("job", "Ounass") == 1
+    assert wq.cancel("job") == 1
+    assert _status(wq, leased) == LEASED  # in flight; its result still comes back
+    assert wq.outstanding("job") == 1
+    assert _status(wq, other_job) == PENDING
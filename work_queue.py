@@ -0,0 +1,207 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import List, Optional
+
+LISTING = "listing"
+PRODUCTS = "products"
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+COLLECTED = "collected"  # result already picked up by the coordinator
+
+
+@dataclass
+class WorkItem:
+    id: int
+    job_id: str
+    kind: str
+    retailer: str
+    payload: dict
+    status: str = PENDING
+    attempts: int = 0
+    result: Optional[dict] = None
+    error: str = ""
+
+
+class SQLiteWorkQueue:
+    """Lease-based work queue in a single SQLite file.
+
+    Put the file on a volume shared by the coordinator and the worker
+    containers. Workers lease an item, heartbeat while they work on it and
+    complete or fail it; a lease that stops being renewed (worker crashed,
+    container killed) expires and the item goes back to pending for someone
+    else. Items that fail MAX_ATTEMPTS times are given up on.
+    """
+
+    LEASE_SECONDS = 120.0
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, path: str, lease_seconds: Optional[float] = None):
+        self.path = path
+        if lease_seconds:
+            self.LEASE_SECONDS = lease_seconds
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._tx() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS work_items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    retailer TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS work_items_status ON work_items (status, id)")
+            db.execute("CREATE INDEX IF NOT EXISTS work_items_job ON work_items (job_id, status)")
+
+    @contextmanager
+    def _tx(self):
+        # One short-lived connection per call keeps this safe to use from
+        # any thread; BEGIN IMMEDIATE serialises writers across processes.
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _row_to_item(row) -> WorkItem:
+        return WorkItem(
+            id=row[0], job_id=row[1], kind=row[2], retailer=row[3],
+            payload=json.loads(row[4]), status=row[5], attempts=row[6],
+            result=json.loads(row[7]) if row[7] else None, error=row[8] or "",
+        )
+
+    _COLUMNS = "id, job_id, kind, retailer, payload, status, attempts, result, error"
+
+    # ── Coordinator side ──
+
+    def enqueue(self, job_id: str, kind: str, retailer: str, payload: dict) -> int:
+        with self._tx() as db:
+            cur = db.execute(
+                "INSERT INTO work_items (job_id, kind, retailer, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, retailer, json.dumps(payload), time.time()),
+            )
+            return cur.lastrowid
+
+    def requeue_expired(self) -> int:
+        """Return abandoned leases to pending (or give up after MAX_ATTEMPTS)."""
+        now = time.time()
+        with self._tx() as db:
+            db.execute(
+                "UPDATE work_items SET status = ?, error = 'lease expired', updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, now, LEASED, now, self.MAX_ATTEMPTS),
+            )
+            cur = db.execute(
+                "UPDATE work_items SET status = ?, worker = NULL, updated_at = ? "
+                "WHERE status = ? AND lease_expires < ?",
+                (PENDING, now, LEASED, now),
+            )
+            return cur.rowcount
+
+    def take_results(self, job_id: str) -> List[WorkItem]:
+        """Finished and failed items not yet seen by the coordinator."""
+        with self._tx() as db:
+            rows = db.execute(
+                f"SELECT {self._COLUMNS} FROM work_items "
+                "WHERE job_id = ? AND status IN (?, ?) ORDER BY id",
+                (job_id, DONE, FAILED),
+            ).fetchall()
+            if rows:
+                db.executemany(
+                    "UPDATE work_items SET status = ? WHERE id = ?",
+                    [(COLLECTED, row[0]) for row in rows],
+                )
+        return [self._row_to_item(row) for row in rows]
+
+    def cancel(self, job_id: str, retailer: Optional[str] = None) -> int:
+        """Drop pending work for a job (or one retailer in it)."""
+        query = "DELETE FROM work_items WHERE job_id = ? AND status = ?"
+        params = [job_id, PENDING]
+        if retailer is not None:
+            query += " AND retailer = ?"
+            params.append(retailer)
+        with self._tx() as db:
+            return db.execute(query, params).rowcount
+
+    def outstanding(self, job_id: str) -> int:
+        with self._tx() as db:
+            return db.execute(
+                "SELECT COUNT(*) FROM work_items WHERE job_id = ? AND status IN (?, ?)",
+                (job_id, PENDING, LEASED),
+            ).fetchone()[0]
+
+    # ── Worker side ──
+
+    def lease(self, worker_id: str) -> Optional[WorkItem]:
+        now = time.time()
+        with self._tx() as db:
+            row = db.execute(
+                f"SELECT {self._COLUMNS} FROM work_items WHERE status = ? ORDER BY id LIMIT 1",
+                (PENDING,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE work_items SET status = ?, worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + self.LEASE_SECONDS, now, row[0]),
+            )
+        item = self._row_to_item(row)
+        item.status = LEASED
+        item.attempts += 1
+        return item
+
+    def heartbeat(self, item_id: int, worker_id: str) -> bool:
+        """Extend a lease; False means it expired and was handed to someone else."""
+        now = time.time()
+        with self._tx() as db:
+            cur = db.execute(
+                "UPDATE work_items SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (now + self.LEASE_SECONDS, now, item_id, worker_id, LEASED),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, item_id: int, worker_id: str, result: dict) -> bool:
+        with self._tx() as db:
+            cur = db.execute(
+                "UPDATE work_items SET status = ?, result = ?, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (DONE, json.dumps(result), time.time(), item_id, worker_id, LEASED),
+            )
+            return cur.rowcount == 1
+
+    def fail(self, item_id: int, worker_id: str, error: str) -> bool:
+        with self._tx() as db:
+            cur = db.execute(
+                "UPDATE work_items SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "worker = NULL, error = ?, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (self.MAX_ATTEMPTS, FAILED, PENDING, error, time.time(),
+                 item_id, worker_id, LEASED),
+            )
+            return cur.rowcount == 1